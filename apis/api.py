@@ -4,15 +4,26 @@ Unified Flask REST API for HackCC - combines transfer, internship, and mentorshi
 Provides endpoints to query college transfers, internships, and mentorship opportunities
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+from concurrent.futures import as_completed
 from flask_cors import CORS
-from combined_api.scraper import get_degree_information
-from combined_api.fetch_and_clone_internships import InternshipFetcher
+from combined_api.transfer_pipeline import check_transfer as run_transfer_check
+from combined_api.transfer_pipeline import BATCH_TIMEOUT, check_transfer_batch, pipeline as transfer_pipeline
+from combined_api.ingestion import IngestionPipeline
+from combined_api.dataset_store import DatasetStore
+from combined_api.query_engine import build_internship_query_engine
+from combined_api.aggregates import build_internship_aggregates, build_mentorship_aggregates
+from combined_api.typeahead import TypeaheadIndex
+from combined_api.http_client import client as http_client
+from combined_api.browser_pool import pool_stats
+from combined_api.articulation_store import ArticulationStore, DEFAULT_MAJOR
+from combined_api.jobs import runner as job_runner
 from mentorship_scraper import MentorshipScraper
 from datetime import datetime
 import json
 import os
 import sys
+import time
 
 app = Flask(__name__)
 CORS(app)
@@ -30,39 +41,43 @@ with open(COLLEGES_FILE, 'r') as f:
 COLLEGES = colleges_data.get('from_institution', []) + colleges_data.get('transfer_institution', [])
 COLLEGES = list(set(COLLEGES))
 COLLEGES.sort()
+COLLEGE_INDEX = TypeaheadIndex(COLLEGES)
+
+
+MAX_BATCH_CHECKS = 50
+
+INTERNSHIPS = DatasetStore(INTERNSHIPS_FILE, builders={
+    'query': build_internship_query_engine,
+    'aggregates': build_internship_aggregates
+})
+STEM_INTERNSHIPS = DatasetStore(STEM_INTERNSHIPS_FILE)
+ARTICULATIONS = ArticulationStore()
+MENTORSHIPS = DatasetStore(MENTORSHIP_FILE, builders={
+    'aggregates': build_mentorship_aggregates
+})
 
 
 def load_internships():
-    if os.path.exists(INTERNSHIPS_FILE):
-        try:
-            with open(INTERNSHIPS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading {INTERNSHIPS_FILE}: {e}")
-            return None
-    return None
+    return INTERNSHIPS.get()
 
 
 def load_stem_internships():
-    if os.path.exists(STEM_INTERNSHIPS_FILE):
-        try:
-            with open(STEM_INTERNSHIPS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading {STEM_INTERNSHIPS_FILE}: {e}")
-            return None
-    return None
+    return STEM_INTERNSHIPS.get()
 
 
 def load_mentorships():
-    if os.path.exists(MENTORSHIP_FILE):
-        try:
-            with open(MENTORSHIP_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading {MENTORSHIP_FILE}: {e}")
-            return None
-    return None
+    return MENTORSHIPS.get()
+
+
+def aggregate_response(snapshot, key):
+    """Serve a precomputed aggregate, serialized once per snapshot and validated by ETag"""
+    bodies = snapshot.indexes.setdefault('responses', {})
+    if key not in bodies:
+        bodies[key] = app.json.dumps(snapshot.indexes['aggregates'][key]) + '\n'
+
+    response = Response(bodies[key], mimetype='application/json')
+    response.set_etag(f"{snapshot.etag}-{key}")
+    return response.make_conditional(request)
 
 
 @app.route('/', methods=['GET'])
@@ -76,7 +91,11 @@ def home():
                 'base': '/api/transfer',
                 'endpoints': {
                     'POST /api/transfer/check': 'Check transfer compatibility between schools',
-                    'GET /api/transfer/schools': 'Search/list available colleges'
+                    'POST /api/transfer/check/batch': 'Check one or more source schools against many targets at once',
+                    'GET /api/transfer/schools': 'Search/list available colleges',
+                    'GET /api/transfer/courses': 'Scraped course-to-course articulations',
+                    'GET /api/transfer/overlap': 'Courses at one school that articulate to every target campus',
+                    'GET /api/transfer/alternatives': 'Other schools covering courses with no articulation'
                 }
             },
             'internships': {
@@ -89,7 +108,7 @@ def home():
                     'GET /api/internships/locations': 'Get all locations',
                     'GET /api/internships/categories': 'Get all categories',
                     'GET /api/stem-internships': 'Get STEM-specific internships',
-                    'POST /api/internships/refresh': 'Refresh internship data'
+                    'POST /api/internships/refresh': 'Start a background refresh of internship data (202 + job)'
                 }
             },
             'mentorships': {
@@ -102,7 +121,14 @@ def home():
                     'GET /api/mentorships/majors': 'Get list of all majors',
                     'GET /api/mentorships/free': 'Get only free mentorship programs',
                     'GET /api/mentorships/community-college': 'Get community college friendly programs',
-                    'POST /api/mentorships/refresh': 'Refresh mentorship data'
+                    'POST /api/mentorships/refresh': 'Start a background refresh of mentorship data (202 + job)'
+                }
+            },
+            'operations': {
+                'base': '/api',
+                'endpoints': {
+                    'GET /api/metrics': 'Upstream request counts and latency per host, browser pool usage',
+                    'GET /api/jobs/<id>': 'Status, progress and timings of a background refresh job'
                 }
             }
         },
@@ -111,11 +137,40 @@ def home():
                 'from_school': 'Starting school name (required)',
                 'to_school': 'Destination school name (required)'
             },
+            '/api/transfer/check/batch': {
+                'from_school': 'Starting school name (or from_schools: list, for a full matrix)',
+                'to_schools': 'List of destination school names (required)',
+                'stream': 'If true, stream one NDJSON line per pair as each check finishes'
+            },
             '/api/transfer/schools': {
-                'q': 'Search query for college names'
+                'q': 'Search query for college names',
+                'limit': 'Maximum number of matches (default 10)'
+            },
+            '/api/transfer/courses': {
+                'from_school': 'Community college name',
+                'to_school': 'UC campus name',
+                'uc_course': 'UC course code (e.g., "COM SCI 31")',
+                'cc_course': 'Community college course code',
+                'major': f'Major (default "{DEFAULT_MAJOR}")',
+                'year': 'Academic year (default: latest scraped)',
+                'limit': 'Limit results'
+            },
+            '/api/transfer/overlap': {
+                'from_school': 'Community college name (required)',
+                'to_school': 'UC campus name; repeat the parameter for several (required)',
+                'major': f'Major (default "{DEFAULT_MAJOR}")',
+                'year': 'Academic year (default: latest scraped)'
+            },
+            '/api/transfer/alternatives': {
+                'from_school': 'Community college name (required)',
+                'to_school': 'UC campus name (required)',
+                'uc_course': 'Only this UC course',
+                'major': f'Major (default "{DEFAULT_MAJOR}")',
+                'year': 'Academic year (default: latest scraped)',
+                'limit': 'Maximum alternatives per course'
             },
             '/api/internships': {
-                'category': 'Filter by category (FAANG+, Quant, Other)',
+                'category': 'Filter by category (FAANG+, Quant, STEM, Other)',
                 'company': 'Filter by company name',
                 'location': 'Filter by location',
                 'limit': 'Limit results',
@@ -145,6 +200,11 @@ def health():
     return jsonify({'status': 'ok'}), 200
 
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    return jsonify({'upstream': http_client.metrics(), 'browser_pool': pool_stats()}), 200
+
+
 @app.route('/api/transfer/check', methods=['POST'])
 def check_transfer():
     try:
@@ -157,23 +217,91 @@ def check_transfer():
                 'error': 'Missing required fields: from_school and to_school'
             }), 400
 
-        result = get_degree_information(from_school, to_school)
+        result = run_transfer_check(from_school, to_school)
         return jsonify(result), 200 if not result.get('error') else 400
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def clean_school_list(values):
+    if isinstance(values, str):
+        values = [values]
+    return list(dict.fromkeys(v.strip() for v in values or [] if isinstance(v, str) and v.strip()))
+
+
+@app.route('/api/transfer/check/batch', methods=['POST'])
+def check_transfer_batch_route():
+    try:
+        data = request.get_json() or {}
+        from_schools = clean_school_list(data.get('from_schools') or data.get('from_school'))
+        to_schools = clean_school_list(data.get('to_schools') or data.get('to_school'))
+
+        if not from_schools or not to_schools:
+            return jsonify({
+                'error': 'Missing required fields: from_school(s) and to_schools'
+            }), 400
+
+        pairs = [(f, t) for f in from_schools for t in to_schools]
+        if len(pairs) > MAX_BATCH_CHECKS:
+            return jsonify({
+                'error': f'Too many school pairs ({len(pairs)}); maximum is {MAX_BATCH_CHECKS}'
+            }), 400
+
+        if data.get('stream'):
+            deadline = time.monotonic() + BATCH_TIMEOUT
+            futures = transfer_pipeline.submit_batch(pairs)
+            index_of = {future: i for i, future in enumerate(futures)}
+
+            def line(i, result):
+                return json.dumps({
+                    'index': i,
+                    'from_school': pairs[i][0],
+                    'to_school': pairs[i][1],
+                    'result': result
+                }) + '\n'
+
+            def generate():
+                pending = set(futures)
+                try:
+                    for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+                        pending.discard(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {'error': str(e)}
+                        yield line(index_of[future], result)
+                except TimeoutError:
+                    # One line per check that missed the batch deadline, in input order
+                    for future in sorted(pending, key=index_of.get):
+                        future.cancel()
+                        yield line(index_of[future], {'error': f'Transfer check timed out after {BATCH_TIMEOUT}s'})
+
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        results = check_transfer_batch(pairs)
+        return jsonify({
+            'from_schools': from_schools,
+            'to_schools': to_schools,
+            'total_count': len(results),
+            'found_count': len([r for r in results if not r.get('error')]),
+            'results': results
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/transfer/schools', methods=['GET'])
 def search_schools():
     try:
         query = request.args.get('q', '').lower().strip()
+        limit = request.args.get('limit', type=int, default=10)
 
         if not query:
             return jsonify({'schools': COLLEGES}), 200
 
-        matches = [c for c in COLLEGES if query in c.lower()]
-        matches = matches[:10]
+        matches = COLLEGE_INDEX.search(query, limit=limit)
 
         return jsonify({'schools': matches}), 200
 
@@ -181,14 +309,107 @@ def search_schools():
         return jsonify({'error': str(e)}), 500
 
 
+def articulation_args():
+    return {
+        'major': request.args.get('major', '').strip() or DEFAULT_MAJOR,
+        'academic_year': request.args.get('year', '').strip() or None
+    }
+
+
+@app.route('/api/transfer/courses', methods=['GET'])
+def get_transfer_courses():
+    try:
+        from_school = request.args.get('from_school', '').strip()
+        to_school = request.args.get('to_school', '').strip()
+        uc_course = request.args.get('uc_course', '').strip()
+        cc_course = request.args.get('cc_course', '').strip()
+        limit = request.args.get('limit', type=int)
+
+        if not (from_school or to_school or uc_course or cc_course):
+            return jsonify({
+                'error': 'Provide at least one of: from_school, to_school, uc_course, cc_course'
+            }), 400
+
+        courses = ARTICULATIONS.courses(
+            cc=from_school, uc=to_school, uc_course=uc_course, cc_course=cc_course,
+            limit=limit, **articulation_args()
+        )
+
+        return jsonify({
+            'total_count': len(courses),
+            'courses': courses
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/transfer/overlap', methods=['GET'])
+def get_transfer_overlap():
+    try:
+        from_school = request.args.get('from_school', '').strip()
+        # Campus names contain commas ("University of California, Berkeley"), so
+        # several campuses are passed as repeated to_school parameters
+        to_schools = clean_school_list(request.args.getlist('to_school'))
+
+        if not from_school or not to_schools:
+            return jsonify({
+                'error': 'Missing required fields: from_school and to_school'
+            }), 400
+
+        args = articulation_args()
+        stored = ARTICULATIONS.stored_campuses(from_school, to_schools, **args)
+        missing = [uc for uc in to_schools if uc not in stored]
+        courses = ARTICULATIONS.overlap(from_school, to_schools, **args) if not missing else []
+
+        return jsonify({
+            'from_school': from_school,
+            'to_schools': to_schools,
+            'missing_agreements': missing,
+            'total_count': len(courses),
+            'courses': courses
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/transfer/alternatives', methods=['GET'])
+def get_transfer_alternatives():
+    try:
+        from_school = request.args.get('from_school', '').strip()
+        to_school = request.args.get('to_school', '').strip()
+        uc_course = request.args.get('uc_course', '').strip()
+        limit = request.args.get('limit', type=int)
+
+        if not from_school or not to_school:
+            return jsonify({
+                'error': 'Missing required fields: from_school and to_school'
+            }), 400
+
+        gaps = ARTICULATIONS.alternatives(
+            from_school, to_school, uc_course=uc_course, limit=limit, **articulation_args()
+        )
+
+        return jsonify({
+            'from_school': from_school,
+            'to_school': to_school,
+            'total_count': len(gaps),
+            'gaps': gaps
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/internships', methods=['GET'])
 def get_internships():
-    data = load_internships()
+    snapshot = INTERNSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No internship data available'}), 404
 
-    internships = data.get('internships', [])
+    data = snapshot.data
 
     category = request.args.get('category', '').strip()
     company = request.args.get('company', '').strip().lower()
@@ -196,14 +417,7 @@ def get_internships():
     limit = request.args.get('limit', type=int)
     offset = request.args.get('offset', type=int, default=0)
 
-    if category:
-        internships = [i for i in internships if i.get('category', '').lower() == category.lower()]
-
-    if company:
-        internships = [i for i in internships if company in i.get('company', '').lower()]
-
-    if location:
-        internships = [i for i in internships if location in i.get('location', '').lower()]
+    internships = snapshot.indexes['query'].query(category, company, location)
 
     total_count = len(internships)
     internships = internships[offset:]
@@ -236,85 +450,42 @@ def get_internship_by_index(index):
 
 @app.route('/api/internships/stats', methods=['GET'])
 def get_internship_stats():
-    data = load_internships()
+    snapshot = INTERNSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No internship data available'}), 404
 
-    internships = data.get('internships', [])
-
-    categories = {}
-    companies = {}
-    locations = {}
-
-    for internship in internships:
-        cat = internship.get('category', 'Unknown')
-        categories[cat] = categories.get(cat, 0) + 1
-
-        comp = internship.get('company', 'Unknown')
-        companies[comp] = companies.get(comp, 0) + 1
-
-        loc = internship.get('location', 'Unknown')
-        locations[loc] = locations.get(loc, 0) + 1
-
-    top_companies = sorted(companies.items(), key=lambda x: x[1], reverse=True)[:10]
-    top_locations = sorted(locations.items(), key=lambda x: x[1], reverse=True)[:10]
-
-    return jsonify({
-        'total_internships': len(internships),
-        'by_category': categories,
-        'top_companies': dict(top_companies),
-        'top_locations': dict(top_locations),
-        'metadata': data.get('metadata', {})
-    })
+    return aggregate_response(snapshot, 'stats')
 
 
 @app.route('/api/internships/companies', methods=['GET'])
 def get_companies():
-    data = load_internships()
+    snapshot = INTERNSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No internship data available'}), 404
 
-    internships = data.get('internships', [])
-    companies = sorted(list(set(i.get('company', '') for i in internships if i.get('company'))))
-
-    return jsonify({
-        'count': len(companies),
-        'companies': companies
-    })
+    return aggregate_response(snapshot, 'companies')
 
 
 @app.route('/api/internships/locations', methods=['GET'])
 def get_locations():
-    data = load_internships()
+    snapshot = INTERNSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No internship data available'}), 404
 
-    internships = data.get('internships', [])
-    locations = sorted(list(set(i.get('location', '') for i in internships if i.get('location'))))
-
-    return jsonify({
-        'count': len(locations),
-        'locations': locations
-    })
+    return aggregate_response(snapshot, 'locations')
 
 
 @app.route('/api/internships/categories', methods=['GET'])
 def get_categories():
-    data = load_internships()
+    snapshot = INTERNSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No internship data available'}), 404
 
-    internships = data.get('internships', [])
-    categories = sorted(list(set(i.get('category', '') for i in internships if i.get('category'))))
-
-    return jsonify({
-        'count': len(categories),
-        'categories': categories
-    })
+    return aggregate_response(snapshot, 'categories')
 
 
 @app.route('/api/stem-internships', methods=['GET'])
@@ -352,29 +523,69 @@ def get_stem_internships():
     })
 
 
-@app.route('/api/internships/refresh', methods=['POST'])
-def refresh_internship_data():
-    try:
-        fetcher = InternshipFetcher()
+def run_internship_refresh(job):
+    pipeline = IngestionPipeline(output_file=INTERNSHIPS_FILE)
 
-        if not fetcher.clone_or_update_repo():
-            return jsonify({'error': 'Failed to update repository'}), 500
+    with job.step('Fetching sources'):
+        data = pipeline.run(progress=job.update)
+        sources = data['metadata']['sources']
+        if not any(report['status'] == 'ok' for report in sources.values()):
+            raise RuntimeError('Every internship source failed')
 
-        if not fetcher.fetch_internships():
-            return jsonify({'error': 'Failed to fetch internships'}), 500
+    with job.step('Saving and publishing'):
+        pipeline.save(data)
+        INTERNSHIPS.reload()
 
-        if not fetcher.save_to_json():
-            return jsonify({'error': 'Failed to save internships'}), 500
+    return {
+        'message': 'Internship data refreshed successfully',
+        'total_internships': data['metadata']['total_count'],
+        'sources': sources,
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
 
-        return jsonify({
-            'success': True,
-            'message': 'Internship data refreshed successfully',
-            'total_internships': len(fetcher.internships),
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
 
-    except Exception as e:
-        return jsonify({'error': f'Failed to refresh data: {str(e)}'}), 500
+def run_mentorship_refresh(job):
+    scraper = MentorshipScraper()
+
+    with job.step('Collecting programs'):
+        scraper.add_tech_mentorship_programs()
+        scraper.add_general_mentorship_programs()
+        scraper.add_community_college_specific()
+
+    with job.step('Saving and publishing'):
+        scraper.save_to_json(MENTORSHIP_FILE)
+        MENTORSHIPS.reload()
+
+    return {
+        'message': 'Mentorship data refreshed successfully',
+        'total_programs': len(scraper.mentorships),
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+
+def start_job(kind, fn):
+    """
+    Queue a background job and answer 202 with its status URL
+    A refresh of the same kind that is already running is joined instead of restarted;
+    ?wait=<seconds> blocks until the job finishes (up to that long) and returns 200
+    """
+    job, created = job_runner.submit(kind, fn)
+    wait = request.args.get('wait', type=float)
+    if wait and job.done.wait(wait):
+        payload = job.to_dict()
+        return jsonify(payload), 200 if job.status == 'succeeded' else 500
+
+    payload = job.to_dict()
+    payload['deduplicated'] = not created
+    payload['status_url'] = f'/api/jobs/{job.id}'
+    response = jsonify(payload)
+    response.headers['Location'] = payload['status_url']
+    return response, 202
+
+
+@app.route('/api/internships/refresh', methods=['POST'])
+def refresh_internship_data():
+    return start_job('internships_refresh', run_internship_refresh)
 
 
 @app.route('/api/mentorships', methods=['GET'])
@@ -444,80 +655,32 @@ def get_mentorship_by_index(index):
 
 @app.route('/api/mentorships/stats', methods=['GET'])
 def get_mentorship_stats():
-    data = load_mentorships()
+    snapshot = MENTORSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No mentorship data available'}), 404
 
-    mentorships = data.get('mentorships', [])
-
-    organizations = {}
-    target_audiences = {}
-    formats = {}
-    costs = {}
-
-    for mentorship in mentorships:
-        org = mentorship.get('organization', 'Unknown')
-        organizations[org] = organizations.get(org, 0) + 1
-
-        audience = mentorship.get('target_audience', 'Unknown')
-        target_audiences[audience] = target_audiences.get(audience, 0) + 1
-
-        fmt = mentorship.get('format', 'Unknown')
-        formats[fmt] = formats.get(fmt, 0) + 1
-
-        cost = mentorship.get('cost', 'Unknown')
-        costs[cost] = costs.get(cost, 0) + 1
-
-    top_organizations = sorted(organizations.items(), key=lambda x: x[1], reverse=True)[:10]
-
-    return jsonify({
-        'total_programs': len(mentorships),
-        'by_organization': dict(top_organizations),
-        'by_format': formats,
-        'by_cost': costs,
-        'categories': data.get('categories', {}),
-        'last_updated': data.get('last_updated', '')
-    })
+    return aggregate_response(snapshot, 'stats')
 
 
 @app.route('/api/mentorships/organizations', methods=['GET'])
 def get_mentorship_organizations():
-    data = load_mentorships()
+    snapshot = MENTORSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No mentorship data available'}), 404
 
-    mentorships = data.get('mentorships', [])
-    organizations = sorted(list(set(m.get('organization', '') for m in mentorships if m.get('organization'))))
-
-    return jsonify({
-        'count': len(organizations),
-        'organizations': organizations
-    })
+    return aggregate_response(snapshot, 'organizations')
 
 
 @app.route('/api/mentorships/majors', methods=['GET'])
 def get_mentorship_majors():
-    data = load_mentorships()
+    snapshot = MENTORSHIPS.snapshot()
 
-    if not data:
+    if not snapshot or not snapshot.data:
         return jsonify({'error': 'No mentorship data available'}), 404
 
-    mentorships = data.get('mentorships', [])
-    majors_set = set()
-
-    for m in mentorships:
-        majors_list = m.get('majors', [])
-        if isinstance(majors_list, list):
-            majors_set.update(majors_list)
-
-    majors = sorted(list(majors_set))
-
-    return jsonify({
-        'count': len(majors),
-        'majors': majors
-    })
+    return aggregate_response(snapshot, 'majors')
 
 
 @app.route('/api/mentorships/free', methods=['GET'])
@@ -554,24 +717,15 @@ def get_community_college_mentorships():
 
 @app.route('/api/mentorships/refresh', methods=['POST'])
 def refresh_mentorship_data():
-    try:
-        scraper = MentorshipScraper()
-
-        scraper.add_tech_mentorship_programs()
-        scraper.add_general_mentorship_programs()
-        scraper.add_community_college_specific()
+    return start_job('mentorships_refresh', run_mentorship_refresh)
 
-        scraper.save_to_json(MENTORSHIP_FILE)
 
-        return jsonify({
-            'success': True,
-            'message': 'Mentorship data refreshed successfully',
-            'total_programs': len(scraper.mentorships),
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
-
-    except Exception as e:
-        return jsonify({'error': f'Failed to refresh data: {str(e)}'}), 500
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = job_runner.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict()), 200
 
 
 @app.errorhandler(404)
@@ -1,3 +1,9 @@
-from .api import app
-
 __all__ = ['app']
+
+
+def __getattr__(name):
+    # Import the Flask app lazily so scraper modules can be used without Flask
+    if name == 'app':
+        from .api import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Materialized aggregates for the stats and facet endpoints
+Each builder runs once per dataset snapshot and returns the response payloads
+keyed by endpoint name
+"""
+
+
+def count_by(records, field, default='Unknown'):
+    counts = {}
+    for record in records:
+        value = record.get(field, default)
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def top_n(counts, n=10):
+    return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True)[:n])
+
+
+def distinct(records, field):
+    return sorted(set(r.get(field, '') for r in records if r.get(field)))
+
+
+def build_internship_aggregates(data):
+    """DatasetStore builder for the internships dataset"""
+    internships = data.get('internships', [])
+    companies = distinct(internships, 'company')
+    locations = distinct(internships, 'location')
+    categories = distinct(internships, 'category')
+
+    return {
+        'stats': {
+            'total_internships': len(internships),
+            'by_category': count_by(internships, 'category'),
+            'top_companies': top_n(count_by(internships, 'company')),
+            'top_locations': top_n(count_by(internships, 'location')),
+            'metadata': data.get('metadata', {})
+        },
+        'companies': {'count': len(companies), 'companies': companies},
+        'locations': {'count': len(locations), 'locations': locations},
+        'categories': {'count': len(categories), 'categories': categories}
+    }
+
+
+def build_mentorship_aggregates(data):
+    """DatasetStore builder for the mentorships dataset"""
+    mentorships = data.get('mentorships', [])
+    organizations = distinct(mentorships, 'organization')
+
+    majors_set = set()
+    for m in mentorships:
+        majors_list = m.get('majors', [])
+        if isinstance(majors_list, list):
+            majors_set.update(majors_list)
+    majors = sorted(majors_set)
+
+    return {
+        'stats': {
+            'total_programs': len(mentorships),
+            'by_organization': top_n(count_by(mentorships, 'organization')),
+            'by_format': count_by(mentorships, 'format'),
+            'by_cost': count_by(mentorships, 'cost'),
+            'categories': data.get('categories', {}),
+            'last_updated': data.get('last_updated', '')
+        },
+        'organizations': {'count': len(organizations), 'organizations': organizations},
+        'majors': {'count': len(majors), 'majors': majors}
+    }
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Cache of assist.org agreement lists per receiving institution
+Entries are indexed by sending institution ID, served fresh within the TTL,
+served stale while a background refresh runs, and concurrent fetches of the
+same institution are coalesced into a single request
+"""
+
+import threading
+import time
+
+from .http_client import client as http_client
+from .institutions import ASSIST_BASE_URL
+
+AGREEMENTS_URL = ASSIST_BASE_URL + '/api/institutions/{to_id}/agreements'
+AGREEMENTS_TTL = 6 * 60 * 60
+AGREEMENTS_STALE_TTL = 7 * 24 * 60 * 60
+
+
+class AgreementsEntry:
+    """Agreements of one receiving institution, grouped by sending institution"""
+
+    def __init__(self, agreements):
+        self.fetched_at = time.time()
+        self.total = len(agreements)
+        self.by_sender = {}
+        for agreement in agreements:
+            self.by_sender.setdefault(agreement.get('institutionParentId'), []).append(agreement)
+
+    @property
+    def age(self):
+        return time.time() - self.fetched_at
+
+
+class _Flight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.entry = None
+        self.error = None
+
+
+class AgreementsCache:
+    """
+    Keyed cache of /api/institutions/{id}/agreements responses
+
+    Args:
+        url_template: Agreements endpoint with a {to_id} placeholder
+        ttl: Seconds an entry is served without revalidation
+        stale_ttl: Seconds an expired entry may still be served while it refreshes
+    """
+
+    def __init__(self, url_template=AGREEMENTS_URL, ttl=AGREEMENTS_TTL, stale_ttl=AGREEMENTS_STALE_TTL):
+        self.url_template = url_template
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, to_id):
+        return http_client.get_json(self.url_template.format(to_id=to_id), timeout=10)
+
+    def _load(self, to_id):
+        with self._lock:
+            flight = self._inflight.get(to_id)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[to_id] = flight
+
+        if not leader:
+            flight.event.wait()
+            if flight.error:
+                raise flight.error
+            return flight.entry
+
+        try:
+            flight.entry = AgreementsEntry(self.fetch(to_id))
+            self._entries[to_id] = flight.entry
+            return flight.entry
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(to_id, None)
+            flight.event.set()
+
+    def _revalidate(self, to_id):
+        with self._lock:
+            if to_id in self._inflight:
+                return
+
+        def run():
+            try:
+                self._load(to_id)
+            except Exception as e:
+                print(f"[!] Background agreements refresh for {to_id} failed: {e}")
+
+        threading.Thread(target=run, name=f'agreements-{to_id}', daemon=True).start()
+
+    def get(self, to_id):
+        """Return the AgreementsEntry for a receiving institution"""
+        entry = self._entries.get(to_id)
+        if entry is not None:
+            if entry.age <= self.ttl:
+                return entry
+            if entry.age <= self.ttl + self.stale_ttl:
+                self._revalidate(to_id)
+                return entry
+        return self._load(to_id)
+
+    def invalidate(self, to_id=None):
+        """Drop one receiving institution, or everything when to_id is None"""
+        if to_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(to_id, None)
+
+
+agreements_cache = AgreementsCache()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+SQLite store of scraped ASSIST course articulations
+One agreement per (community college, UC campus, major, academic year), each
+with its course mappings and the time it was fetched; the newest year stored for
+an agreement is re-scraped after MAX_AGE, years it has superseded never expire
+"""
+
+import os
+import re
+import sqlite3
+import time
+from datetime import date
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DB_FILE = os.getenv('ARTICULATION_DB', os.path.join(PARENT_DIR, 'articulations.db'))
+MAX_AGE = int(os.getenv('ARTICULATION_MAX_AGE_DAYS', 30)) * 24 * 60 * 60
+DEFAULT_MAJOR = 'Computer Science'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agreements (
+    cc TEXT NOT NULL COLLATE NOCASE,
+    uc TEXT NOT NULL COLLATE NOCASE,
+    major TEXT NOT NULL COLLATE NOCASE,
+    academic_year TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    row_count INTEGER NOT NULL,
+    PRIMARY KEY (cc, uc, major, academic_year)
+);
+CREATE TABLE IF NOT EXISTS mappings (
+    cc TEXT NOT NULL COLLATE NOCASE,
+    uc TEXT NOT NULL COLLATE NOCASE,
+    major TEXT NOT NULL COLLATE NOCASE,
+    academic_year TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    cc_course TEXT NOT NULL,
+    uc_course TEXT NOT NULL,
+    note TEXT NOT NULL DEFAULT '',
+    no_articulation INTEGER NOT NULL DEFAULT 0,
+    university_only INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS mappings_agreement ON mappings (cc, uc, major, academic_year, position);
+CREATE INDEX IF NOT EXISTS mappings_uc_course ON mappings (uc_course, uc);
+CREATE INDEX IF NOT EXISTS mappings_cc_course ON mappings (cc_course);
+"""
+
+MAPPING_COLUMNS = ('cc_course', 'uc_course', 'note', 'no_articulation', 'university_only')
+
+# Only the latest academic year stored for each agreement
+LATEST_YEAR = (
+    'm.academic_year = (SELECT MAX(a.academic_year) FROM agreements a '
+    'WHERE a.cc = m.cc AND a.uc = m.uc AND a.major = m.major)'
+)
+
+
+def course_key(course):
+    """Course codes are stored the way the scraper normalizes them: upper case, no spaces"""
+    return re.sub(r'\s+', '', course or '').upper()
+
+
+def mapping_dict(row):
+    mapping = dict(row)
+    for flag in ('no_articulation', 'university_only'):
+        if flag in mapping:
+            mapping[flag] = bool(mapping[flag])
+    return mapping
+
+
+def current_academic_year(today=None):
+    """
+    Academic year ASSIST publishes agreements for, e.g. "2025-2026"
+    A new year's agreements appear over the summer, so July starts the next year
+    """
+    today = today or date.today()
+    start = today.year if today.month >= 7 else today.year - 1
+    return f"{start}-{start + 1}"
+
+
+class ArticulationStore:
+    """
+    Persistent articulation cache shared by the scrapers and the API
+
+    Args:
+        path: SQLite database file
+        max_age: Seconds before an agreement for the current academic year is stale
+    """
+
+    def __init__(self, path=DB_FILE, max_age=MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._initialized = False
+
+    def connect(self):
+        """Open a connection (one per call, so pool worker threads never share one)"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+            self._initialized = True
+        return conn
+
+    def is_fresh(self, academic_year, fetched_at, latest_year=None, now=None):
+        """
+        Years superseded by a newer stored year are final; the newest one is trusted
+        for max_age seconds. ASSIST keeps listing a year until the next is published,
+        so the calendar can't tell whether a year is finished
+        """
+        if latest_year is not None and academic_year < latest_year:
+            return True
+        return (now or time.time()) - fetched_at <= self.max_age
+
+    def latest_year(self, cc, uc, major):
+        """Newest academic year stored for an agreement, or None"""
+        conn = self.connect()
+        try:
+            row = conn.execute(
+                'SELECT MAX(academic_year) AS year FROM agreements WHERE cc = ? AND uc = ? AND major = ?',
+                (cc, uc, major)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row['year']
+
+    def agreement(self, cc, uc, major, academic_year):
+        """Agreement metadata row (cc, uc, major, academic_year, fetched_at, row_count) or None"""
+        conn = self.connect()
+        try:
+            return conn.execute(
+                'SELECT * FROM agreements WHERE cc = ? AND uc = ? AND major = ? AND academic_year = ?',
+                (cc, uc, major, academic_year)
+            ).fetchone()
+        finally:
+            conn.close()
+
+    def get(self, cc, uc, major, academic_year, allow_stale=False):
+        """
+        Stored mappings for one agreement
+
+        Args:
+            cc: Community college name
+            uc: UC campus name
+            major: Major name
+            academic_year: Academic year (e.g., "2025-2026")
+            allow_stale: Return the mappings even if the freshness policy says re-scrape
+
+        Returns:
+            List of mapping dicts in scrape order, or None when missing or stale
+        """
+        conn = self.connect()
+        try:
+            meta = conn.execute(
+                'SELECT fetched_at, (SELECT MAX(l.academic_year) FROM agreements l '
+                'WHERE l.cc = a.cc AND l.uc = a.uc AND l.major = a.major) AS latest_year '
+                'FROM agreements a WHERE cc = ? AND uc = ? AND major = ? AND academic_year = ?',
+                (cc, uc, major, academic_year)
+            ).fetchone()
+            if meta is None:
+                return None
+            if not allow_stale and not self.is_fresh(academic_year, meta['fetched_at'], meta['latest_year']):
+                return None
+
+            rows = conn.execute(
+                f'SELECT {", ".join(MAPPING_COLUMNS)} FROM mappings '
+                'WHERE cc = ? AND uc = ? AND major = ? AND academic_year = ? ORDER BY position',
+                (cc, uc, major, academic_year)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [mapping_dict(r) for r in rows]
+
+    def put(self, cc, uc, major, academic_year, mappings, fetched_at=None):
+        """
+        Replace one agreement's mappings
+
+        Args:
+            mappings: Iterable of dicts with cc_course, uc_course and optionally
+                note, no_articulation and university_only
+        """
+        values = [
+            (
+                cc, uc, major, academic_year, position,
+                m['cc_course'], m['uc_course'], m.get('note') or '',
+                int(bool(m.get('no_articulation'))), int(bool(m.get('university_only')))
+            )
+            for position, m in enumerate(mappings)
+        ]
+
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute(
+                    'DELETE FROM mappings WHERE cc = ? AND uc = ? AND major = ? AND academic_year = ?',
+                    (cc, uc, major, academic_year)
+                )
+                conn.executemany(
+                    'INSERT INTO mappings (cc, uc, major, academic_year, position, '
+                    f'{", ".join(MAPPING_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    values
+                )
+                conn.execute(
+                    'INSERT OR REPLACE INTO agreements VALUES (?, ?, ?, ?, ?, ?)',
+                    (cc, uc, major, academic_year, fetched_at or time.time(), len(values))
+                )
+        finally:
+            conn.close()
+
+    def invalidate(self, cc=None, uc=None):
+        """Drop agreements for a CC, a campus, both, or everything when neither is given"""
+        clauses, params = [], []
+        if cc is not None:
+            clauses.append('cc = ?')
+            params.append(cc)
+        if uc is not None:
+            clauses.append('uc = ?')
+            params.append(uc)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute(f'DELETE FROM mappings{where}', params)
+                conn.execute(f'DELETE FROM agreements{where}', params)
+        finally:
+            conn.close()
+
+    def _query(self, sql, params):
+        conn = self.connect()
+        try:
+            return [mapping_dict(r) for r in conn.execute(sql, params).fetchall()]
+        finally:
+            conn.close()
+
+    def _year_clause(self, academic_year, params):
+        if academic_year:
+            params.append(academic_year)
+            return 'm.academic_year = ?'
+        return LATEST_YEAR
+
+    def courses(self, cc=None, uc=None, uc_course=None, cc_course=None,
+                major=DEFAULT_MAJOR, academic_year=None, limit=None):
+        """
+        Look up stored course mappings by campus, community college or course
+
+        Args:
+            cc: Community college name
+            uc: UC campus name
+            uc_course: UC course code (spacing and case are ignored)
+            cc_course: Community college course code (spacing and case are ignored)
+            major: Major name
+            academic_year: Academic year, or None for each agreement's latest year
+            limit: Maximum number of rows
+
+        Returns:
+            List of mapping dicts with cc, uc, academic_year and the mapping columns
+        """
+        clauses, params = ['m.major = ?'], [major]
+        for column, value in (('cc', cc), ('uc', uc)):
+            if value:
+                clauses.append(f'm.{column} = ?')
+                params.append(value)
+        for column, value in (('uc_course', uc_course), ('cc_course', cc_course)):
+            if value:
+                clauses.append(f'm.{column} = ?')
+                params.append(course_key(value))
+        clauses.append(self._year_clause(academic_year, params))
+
+        sql = (
+            f'SELECT m.cc, m.uc, m.academic_year, {", ".join("m." + c for c in MAPPING_COLUMNS)} '
+            f'FROM mappings m WHERE {" AND ".join(clauses)} ORDER BY m.cc, m.uc, m.position'
+        )
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return self._query(sql, params)
+
+    def stored_campuses(self, cc, ucs, major=DEFAULT_MAJOR, academic_year=None):
+        """
+        The subset of ucs that have an agreement with cc in the store
+
+        Args:
+            academic_year: Only count agreements for this year (None: any year)
+        """
+        params = [cc, major, *ucs]
+        year = ''
+        if academic_year:
+            params.append(academic_year)
+            year = ' AND academic_year = ?'
+
+        conn = self.connect()
+        try:
+            rows = conn.execute(
+                f'SELECT DISTINCT uc FROM agreements WHERE cc = ? AND major = ? '
+                f'AND uc IN ({", ".join("?" * len(ucs))}){year}',
+                params
+            ).fetchall()
+        finally:
+            conn.close()
+        stored = {r['uc'].lower() for r in rows}
+        return [uc for uc in ucs if uc.lower() in stored]
+
+    def overlap(self, cc, ucs, major=DEFAULT_MAJOR, academic_year=None):
+        """
+        Community college courses that articulate to every campus in ucs
+        ('No Course Articulated' and university-only rows excluded)
+
+        Returns:
+            List of dicts with cc_course and the uc_courses it covers per campus
+        """
+        if not ucs:
+            return []
+        params = [cc, major, *ucs]
+        year = self._year_clause(academic_year, params)
+        rows = self._query(
+            'SELECT m.cc_course, m.uc, m.uc_course FROM mappings m '
+            f'WHERE m.cc = ? AND m.major = ? AND m.uc IN ({", ".join("?" * len(ucs))}) AND {year} '
+            'AND m.no_articulation = 0 AND m.university_only = 0 ORDER BY m.cc_course, m.uc, m.position',
+            params
+        )
+
+        courses = {}
+        for r in rows:
+            campuses = courses.setdefault(r['cc_course'], {})
+            uc_courses = campuses.setdefault(r['uc'].lower(), [])
+            if r['uc_course'] not in uc_courses:
+                uc_courses.append(r['uc_course'])
+
+        names = {uc.lower(): uc for uc in ucs}
+        return [
+            {'cc_course': cc_course, 'campuses': {names[uc]: found for uc, found in campuses.items()}}
+            for cc_course, campuses in courses.items()
+            if len(campuses) == len(names)
+        ]
+
+    def alternatives(self, cc, uc, uc_course=None, major=DEFAULT_MAJOR, academic_year=None, limit=None):
+        """
+        Other community colleges that articulate the courses cc has no articulation for
+
+        Args:
+            cc: Home community college name
+            uc: UC campus name
+            uc_course: Only this UC course gap (spacing and case are ignored)
+            limit: Maximum alternatives per gap
+
+        Returns:
+            List of gaps, each {'uc_course', 'note', 'alternatives': [{'cc', 'cc_course'}, ...]}
+        """
+        gap_params = [cc, uc, major]
+        gap_year = self._year_clause(academic_year, gap_params)
+        gap_sql = (
+            'SELECT m.uc_course, m.note FROM mappings m '
+            f'WHERE m.cc = ? AND m.uc = ? AND m.major = ? AND {gap_year} AND m.no_articulation = 1'
+        )
+        if uc_course:
+            gap_sql += ' AND m.uc_course = ?'
+            gap_params.append(course_key(uc_course))
+        gaps = self._query(gap_sql + ' ORDER BY m.position', gap_params)
+        if not gaps:
+            return []
+
+        keys = list(dict.fromkeys(g['uc_course'] for g in gaps))
+        alt_params = [uc, major, cc]
+        alt_year = self._year_clause(academic_year, alt_params)
+        alt_params += keys
+        alts = self._query(
+            'SELECT m.uc_course, m.cc, m.cc_course FROM mappings m '
+            f'WHERE m.uc = ? AND m.major = ? AND m.cc != ? AND {alt_year} '
+            'AND m.no_articulation = 0 AND m.university_only = 0 '
+            f'AND m.uc_course IN ({", ".join("?" * len(keys))}) '
+            'ORDER BY m.uc_course, m.cc, m.position',
+            alt_params
+        )
+
+        by_course = {}
+        for a in alts:
+            found = by_course.setdefault(a['uc_course'], [])
+            # First articulated row per CC, like the scraper's gap search
+            if any(f['cc'] == a['cc'] for f in found):
+                continue
+            if limit and len(found) >= limit:
+                continue
+            found.append({'cc': a['cc'], 'cc_course': a['cc_course']})
+
+        seen = set()
+        results = []
+        for g in gaps:
+            if g['uc_course'] in seen:
+                continue
+            seen.add(g['uc_course'])
+            results.append({
+                'uc_course': g['uc_course'],
+                'note': g['note'],
+                'alternatives': by_course.get(g['uc_course'], [])
+            })
+        return results
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for assist.org, for reproducible scraper benchmarks and tests
+Serves recorded API responses (or ones synthesized from colleges.json), an
+interactive agreements page (assist_stub.html) and the saved debug_*.html captures,
+with optional injected latency and errors
+
+Covered flows:
+    combined_api JSON calls: /api/institutions, /api/institutions/{id}/agreements,
+        /api/agreements/{id}/courses
+    cs_assist_scrapper scraper/crawler: the home page dropdowns, View Agreements,
+        By Major, the major search and /api/articulation/Agreements
+The combined_api Playwright course-table scrape (ng-select flow) is not covered
+
+Point the scrapers at it with ASSIST_BASE_URL=http://127.0.0.1:8765 (combined_api)
+or --base-url http://127.0.0.1:8765 (cs_assist_scrapper)
+
+Usage:
+    python -m combined_api.assist_stub --port 8765 --latency 0.2 --error-rate 0.05
+    python -m combined_api.assist_stub --latest-year 2024   # next year not published yet
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+from .articulation_store import current_academic_year
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(os.path.dirname(BASE_DIR))
+COLLEGES_FILE = os.path.join(BASE_DIR, 'colleges.json')
+RECORDINGS_DIR = os.path.join(BASE_DIR, '.cache', 'assist_recordings')
+CAPTURES_DIR = os.path.join(PARENT_DIR, 'cs_assist_scrapper')
+APP_PAGE = os.path.join(BASE_DIR, 'assist_stub.html')
+YEARS_LISTED = 3
+
+ROUTES = [
+    (re.compile(r'^/api/institutions/?$'), 'institutions'),
+    (re.compile(r'^/api/institutions/(\d+)/agreements/?$'), 'agreements'),
+    (re.compile(r'^/api/agreements/([^/]+)/courses/?$'), 'courses'),
+    (re.compile(r'^/api/AcademicYears/?$', re.I), 'years'),
+    (re.compile(r'^/api/articulation/Agreements/?$', re.I), 'articulation'),
+]
+AGREEMENT_KEY = re.compile(r'^(\d+)/(\d+)/to/(\d+)/Major/(.+)$', re.I)
+
+# (receiving course, title, sending course) rows synthesized agreements draw from
+SYNTHETIC_ARTICULATIONS = [
+    (('COM SCI', '31'), 'Introduction to Computer Science I', ('CS', '101')),
+    (('COM SCI', '32'), 'Introduction to Computer Science II', ('CS', '102')),
+    (('COM SCI', '33'), 'Introduction to Computer Organization', ('CS', '201')),
+    (('COM SCI', '35L'), 'Software Construction', ('CS', '110')),
+    (('COM SCI', 'M51A'), 'Logic Design of Digital Systems', ('CS', '210')),
+    (('MATH', '31A'), 'Differential and Integral Calculus', ('MATH', '180')),
+    (('MATH', '31B'), 'Integration and Infinite Series', ('MATH', '185')),
+    (('MATH', '32A'), 'Calculus of Several Variables', ('MATH', '280')),
+    (('MATH', '33A'), 'Linear Algebra and Applications', ('MATH', '270')),
+    (('MATH', '61'), 'Introduction to Discrete Structures', ('MATH', '245')),
+    (('PHYSICS', '1A'), 'Mechanics', ('PHYS', '195')),
+    (('PHYSICS', '1B'), 'Oscillations, Waves, Electric and Magnetic Fields', ('PHYS', '196')),
+]
+
+
+def recording_name(path):
+    """File a recorded response for an API path (and query string) is stored under"""
+    return re.sub(r'[^A-Za-z0-9]+', '_', path.strip('/')) + '.json'
+
+
+def year_id(fall_year):
+    """ASSIST academic year ID (76 is 2025-2026)"""
+    return fall_year - 1949
+
+
+class AssistData:
+    """
+    Responses the stub serves: a recording when one exists, otherwise synthesized
+
+    Args:
+        recordings_dir: Directory of recorded JSON responses (see recording_name)
+        colleges_file: colleges.json used to synthesize institutions and agreements
+        captures_dir: Directory holding debug_*.html agreement pages
+        upstream: If set, missing recordings are fetched from this base URL and saved
+        latest_year: Fall year of the newest academic year listed (default: the
+            calendar's); set it a year back to mimic ASSIST before a new year is published
+    """
+
+    def __init__(self, recordings_dir=RECORDINGS_DIR, colleges_file=COLLEGES_FILE,
+                 captures_dir=CAPTURES_DIR, upstream=None, latest_year=None):
+        self.recordings_dir = recordings_dir
+        self.captures_dir = captures_dir
+        self.upstream = upstream.rstrip('/') if upstream else None
+        self.latest_year = latest_year or int(current_academic_year()[:4])
+        self._lock = threading.Lock()
+
+        with open(colleges_file, 'r', encoding='utf-8') as f:
+            colleges = json.load(f)
+        # Every transfer target is also listed as a sender, so CCs are the senders that aren't targets
+        receivers = sorted(set(colleges.get('transfer_institution', [])))
+        senders = sorted(set(colleges.get('from_institution', [])) - set(receivers))
+        self.institutions = [
+            {
+                'id': inst_id,
+                'code': ''.join(word[0] for word in name.split() if word[0].isupper()),
+                'isCommunityCollege': inst_id <= len(senders),
+                'names': [{'name': name}]
+            }
+            for inst_id, name in enumerate(senders + receivers, 1)
+        ]
+
+    @property
+    def years(self):
+        return [
+            {'Id': year_id(fall), 'FallYear': fall}
+            for fall in range(self.latest_year, self.latest_year - YEARS_LISTED, -1)
+        ]
+
+    def recorded(self, path):
+        file_path = os.path.join(self.recordings_dir, recording_name(path))
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        if not self.upstream:
+            return None
+
+        from .http_client import client as http_client
+        payload = http_client.get_json(self.upstream + path, timeout=10)
+        with self._lock:
+            os.makedirs(self.recordings_dir, exist_ok=True)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+        print(f"[+] Recorded {path} -> {file_path}")
+        return payload
+
+    def institution_name(self, inst_id):
+        for inst in self.institutions:
+            if inst['id'] == inst_id:
+                return inst['names'][0]['name']
+        return None
+
+    def articulation(self, key):
+        """
+        Agreement payload shaped like /api/articulation/Agreements: 'articulations'
+        and 'academicYear' are JSON-encoded strings inside 'result'. The rows are a
+        stable pseudo-random subset per CC/campus pair, some with no articulation
+        """
+        match = AGREEMENT_KEY.match(key or '')
+        if not match:
+            return None
+        year, from_id, to_id, major = int(match.group(1)), int(match.group(2)), int(match.group(3)), match.group(4)
+        from_name, to_name = self.institution_name(from_id), self.institution_name(to_id)
+        if from_name is None or to_name is None:
+            return None
+
+        rng = random.Random(f'{from_id}/{to_id}/{major}')
+        articulations = []
+        for (prefix, number), title, (cc_prefix, cc_number) in SYNTHETIC_ARTICULATIONS:
+            items = [] if rng.random() < 0.2 else [
+                {'items': [{'prefix': cc_prefix, 'courseNumber': cc_number, 'courseTitle': title}]}
+            ]
+            articulations.append({
+                'articulation': {
+                    'type': 'Course',
+                    'course': {'prefix': prefix, 'courseNumber': number, 'courseTitle': title},
+                    'sendingArticulation': {'items': items}
+                }
+            })
+
+        fall = year + 1949
+        return {
+            'result': {
+                'name': f'{major.replace("-", " ").title()} from {from_name} to {to_name}',
+                'sendingInstitution': json.dumps({'id': from_id, 'names': [{'name': from_name}]}),
+                'receivingInstitution': json.dumps({'id': to_id, 'names': [{'name': to_name}]}),
+                'academicYear': json.dumps({'Id': year, 'Code': f'{fall}-{fall + 1}'}),
+                'articulations': json.dumps(articulations)
+            },
+            'validationFailure': None,
+            'isSuccessful': True
+        }
+
+    def synthesize(self, route, match, query=''):
+        if route == 'institutions':
+            return self.institutions
+        if route == 'years':
+            return self.years
+        if route == 'articulation':
+            return self.articulation(parse_qs(query).get('Key', [''])[0])
+        if route == 'agreements':
+            to_id = int(match.group(1))
+            return [
+                {
+                    'institutionParentId': inst['id'],
+                    'institutionName': inst['names'][0]['name'],
+                    'code': inst['code'],
+                    'isCommunityCollege': inst['isCommunityCollege'],
+                    'sendingYearIds': [y['Id'] for y in self.years],
+                    'receivingYearIds': [y['Id'] for y in self.years]
+                }
+                for inst in self.institutions
+                if inst['isCommunityCollege'] and inst['id'] != to_id
+            ]
+        return []
+
+    def api(self, path, query=''):
+        """JSON for an API path, or None if the path is not a known assist.org API route"""
+        for pattern, route in ROUTES:
+            match = pattern.match(path)
+            if match:
+                # Agreements differ only by ?Key=, so it is part of their recording name
+                full_path = f'{path}?{query}' if route == 'articulation' and query else path
+                payload = self.recorded(full_path)
+                return payload if payload is not None else self.synthesize(route, match, query)
+        return None
+
+    def captures(self):
+        return sorted(glob.glob(os.path.join(self.captures_dir, 'debug_*.html')))
+
+    def page(self, path):
+        """
+        HTML for a non-API path: /captures/<file> serves one saved capture, anything
+        else the interactive agreements page (the SPA routes every path to it)
+        """
+        if not path.startswith('/captures/'):
+            with open(APP_PAGE, 'rb') as f:
+                return f.read()
+
+        name = os.path.basename(unquote(path))
+        captures = [c for c in self.captures() if os.path.basename(c) == name]
+        if not captures:
+            return None
+        with open(captures[0], 'rb') as f:
+            return f.read()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = 'AssistStub/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        if server.latency or server.jitter:
+            time.sleep(max(0.0, server.latency + random.uniform(-server.jitter, server.jitter)))
+        if server.error_rate and random.random() < server.error_rate:
+            self.send_body(503, b'{"error": "injected failure"}', 'application/json')
+            return
+
+        url = urlparse(self.path)
+        path = url.path
+        try:
+            payload = server.data.api(path, url.query)
+        except Exception as e:
+            self.send_body(502, json.dumps({'error': str(e)}).encode(), 'application/json')
+            return
+        if payload is not None:
+            self.send_body(200, json.dumps(payload).encode(), 'application/json')
+            return
+
+        if path.startswith('/api/'):
+            self.send_body(404, b'{"error": "not found"}', 'application/json')
+            return
+
+        html = server.data.page(path)
+        if html is None:
+            self.send_body(404, b'No such capture', 'text/plain')
+            return
+        self.send_body(200, html, 'text/html; charset=utf-8')
+
+    do_HEAD = do_GET
+
+
+class AssistStubServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP stand-in for assist.org
+
+    Args:
+        address: (host, port) to listen on; port 0 picks a free port
+        data: AssistData with the responses to serve
+        latency: Seconds added to every response
+        jitter: Random +/- seconds around latency
+        error_rate: Fraction of requests answered with 503
+        verbose: Log every request
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 8765), data=None, latency=0.0, jitter=0.0,
+                 error_rate=0.0, verbose=False):
+        super().__init__(address, StubHandler)
+        self.data = data or AssistData()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.verbose = verbose
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Serve on a daemon thread (for tests and benchmarks); returns self"""
+        threading.Thread(target=self.serve_forever, name='assist-stub', daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local assist.org stand-in server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random +/- seconds around --latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    parser.add_argument('--recordings', default=RECORDINGS_DIR, help='Directory of recorded API responses')
+    parser.add_argument('--captures', default=CAPTURES_DIR, help='Directory with debug_*.html pages')
+    parser.add_argument('--record-from', default=None,
+                        help='Fetch and save missing recordings from this base URL (e.g. https://www.assist.org)')
+    parser.add_argument('--latest-year', type=int, default=None,
+                        help='Fall year of the newest academic year listed (e.g. 2024 for 2024-2025)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    data = AssistData(args.recordings, captures_dir=args.captures, upstream=args.record_from,
+                      latest_year=args.latest_year)
+    server = AssistStubServer((args.host, args.port), data, args.latency, args.jitter,
+                              args.error_rate, args.verbose)
+    print(f"[*] assist.org stub on {server.base_url} "
+          f"({len(data.institutions)} institutions, {len(data.captures())} page captures)")
+    print(f"[*] export ASSIST_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark the speedyapply README table parser on a synthetic README
+Times InternshipFetcher's section scan + row parser against the original
+per-row regex parser and checks both produce the same internships
+
+Usage:
+    python -m combined_api.bench_internship_parser --rows 50000 --repeat 3
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import datetime
+
+from .fetch_and_clone_internships import InternshipFetcher
+
+HEADER_SALARY = '| Company | Position | Location | Salary | Posting | Age |\n|---|---|---|---|---|---|'
+HEADER_PLAIN = '| Company | Position | Location | Posting | Age |\n|---|---|---|---|---|'
+POSITIONS = ['Software Engineer Intern', 'SWE Intern - Backend', 'Quant Developer Intern',
+             'Machine Learning Intern', 'Data Engineering Intern']
+LOCATIONS = ['New York, NY', 'Remote', 'Seattle, WA', 'San Francisco, CA', '<details><summary>3 locations</summary>Austin, TX</br>Chicago, IL</details>']
+
+
+def synthetic_row(i, with_salary):
+    company = f'<a href="https://example.com/c{i % 997}"><strong>Company {i % 997}</strong></a>'
+    if i % 7 == 0:
+        company = f'**[Company {i % 997}](https://example.com/c{i % 997})**'
+    cells = [company, random.choice(POSITIONS), random.choice(LOCATIONS)]
+    if with_salary:
+        cells.append(f'${random.randint(30, 90)}/hr')
+    cells.append(f'<a href="https://jobs.example.com/{i}"><img src="apply.png" alt="Apply"></a>')
+    cells.append(f'{random.randint(0, 120)}d')
+    return '| ' + ' | '.join(cells) + ' |'
+
+
+def synthetic_readme(rows, seed=0):
+    """README with the three speedyapply sections holding `rows` listings between them"""
+    random.seed(seed)
+    sections = [
+        ('<!-- TABLE_FAANG_START -->', '<!-- TABLE_FAANG_END -->', HEADER_SALARY, True, rows // 5),
+        ('<!-- TABLE_QUANT_START -->', '<!-- TABLE_QUANT_END -->', HEADER_SALARY, True, rows // 10),
+        ('<!-- TABLE_START -->', '<!-- TABLE_END -->', HEADER_PLAIN, False, rows - rows // 5 - rows // 10),
+    ]
+    out = ['# 2026 SWE College Jobs', '', 'Synthetic benchmark README', '']
+    offset = 0
+    for start, end, header, with_salary, count in sections:
+        out += [start, header]
+        out += [synthetic_row(offset + i, with_salary) for i in range(count)]
+        out += [end, '']
+        offset += count
+    return '\n'.join(out)
+
+
+def legacy_parse_markdown_table(content, category):
+    """The original parser: regexes compiled per call and a timestamp per row"""
+    lines = content.split('\n')
+    in_table = False
+    internships = []
+
+    for line in lines:
+        if not line.strip():
+            continue
+        if '| Company | Position | Location |' in line:
+            in_table = True
+            continue
+        if in_table and '|---' in line:
+            continue
+        if in_table and line.startswith('|'):
+            if '<!-- TABLE' in line and 'END' in line:
+                in_table = False
+                continue
+
+            parts = [p.strip() for p in line.split('|')]
+            parts = [p for p in parts if p]
+
+            if len(parts) >= 4:
+                company_match = re.search(r'\*\*([^*]+)\*\*', parts[0])
+                company = company_match.group(1) if company_match else parts[0]
+                company = re.sub(r'<[^>]+>', '', company).strip()
+                company_url_match = re.search(r'href="([^"]+)"', parts[0])
+                company_url = company_url_match.group(1) if company_url_match else ""
+                position = re.sub(r'<[^>]+>', '', parts[1]).strip()
+                location = re.sub(r'<[^>]+>', '', parts[2]).strip()
+
+                salary = ""
+                posting_idx = 3
+                if len(parts) >= 5:
+                    if '$' in parts[3] or 'hr' in parts[3].lower():
+                        salary = re.sub(r'<[^>]+>', '', parts[3]).strip()
+                        posting_idx = 4
+
+                apply_link = ""
+                if len(parts) > posting_idx:
+                    link_match = re.search(r'href="([^"]+)"', parts[posting_idx])
+                    apply_link = link_match.group(1) if link_match else ""
+
+                age = ""
+                if len(parts) > posting_idx + 1:
+                    age = re.sub(r'<[^>]+>', '', parts[posting_idx + 1]).strip()
+
+                internships.append({
+                    'company': company,
+                    'company_url': company_url,
+                    'position': position,
+                    'location': location,
+                    'salary': salary,
+                    'apply_link': apply_link,
+                    'age': age,
+                    'category': category,
+                    'date_fetched': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                })
+
+    return internships
+
+
+def legacy_parse(content):
+    internships = []
+    for category, start_marker, end_marker in [
+        ('FAANG+', '<!-- TABLE_FAANG_START -->', '<!-- TABLE_FAANG_END -->'),
+        ('Quant', '<!-- TABLE_QUANT_START -->', '<!-- TABLE_QUANT_END -->'),
+        ('Other', '<!-- TABLE_START -->', '<!-- TABLE_END -->'),
+    ]:
+        start = content.find(start_marker)
+        end = content.find(end_marker)
+        if start != -1 and end != -1:
+            internships.extend(legacy_parse_markdown_table(content[start:end], category))
+    return internships
+
+
+def current_parse(fetcher, content):
+    date_fetched = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    internships = []
+    for category, line in fetcher.section_rows(content):
+        internship = fetcher.parse_row(line, category)
+        if internship:
+            internship['date_fetched'] = date_fetched
+            internships.append(internship)
+    return internships
+
+
+def best_of(fn, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def without_dates(internships):
+    return [{k: v for k, v in item.items() if k != 'date_fetched'} for item in internships]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the internships README parser')
+    parser.add_argument('--rows', type=int, default=50000, help='Listings in the synthetic README')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--readme', default=None, help='Parse this README instead of a synthetic one')
+    args = parser.parse_args()
+
+    if args.readme:
+        with open(args.readme, 'r', encoding='utf-8') as f:
+            content = f.read()
+    else:
+        content = synthetic_readme(args.rows)
+
+    fetcher = InternshipFetcher(incremental=False)
+    legacy_secs, legacy_rows = best_of(lambda: legacy_parse(content), args.repeat)
+    current_secs, current_rows = best_of(lambda: current_parse(fetcher, content), args.repeat)
+
+    same = without_dates(legacy_rows) == without_dates(current_rows)
+    print(f"[*] README: {len(content) / 1024:.0f} KB, {len(current_rows)} listings, best of {args.repeat}")
+    print(f"    legacy:  {legacy_secs * 1000:>8.1f}ms")
+    print(f"    current: {current_secs * 1000:>8.1f}ms  x{legacy_secs / current_secs:.1f}")
+    print(f"[{'+' if same else '!'}] Output {'identical' if same else 'MISMATCH'}")
+    if not same:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Pool of long-lived Chromium browsers for Playwright scraping
+Playwright's sync API is bound to the thread that started it, so every browser
+is owned by one worker thread; jobs are handed to whichever worker is free and
+each job gets its own isolated browser context and page
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from playwright.sync_api import sync_playwright, Error as PWError
+
+POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', 2))
+MAX_USES = int(os.getenv('BROWSER_MAX_USES', 50))
+JS_HEAP_MB = int(os.getenv('BROWSER_JS_HEAP_MB', 2048))
+DEFAULT_TIMEOUT_MS = 15000
+
+
+class _Job:
+    def __init__(self, fn):
+        self.fn = fn
+        self.future = Future()
+
+
+class BrowserWorker(threading.Thread):
+    """Owns one Playwright instance and one browser, recycled after max_uses jobs or a crash"""
+
+    def __init__(self, pool, index):
+        super().__init__(name=f'browser-worker-{index}', daemon=True)
+        self.pool = pool
+        self.playwright = None
+        self.browser = None
+        self.uses = 0
+        self.launches = 0
+
+    def _launch(self):
+        self._close_browser()
+        self.browser = self.playwright.chromium.launch(
+            headless=self.pool.headless,
+            args=self.pool.launch_args
+        )
+        self.uses = 0
+        self.launches += 1
+
+    def _close_browser(self):
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+    def _browser(self):
+        if self.browser is None or not self.browser.is_connected() or self.uses >= self.pool.max_uses:
+            self._launch()
+        return self.browser
+
+    def run(self):
+        try:
+            self.playwright = sync_playwright().start()
+        except Exception as e:
+            self.playwright = None
+            start_error = e
+
+        try:
+            while True:
+                job = self.pool.jobs.get()
+                if job is None:
+                    break
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                if self.playwright is None:
+                    job.future.set_exception(start_error)
+                    continue
+                self._run_job(job)
+        finally:
+            self._close_browser()
+            if self.playwright is not None:
+                self.playwright.stop()
+
+    def _run_job(self, job):
+        context = None
+        try:
+            context = self._browser().new_context(**self.pool.context_options)
+            page = context.new_page()
+            page.set_default_timeout(self.pool.default_timeout)
+            job.future.set_result(job.fn(page))
+        except Exception as e:
+            job.future.set_exception(e)
+            if isinstance(e, PWError) and self.browser is not None and not self.browser.is_connected():
+                self._close_browser()
+        finally:
+            self.uses += 1
+            if context is not None:
+                try:
+                    context.close()
+                except Exception:
+                    pass
+
+
+class BrowserPool:
+    """
+    Warm Chromium instances shared by every Playwright scraper
+
+    Args:
+        size: Number of browsers (and worker threads) kept alive
+        max_uses: Jobs served by one browser before it is relaunched
+        headless: Launch browsers without a window
+        launch_args: Extra Chromium command-line flags
+        context_options: Keyword arguments for browser.new_context()
+        js_heap_mb: V8 heap budget (--max-old-space-size) split evenly across browsers;
+            caps page JavaScript only, not the browsers' total memory
+        default_timeout: Default Playwright timeout for each page, in ms
+    """
+
+    def __init__(self, size=POOL_SIZE, max_uses=MAX_USES, headless=True, launch_args=None,
+                 context_options=None, js_heap_mb=JS_HEAP_MB, default_timeout=DEFAULT_TIMEOUT_MS):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.headless = headless
+        self.context_options = dict(context_options or {})
+        self.default_timeout = default_timeout
+
+        self.launch_args = list(launch_args or [])
+        self.launch_args.append('--disable-dev-shm-usage')
+        if js_heap_mb:
+            per_browser = max(128, js_heap_mb // self.size)
+            self.launch_args.append(f'--js-flags=--max-old-space-size={per_browser}')
+            self.launch_args.append('--renderer-process-limit=2')
+
+        self.jobs = queue.Queue()
+        self.workers = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _start(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Browser pool is closed')
+            if not self.workers:
+                self.workers = [BrowserWorker(self, i) for i in range(self.size)]
+                for worker in self.workers:
+                    worker.start()
+
+    def submit(self, fn):
+        """
+        Queue fn(page) to run on a fresh context of a pooled browser
+
+        Returns:
+            concurrent.futures.Future with fn's return value
+        """
+        self._start()
+        job = _Job(fn)
+        self.jobs.put(job)
+        return job.future
+
+    def run(self, fn, timeout=None):
+        """Run fn(page) on a pooled browser and wait for its result"""
+        return self.submit(fn).result(timeout)
+
+    def run_with_retries(self, fn, retries, failed, backoff=1.0, timeout=None):
+        """
+        Run fn(page) again while it raises or failed(result) is true, at most retries times
+        Waits backoff * 2 ** n seconds before retry n + 1 in the calling thread, so
+        no browser is held while waiting
+
+        Returns:
+            (last result, number of retries used); an exception on the last try propagates
+        """
+        attempt = 0
+        while True:
+            try:
+                result = self.run(fn, timeout)
+                if attempt == retries or not failed(result):
+                    return result, attempt
+            except Exception:
+                if attempt == retries:
+                    raise
+            time.sleep(backoff * 2 ** attempt)
+            attempt += 1
+
+    def stats(self):
+        """Queue depth and per-browser use/launch counts"""
+        with self._lock:
+            workers = list(self.workers)
+        return {
+            'size': self.size,
+            'queued': self.jobs.qsize(),
+            'browsers': [
+                # Only the owning worker thread may call into its browser (is_connected()
+                # included), so this reports whether one is launched, not its connection
+                {'uses': w.uses, 'launches': w.launches, 'launched': w.browser is not None}
+                for w in workers
+            ]
+        }
+
+    def close(self):
+        """Stop all workers and close their browsers"""
+        with self._lock:
+            self._closed = True
+            workers = self.workers
+        for _ in workers:
+            self.jobs.put(None)
+        for worker in workers:
+            worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def get_pool():
+    """Process-wide pool used by the API's Playwright scrapers"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool()
+        return _shared_pool
+
+
+def pool_stats():
+    """stats() of the shared pool, or None if no scraper has started it yet"""
+    with _shared_lock:
+        pool = _shared_pool
+    return pool.stats() if pool is not None else None
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Process-wide store for the JSON datasets served by the API
+Each file is parsed once and kept in memory as an immutable snapshot, and a new
+snapshot is swapped in only when the file's mtime/size changes or a reload is forced
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class DatasetSnapshot:
+    """A parsed dataset plus the indexes derived from it"""
+
+    def __init__(self, data, version, mtime_ns, size):
+        self.data = data
+        self.version = version
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.loaded_at = time.time()
+        self.indexes = {}
+
+    @property
+    def etag(self):
+        """Strong validator for responses computed from this snapshot"""
+        return f"{self.version}-{self.mtime_ns:x}-{self.size:x}"
+
+
+class DatasetStore:
+    """
+    Keeps the latest snapshot of a JSON file in memory
+
+    Args:
+        path: JSON file to serve
+        builders: Optional mapping of index name -> callable(data) that is run
+            once per snapshot; results are exposed on snapshot.indexes
+        check_interval: Minimum seconds between stat() calls on the file
+    """
+
+    def __init__(self, path, builders=None, check_interval=1.0):
+        self.path = path
+        self.builders = dict(builders or {})
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._version = 0
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _build(self, data, signature):
+        mtime_ns, size = signature
+        snapshot = DatasetSnapshot(data, self._version + 1, mtime_ns, size)
+        for name, builder in self.builders.items():
+            snapshot.indexes[name] = builder(data)
+        return snapshot
+
+    def _load(self, signature):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            # Keep serving the previous snapshot (e.g. file is mid-write)
+            print(f"Error loading {self.path}: {e}")
+            return self._snapshot
+
+        snapshot = self._build(data, signature)
+        self._version = snapshot.version
+        self._snapshot = snapshot
+        return snapshot
+
+    def snapshot(self):
+        """Return the current snapshot, reloading if the file changed on disk"""
+        current = self._snapshot
+        now = time.monotonic()
+        if current is not None and now - self._last_check < self.check_interval:
+            return current
+
+        signature = self._stat()
+        self._last_check = now
+        if signature is None:
+            return current
+        if current is not None and (current.mtime_ns, current.size) == signature:
+            return current
+
+        with self._lock:
+            current = self._snapshot
+            if current is not None and (current.mtime_ns, current.size) == signature:
+                return current
+            return self._load(signature)
+
+    def get(self):
+        """Return the parsed data of the current snapshot, or None if unavailable"""
+        snapshot = self.snapshot()
+        return snapshot.data if snapshot else None
+
+    def reload(self):
+        """Force a re-read of the file regardless of its mtime/size"""
+        signature = self._stat()
+        if signature is None:
+            return self._snapshot
+        with self._lock:
+            self._last_check = time.monotonic()
+            return self._load(signature)
+
+    def publish(self, data):
+        """Swap in already-parsed data, e.g. right after a refresh wrote the file"""
+        signature = self._stat() or (0, 0)
+        with self._lock:
+            snapshot = self._build(data, signature)
+            self._version = snapshot.version
+            self._snapshot = snapshot
+            self._last_check = time.monotonic()
+            return snapshot
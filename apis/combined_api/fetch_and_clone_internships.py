@@ -8,194 +8,456 @@ import os
 import sys
 import re
 import json
+import shutil
+import hashlib
+import threading
 from datetime import datetime
 import subprocess
 
+REPO_URL = os.getenv('INTERNSHIPS_REPO_URL', 'https://github.com/speedyapply/2026-SWE-College-Jobs.git')
+README_URL = os.getenv(
+    'INTERNSHIPS_README_URL',
+    'https://raw.githubusercontent.com/speedyapply/2026-SWE-College-Jobs/main/README.md'
+)
+# 'git': shallow sparse checkout of README.md, 'raw': conditional download of the raw file
+FETCH_MODE = os.getenv('INTERNSHIPS_FETCH_MODE', 'git')
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'internships')
+# Dataset the API serves; the default baseline for incremental refreshes
+DATASET_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), '2026_internships.json'
+)
+# Seconds a single git command may run before it is killed
+GIT_TIMEOUT = int(os.getenv('INTERNSHIPS_GIT_TIMEOUT', 120))
+# Serializes checkout/download work: a refresh that timed out may still be
+# running in its thread when the next one starts on the same directory
+REPO_LOCK = threading.Lock()
+
+# README section markers -> category
+SECTIONS = [
+    ('FAANG+', '<!-- TABLE_FAANG_START -->', '<!-- TABLE_FAANG_END -->'),
+    ('Quant', '<!-- TABLE_QUANT_START -->', '<!-- TABLE_QUANT_END -->'),
+    ('Other', '<!-- TABLE_START -->', '<!-- TABLE_END -->'),
+]
+SECTION_MARKER_RE = re.compile(
+    '|'.join(re.escape(marker) for _, start, end in SECTIONS for marker in (start, end))
+)
+TABLE_HEADER = '| Company | Position | Location |'
+# Lines the table scan acts on: rows (leading |) and header lines; everything else is skipped
+TABLE_LINE_RE = re.compile(r'^(?:\|[^\n]*|[^\n]*?' + re.escape(TABLE_HEADER) + r'[^\n]*)', re.MULTILINE)
+BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+HREF_RE = re.compile(r'href="([^"]+)"')
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def strip_tags(text):
+    return TAG_RE.sub('', text) if '<' in text else text
+
+
+def find_sections(content):
+    """
+    Locate every section in one scan of the README
+    Same result as content.find() per marker: first occurrence of each
+
+    Returns:
+        List of (category, start, end) for sections whose markers were both found
+    """
+    first = {}
+    for match in SECTION_MARKER_RE.finditer(content):
+        first.setdefault(match.group(0), match.start())
+    return [
+        (category, first[start], first[end])
+        for category, start, end in SECTIONS
+        if start in first and end in first
+    ]
+
+
+def row_key(internship):
+    """Stable identity of a listing across refreshes"""
+    return (internship.get('company', ''), internship.get('position', ''), internship.get('apply_link', ''))
+
+
+def split_age(line):
+    """Split a table row into everything before the age column and the age cell"""
+    body, _, age = line.rstrip().rstrip('|').rpartition('|')
+    return body, age
+
+
+def row_hash(category, line):
+    """
+    Content hash of a README row, ignoring the age column
+    The age ("3d") changes every day, so hashing it would make every row look new
+    """
+    body, _ = split_age(line)
+    return hashlib.sha1(f"{category}\x00{body}".encode('utf-8')).hexdigest()[:16]
+
 
 class InternshipFetcher:
-    def __init__(self):
+    """
+    Fetch the speedyapply README and extract its internship listings
+
+    Args:
+        incremental: Reuse unchanged rows from the last saved dataset
+        repo_url: Repository to check out in 'git' mode (any URL git accepts)
+        mode: 'git' or 'raw' (see FETCH_MODE)
+        readme_url: Raw README.md URL for 'raw' mode
+        cache_dir: Directory for the raw download and its ETag metadata
+        repo_dir: Checkout directory in 'git' mode (default: 2026-SWE-College-Jobs
+            next to combined_api)
+    """
+
+    def __init__(self, incremental=True, repo_url=REPO_URL, mode=FETCH_MODE,
+                 readme_url=README_URL, cache_dir=CACHE_DIR, repo_dir=None):
         # Use parent directory as base (project root)
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.repo_dir = os.path.join(self.base_dir, "2026-SWE-College-Jobs")
+        self.repo_url = repo_url
+        self.mode = mode
+        self.readme_url = readme_url
+        self.cache_dir = cache_dir
+        if mode == 'raw':
+            self.repo_dir = cache_dir
+        else:
+            self.repo_dir = repo_dir or os.path.join(self.base_dir, "2026-SWE-College-Jobs")
         self.readme_path = os.path.join(self.repo_dir, "README.md")
+        self.readme_changed = True
+        self.incremental = incremental
         self.internships = []
+        self.closed_internships = []
+        self.readme_sha = None
+        self.stats = {}
+
+    def git(self, *args, cwd=None):
+        return subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=GIT_TIMEOUT
+        )
 
     def clone_or_update_repo(self):
-        """Clone the repository or update it if it already exists"""
-        repo_url = "https://github.com/speedyapply/2026-SWE-College-Jobs.git"
-
-        if os.path.exists(self.repo_dir):
-            print(f"[*] Repository already exists. Updating...")
-            try:
-                # Pull latest changes
-                result = subprocess.run(
-                    ["git", "-C", self.repo_dir, "pull"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                print(f"[+] Repository updated successfully")
+        """
+        Bring README.md up to date
+
+        In 'git' mode this is a depth-1, blob-filtered, sparse checkout of just
+        README.md in self.repo_dir; updates fetch the remote HEAD at depth 1 and
+        reset to it. In 'raw' mode the README is downloaded conditionally instead.
+        Only one fetcher in the process does this at a time (REPO_LOCK)
+        """
+        with REPO_LOCK:
+            if self.mode == 'raw':
+                return self.download_readme()
+            return self.update_checkout()
+
+    def update_checkout(self):
+        """Clone or fast-forward the sparse README checkout in self.repo_dir"""
+        try:
+            if os.path.exists(os.path.join(self.repo_dir, '.git')):
+                print(f"[*] Repository already exists. Updating...")
+                before = self.git("-C", self.repo_dir, "rev-parse", "HEAD").stdout.strip()
+                self.git("-C", self.repo_dir, "fetch", "--depth", "1", "--filter=blob:none", "origin", "HEAD")
+                self.git("-C", self.repo_dir, "reset", "--hard", "FETCH_HEAD")
+                after = self.git("-C", self.repo_dir, "rev-parse", "HEAD").stdout.strip()
+                self.readme_changed = before != after
+                print(f"[+] Repository updated successfully" + ("" if self.readme_changed else " (no new commits)"))
                 return True
-            except subprocess.CalledProcessError as e:
-                print(f"[!] Error updating repository: {e.stderr}")
-                return False
-        else:
-            print(f"[*] Cloning repository: {repo_url}")
+
+            if os.path.exists(self.repo_dir):
+                # Leftover from an interrupted clone or a plain copy; git clone refuses a non-empty dir
+                print(f"[*] Removing {self.repo_dir} (not a git checkout)")
+                shutil.rmtree(self.repo_dir)
+
+            print(f"[*] Cloning repository: {self.repo_url}")
+            self.git(
+                "clone", "--depth", "1", "--filter=blob:none", "--sparse", "--no-checkout",
+                self.repo_url, self.repo_dir
+            )
+            self.git("-C", self.repo_dir, "sparse-checkout", "set", "--no-cone", "/README.md")
+            self.git("-C", self.repo_dir, "checkout")
+            self.readme_changed = True
+            print(f"[+] Repository cloned successfully")
+            return True
+
+        except subprocess.CalledProcessError as e:
+            print(f"[!] Error updating repository: {e.stderr}")
+            return False
+        except subprocess.TimeoutExpired as e:
+            print(f"[!] Error updating repository: git timed out after {GIT_TIMEOUT}s")
+            return False
+        except FileNotFoundError:
+            print("[!] Error: git is not installed or not in PATH")
+            return False
+
+    def download_readme(self):
+        """
+        Download README.md into the cache directory with If-None-Match/If-Modified-Since
+        A 304 leaves the cached copy in place and sets readme_changed to False
+        """
+        from .http_client import client as http_client
+
+        meta_path = os.path.join(self.cache_dir, 'README.meta.json')
+        meta = {}
+        if os.path.exists(self.readme_path):
             try:
-                result = subprocess.run(
-                    ["git", "clone", repo_url],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                print(f"[+] Repository cloned successfully")
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                meta = {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        print(f"[*] Downloading {self.readme_url}")
+        try:
+            response = http_client.get(self.readme_url, headers=headers, timeout=20)
+            if response.status_code == 304:
+                self.readme_changed = False
+                print(f"[+] README.md not modified since last download")
                 return True
-            except subprocess.CalledProcessError as e:
-                print(f"[!] Error cloning repository: {e.stderr}")
-                return False
-            except FileNotFoundError:
-                print("[!] Error: git is not installed or not in PATH")
-                return False
-
-    def parse_markdown_table(self, content, category):
-        """Parse markdown table and extract internship data"""
-        lines = content.split('\n')
-        in_table = False
-        internships = []
+            response.raise_for_status()
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.readme_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(response.content)
+            os.replace(tmp_path, self.readme_path)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'url': self.readme_url
+                }, f)
+            self.readme_changed = True
+            print(f"[+] README.md downloaded ({len(response.content)} bytes)")
+            return True
 
-        for line in lines:
-            # Skip empty lines
-            if not line.strip():
-                continue
+        except Exception as e:
+            print(f"[!] Error downloading README.md: {e}")
+            return False
 
+    def table_rows(self, content, start=0, end=None):
+        """
+        Yield the raw table row lines of one README section
+        The section is content[start:end], scanned in place without slicing or
+        splitting; start is treated as the beginning of a line
+        """
+        if end is None:
+            end = len(content)
+        first_end = content.find('\n', start, end)
+        if first_end == -1:
+            first_end = end
+
+        # The first line is the section marker; only a header on it matters
+        in_table = content.find(TABLE_HEADER, start, first_end) != -1
+
+        for match in TABLE_LINE_RE.finditer(content, first_end + 1, end):
+            line = match.group(0)
             # Check if we're in a table
-            if '| Company | Position | Location |' in line:
+            if TABLE_HEADER in line:
                 in_table = True
                 continue
+            if not in_table:
+                continue
 
             # Skip the separator line (contains --- )
-            if in_table and '|---' in line:
+            if '|---' in line:
                 continue
 
-            # Parse table rows
-            if in_table and line.startswith('|'):
-                # Stop if we hit the end marker
-                if '<!-- TABLE' in line and 'END' in line:
-                    in_table = False
-                    continue
+            # Stop if we hit the end marker
+            if '<!-- TABLE' in line and 'END' in line:
+                in_table = False
+                continue
+            yield line
+
+    def parse_row(self, line, category):
+        """Parse one markdown table row into an internship dict (None if it isn't a listing)"""
+        # Split by |, clean up and drop empty cells
+        parts = [p for p in (cell.strip() for cell in line.split('|')) if p]
 
-                # Split by | and clean up
-                parts = [p.strip() for p in line.split('|')]
-
-                # Filter out empty parts
-                parts = [p for p in parts if p]
-
-                if len(parts) >= 4:  # Company, Position, Location, Posting (minimum)
-                    try:
-                        # Extract company name from markdown link
-                        company_match = re.search(r'\*\*([^*]+)\*\*', parts[0])
-                        company = company_match.group(1) if company_match else parts[0]
-                        # Clean any remaining HTML tags
-                        company = re.sub(r'<[^>]+>', '', company).strip()
-
-                        # Extract company URL
-                        company_url_match = re.search(r'href="([^"]+)"', parts[0])
-                        company_url = company_url_match.group(1) if company_url_match else ""
-
-                        # Extract position
-                        position = re.sub(r'<[^>]+>', '', parts[1]).strip()
-
-                        # Extract location
-                        location = re.sub(r'<[^>]+>', '', parts[2]).strip()
-
-                        # Extract salary if available (FAANG+ and Quant tables have it)
-                        salary = ""
-                        posting_idx = 3
-                        if len(parts) >= 5:
-                            # Check if this column looks like salary
-                            if '$' in parts[3] or 'hr' in parts[3].lower():
-                                salary = re.sub(r'<[^>]+>', '', parts[3]).strip()
-                                posting_idx = 4
-
-                        # Extract application link from the Posting column
-                        apply_link = ""
-                        if len(parts) > posting_idx:
-                            link_match = re.search(r'href="([^"]+)"', parts[posting_idx])
-                            apply_link = link_match.group(1) if link_match else ""
-
-                        # Extract age (days posted)
-                        age = ""
-                        age_idx = posting_idx + 1
-                        if len(parts) > age_idx:
-                            age = re.sub(r'<[^>]+>', '', parts[age_idx]).strip()
-
-                        internship = {
-                            'company': company,
-                            'company_url': company_url,
-                            'position': position,
-                            'location': location,
-                            'salary': salary,
-                            'apply_link': apply_link,
-                            'age': age,
-                            'category': category,
-                            'date_fetched': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-
-                        internships.append(internship)
-
-                    except Exception as e:
-                        print(f"[!] Error parsing row: {e}")
-                        print(f"    Row: {line}")
-                        continue
+        if len(parts) < 4:  # Company, Position, Location, Posting (minimum)
+            return None
 
+        try:
+            # Company name from the bold markdown/HTML link, URL from its href
+            first = parts[0]
+            company_match = BOLD_RE.search(first)
+            company = strip_tags(company_match.group(1) if company_match else first).strip()
+            company_url_match = HREF_RE.search(first) if 'href="' in first else None
+            company_url = company_url_match.group(1) if company_url_match else ""
+
+            position = strip_tags(parts[1]).strip()
+            location = strip_tags(parts[2]).strip()
+
+            # Salary column only exists in the FAANG+ and Quant tables
+            salary = ""
+            posting_idx = 3
+            if len(parts) >= 5:
+                cell = parts[3]
+                if '$' in cell or 'hr' in cell.lower():
+                    salary = strip_tags(cell).strip()
+                    posting_idx = 4
+
+            # Application link from the Posting column
+            apply_link = ""
+            if len(parts) > posting_idx:
+                link_match = HREF_RE.search(parts[posting_idx])
+                apply_link = link_match.group(1) if link_match else ""
+
+            # Age (days posted)
+            age = ""
+            if len(parts) > posting_idx + 1:
+                age = strip_tags(parts[posting_idx + 1]).strip()
+
+            return {
+                'company': company,
+                'company_url': company_url,
+                'position': position,
+                'location': location,
+                'salary': salary,
+                'apply_link': apply_link,
+                'age': age,
+                'category': category
+            }
+
+        except Exception as e:
+            print(f"[!] Error parsing row: {e}")
+            print(f"    Row: {line}")
+            return None
+
+    def parse_markdown_table(self, content, category):
+        """Parse markdown table and extract internship data"""
+        date_fetched = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        internships = []
+        for line in self.table_rows(content):
+            internship = self.parse_row(line, category)
+            if internship:
+                internship['date_fetched'] = date_fetched
+                internships.append(internship)
         return internships
 
-    def fetch_internships(self):
-        """Read README.md and extract all internship listings"""
+    def section_rows(self, content):
+        """Yield (category, line) for every table row of every README section"""
+        for category, start, end in find_sections(content):
+            for line in self.table_rows(content, start, end):
+                yield category, line
+
+    def load_previous(self, filepath):
+        """Dataset written by the last refresh, or an empty one"""
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def keep_previous(self, readme_sha, internships, closed_internships):
+        """Serve the baseline dataset as this refresh's result"""
+        self.readme_sha = readme_sha
+        self.internships = internships
+        self.closed_internships = closed_internships
+        self.stats = {'unchanged': True, 'reused': len(internships), 'parsed': 0, 'closed': 0}
+        return True
+
+    def fetch_internships(self, previous_file=None, previous=None):
+        """
+        Read README.md and extract all internship listings
+
+        In incremental mode the last saved dataset is used as a baseline: rows whose
+        content hash is unchanged are reused without parsing, listings keep their
+        first-seen date_fetched, and listings gone from the README move to
+        closed_internships. If clone_or_update_repo found no new README the
+        baseline is returned as is, without reading or hashing the file
+
+        Args:
+            previous_file: Dataset from the last refresh (default: DATASET_FILE, the one the API serves)
+            previous: Already loaded baseline dataset, used instead of previous_file
+        """
         if not os.path.exists(self.readme_path):
             print(f"[!] Error: README.md not found at {self.readme_path}")
             return False
 
+        if not self.incremental:
+            previous = {}
+        elif previous is None:
+            previous = self.load_previous(previous_file or DATASET_FILE)
+        previous_open = previous.get('internships', [])
+        previous_closed = previous.get('closed_internships', [])
+        previous_sha = previous.get('metadata', {}).get('readme_sha256')
+
+        if not self.readme_changed and previous_open and previous_sha:
+            # 304 or no new commits: the README is the one the baseline was built from
+            print(f"[+] README.md not updated, keeping {len(previous_open)} internships")
+            return self.keep_previous(previous_sha, previous_open, previous_closed)
+
         print(f"[*] Reading internships from README.md...")
 
         try:
             with open(self.readme_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-
-            # Find and parse FAANG+ section
-            faang_start = content.find('<!-- TABLE_FAANG_START -->')
-            faang_end = content.find('<!-- TABLE_FAANG_END -->')
-            if faang_start != -1 and faang_end != -1:
-                faang_content = content[faang_start:faang_end]
-                faang_internships = self.parse_markdown_table(faang_content, 'FAANG+')
-                self.internships.extend(faang_internships)
-                print(f"[+] Found {len(faang_internships)} FAANG+ internships")
-
-            # Find and parse Quant section
-            quant_start = content.find('<!-- TABLE_QUANT_START -->')
-            quant_end = content.find('<!-- TABLE_QUANT_END -->')
-            if quant_start != -1 and quant_end != -1:
-                quant_content = content[quant_start:quant_end]
-                quant_internships = self.parse_markdown_table(quant_content, 'Quant')
-                self.internships.extend(quant_internships)
-                print(f"[+] Found {len(quant_internships)} Quant internships")
-
-            # Find and parse Other section
-            other_start = content.find('<!-- TABLE_START -->')
-            other_end = content.find('<!-- TABLE_END -->')
-            if other_start != -1 and other_end != -1:
-                other_content = content[other_start:other_end]
-                other_internships = self.parse_markdown_table(other_content, 'Other')
-                self.internships.extend(other_internships)
-                print(f"[+] Found {len(other_internships)} Other internships")
-
-            print(f"[+] Total internships fetched: {len(self.internships)}")
-            return True
-
         except Exception as e:
             print(f"[!] Error reading README.md: {e}")
             return False
 
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.readme_sha = hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+        if previous_open and previous_sha == self.readme_sha:
+            print(f"[+] README.md unchanged since last refresh, keeping {len(previous_open)} internships")
+            return self.keep_previous(previous_sha, previous_open, previous_closed)
+
+        by_hash = {i['row_hash']: i for i in previous_open if i.get('row_hash')}
+        first_seen = {}
+        for internship in previous_closed + previous_open:
+            first_seen[row_key(internship)] = internship.get('date_fetched', now)
+
+        internships = []
+        reused = parsed = 0
+        for category, line in self.section_rows(content):
+            line_hash = row_hash(category, line)
+            cached = by_hash.get(line_hash)
+            if cached is not None:
+                internship = dict(cached)
+                if internship.get('age'):
+                    internship['age'] = re.sub(r'<[^>]+>', '', split_age(line)[1]).strip()
+                reused += 1
+            else:
+                internship = self.parse_row(line, category)
+                if not internship:
+                    continue
+                internship['row_hash'] = line_hash
+                parsed += 1
+
+            internship['date_fetched'] = first_seen.get(row_key(internship), now)
+            internship['last_seen'] = now
+            internship['status'] = 'open'
+            internships.append(internship)
+
+        open_keys = {row_key(i) for i in internships}
+        closed = [i for i in previous_closed if row_key(i) not in open_keys]
+        closed_keys = {row_key(i) for i in closed}
+        newly_closed = 0
+        for internship in previous_open:
+            key = row_key(internship)
+            if key in open_keys or key in closed_keys:
+                continue
+            closed_keys.add(key)
+            closed.append(dict(internship, status='closed', date_closed=now))
+            newly_closed += 1
+
+        self.internships = internships
+        self.closed_internships = closed
+        self.stats = {'unchanged': False, 'reused': reused, 'parsed': parsed, 'closed': newly_closed}
+
+        for category, _, _ in SECTIONS:
+            count = len([i for i in internships if i['category'] == category])
+            print(f"[+] Found {count} {category} internships")
+        print(f"[+] Total internships fetched: {len(self.internships)} "
+              f"({parsed} parsed, {reused} unchanged, {newly_closed} closed)")
+        return True
+
     def save_to_json(self, filename='2026_internships.json'):
         """Save internships to a JSON file"""
         # Save to project root directory
@@ -205,20 +467,27 @@ class InternshipFetcher:
             'metadata': {
                 'total_count': len(self.internships),
                 'date_fetched': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'readme_sha256': self.readme_sha,
+                'closed_count': len(self.closed_internships),
+                'refresh': self.stats,
                 'source': '2026-SWE-College-Jobs Repository',
-                'repository_url': 'https://github.com/speedyapply/2026-SWE-College-Jobs',
+                'repository_url': self.repo_url[:-len('.git')] if self.repo_url.endswith('.git') else self.repo_url,
                 'categories': {
                     'FAANG+': len([i for i in self.internships if i['category'] == 'FAANG+']),
                     'Quant': len([i for i in self.internships if i['category'] == 'Quant']),
                     'Other': len([i for i in self.internships if i['category'] == 'Other'])
                 }
             },
-            'internships': self.internships
+            'internships': self.internships,
+            'closed_internships': self.closed_internships
         }
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Write to a temp file and swap it in, so readers never see a partial file
+            tmp_path = f"{filepath}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(output_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, filepath)
             print(f"\n[+] Internships saved to {filepath}")
             return True
         except Exception as e:
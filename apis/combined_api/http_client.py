@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the scrapers
+Wraps a keep-alive requests.Session with per-host concurrency limits,
+retries with jittered exponential backoff, gzip negotiation and latency metrics
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests import RequestException  # raised by client calls; callers catch it from here
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate'
+}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HostMetrics:
+    """Request counters and latency totals for one host"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def to_dict(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'avg_ms': round(self.total_seconds / self.requests * 1000, 1) if self.requests else 0.0,
+            'max_ms': round(self.max_seconds * 1000, 1)
+        }
+
+
+class HttpClient:
+    """
+    Pooled HTTP client shared by every scraper
+
+    Args:
+        pool_size: Keep-alive connections kept per host
+        max_per_host: Concurrent in-flight requests allowed per host
+        retries: Extra attempts on connection errors and retryable statuses
+        backoff: Base delay in seconds for the exponential backoff
+        timeout: Default request timeout in seconds
+    """
+
+    def __init__(self, pool_size=10, max_per_host=6, retries=2, backoff=0.5, timeout=10):
+        self.max_per_host = max_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._host_limits = {}
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _host_state(self, host):
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+                self._metrics[host] = HostMetrics()
+            return self._host_limits[host], self._metrics[host]
+
+    def _sleep_before_retry(self, attempt):
+        delay = self.backoff * (2 ** attempt)
+        time.sleep(random.uniform(0, delay))
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request through the shared pool
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            requests.Response (retryable statuses are returned after the last attempt)
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        limit, metrics = self._host_state(urlsplit(url).netloc)
+
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                with limit:
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    metrics.requests += 1
+                    metrics.errors += 1
+                    metrics.total_seconds += elapsed
+                    metrics.max_seconds = max(metrics.max_seconds, elapsed)
+                if attempt == self.retries:
+                    raise
+            else:
+                elapsed = time.perf_counter() - start
+                retry = response.status_code in RETRY_STATUSES and attempt < self.retries
+                with self._lock:
+                    metrics.requests += 1
+                    metrics.errors += response.status_code >= 400
+                    metrics.total_seconds += elapsed
+                    metrics.max_seconds = max(metrics.max_seconds, elapsed)
+                if not retry:
+                    return response
+                response.close()
+
+            with self._lock:
+                metrics.retries += 1
+            self._sleep_before_retry(attempt)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def get_json(self, url, **kwargs):
+        """GET a URL, raise on HTTP errors and return the decoded JSON body"""
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def metrics(self):
+        """Per-host request metrics"""
+        with self._lock:
+            return {host: m.to_dict() for host, m in self._metrics.items()}
+
+
+client = HttpClient()
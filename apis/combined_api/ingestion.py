@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Multi-source internship ingestion
+Each source fetches its listings and normalizes them to the 2026_internships.json
+schema; sources run concurrently with their own timeouts and are merged and
+deduplicated into the one dataset served by the API. A source that fails or times
+out keeps its listings from the previous dataset instead of stalling the refresh
+
+Usage:
+    python -m combined_api.ingestion --source speedyapply --source stem_curated
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .fetch_and_clone_internships import InternshipFetcher, row_key
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_FILE = os.path.join(os.path.dirname(os.path.dirname(BASE_DIR)), '2026_internships.json')
+
+# Served schema; every normalized record has at least these fields
+FIELDS = ['company', 'company_url', 'position', 'location', 'salary', 'apply_link', 'age',
+          'category', 'date_fetched']
+# Placeholder values some scrapers use for missing data
+MISSING = {'Not available', 'Not specified'}
+
+
+def normalize(record, source, category='Other'):
+    """
+    Map a scraper record onto the served schema
+
+    Args:
+        record: Raw record (role/date_found or position/date_fetched style)
+        source: Name of the source it came from
+        category: Category to use when the record has none
+
+    Returns:
+        Normalized copy with every FIELDS key, status and source set
+    """
+    internship = dict(record)
+    if 'role' in internship:
+        internship.setdefault('position', internship.pop('role'))
+    if 'date_found' in internship:
+        internship.setdefault('date_fetched', internship.pop('date_found'))
+    internship.pop('source', None)
+
+    for field in FIELDS:
+        value = internship.get(field)
+        internship[field] = '' if value is None or value in MISSING else value
+    if not internship['category']:
+        internship['category'] = category
+    internship.setdefault('status', 'open')
+    internship['source'] = source
+    return internship
+
+
+def merge_key(internship):
+    """Identity used to spot the same listing reported by two sources"""
+    return tuple(internship.get(field, '').strip().lower() for field in ('company', 'position', 'location'))
+
+
+class Source:
+    """
+    One place internships come from
+
+    Subclasses implement fetch(previous) and return raw records; previous is this
+    source's part of the last saved dataset. Anything extra worth keeping in the
+    dataset metadata goes in self.metadata
+
+    Args:
+        timeout: Seconds the source may take before its previous listings are reused
+    """
+
+    name = None
+    category = 'Other'
+    timeout = 30
+
+    def __init__(self, timeout=None):
+        if timeout is not None:
+            self.timeout = timeout
+        self.metadata = {}
+
+    def fetch(self, previous):
+        raise NotImplementedError
+
+    def records(self, previous):
+        return [normalize(record, self.name, self.category) for record in self.fetch(previous)]
+
+
+class SpeedyapplySource(Source):
+    """speedyapply/2026-SWE-College-Jobs README, with incremental refresh and closed tracking"""
+
+    name = 'speedyapply'
+    timeout = 120
+
+    def fetch(self, previous):
+        fetcher = InternshipFetcher()
+        if not fetcher.clone_or_update_repo():
+            raise RuntimeError('Failed to update repository')
+        if not fetcher.fetch_internships(previous=previous):
+            raise RuntimeError('Failed to fetch internships')
+
+        self.metadata = {
+            'readme_sha256': fetcher.readme_sha,
+            'refresh': fetcher.stats,
+            'repository_url': fetcher.repo_url[:-len('.git')] if fetcher.repo_url.endswith('.git') else fetcher.repo_url,
+            'closed_internships': fetcher.closed_internships
+        }
+        return fetcher.internships
+
+
+class ScraperSource(Source):
+    """
+    Records collected by one InternshipScraper method
+    The scraper methods log and swallow their errors, so a method reporting False
+    or collecting nothing counts as a failure and the previous listings are kept
+    """
+
+    method = None
+
+    def fetch(self, previous):
+        from .internship_scraper import InternshipScraper
+
+        scraper = InternshipScraper()
+        if getattr(scraper, self.method)() is False:
+            raise RuntimeError(f'{self.method} failed')
+        if not scraper.internships:
+            raise RuntimeError(f'{self.method} returned no internships')
+        return scraper.internships
+
+
+class SimplifyGithubSource(ScraperSource):
+    name = 'simplify_github'
+    method = 'scrape_github_internships'
+
+
+class SimplifySamplesSource(ScraperSource):
+    name = 'simplify_samples'
+    method = 'scrape_simplify_jobs'
+    timeout = 5
+
+
+class StemCuratedSource(ScraperSource):
+    name = 'stem_curated'
+    method = 'add_stem_internships'
+    category = 'STEM'
+    timeout = 5
+
+
+# Merge priority: when two sources list the same internship the earlier one wins
+DEFAULT_SOURCES = [SpeedyapplySource, SimplifyGithubSource, SimplifySamplesSource, StemCuratedSource]
+
+
+class IngestionPipeline:
+    """
+    Runs sources concurrently and merges them into one internships dataset
+
+    Args:
+        sources: Source instances, in merge priority order (default: DEFAULT_SOURCES)
+        output_file: Dataset to read as the baseline and write the merge to
+    """
+
+    def __init__(self, sources=None, output_file=OUTPUT_FILE):
+        self.sources = sources if sources is not None else [source() for source in DEFAULT_SOURCES]
+        self.output_file = output_file
+
+    def load_previous(self):
+        try:
+            with open(self.output_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def previous_for(self, source, previous):
+        """This source's slice of the last dataset (unlabelled records predate ingestion and are speedyapply's)"""
+        def owned(internship):
+            return internship.get('source', SpeedyapplySource.name) == source.name
+
+        return {
+            'metadata': previous.get('metadata', {}),
+            'internships': [i for i in previous.get('internships', []) if owned(i)],
+            'closed_internships': [i for i in previous.get('closed_internships', []) if owned(i)]
+        }
+
+    def fetch_all(self, previous, progress=None):
+        """
+        Run every source at once; each gets its own deadline from the common start
+
+        Returns:
+            {source name: (records, report)}; records is None if the source failed
+        """
+        results = {}
+        finished = {}
+        executor = ThreadPoolExecutor(max_workers=len(self.sources) or 1, thread_name_prefix='ingest')
+        start = time.monotonic()
+        futures = [
+            (source, executor.submit(source.records, self.previous_for(source, previous)))
+            for source in self.sources
+        ]
+        for source, future in futures:
+            future.add_done_callback(lambda _, name=source.name: finished.setdefault(name, time.monotonic()))
+
+        try:
+            for source, future in sorted(futures, key=lambda item: item[0].timeout):
+                records, report = None, {'status': 'ok', 'error': None}
+                try:
+                    records = future.result(timeout=max(0.0, start + source.timeout - time.monotonic()))
+                except TimeoutError:
+                    report = {'status': 'timeout', 'error': f'No result within {source.timeout}s'}
+                except Exception as e:
+                    report = {'status': 'failed', 'error': str(e)}
+
+                report['seconds'] = round(finished.get(source.name, time.monotonic()) - start, 3)
+                report['count'] = len(records) if records is not None else 0
+                results[source.name] = (records, report)
+
+                if records is None:
+                    print(f"[!] Source {source.name} {report['status']}: {report['error']}")
+                else:
+                    print(f"[+] Source {source.name}: {len(records)} internships in {report['seconds']}s")
+                if progress:
+                    progress(f"Fetched {len(results)}/{len(self.sources)} sources")
+        finally:
+            # A timed-out source keeps its thread; don't wait for it
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def run(self, progress=None):
+        """
+        Fetch every source and merge the results
+
+        Args:
+            progress: Optional callable taking a status message
+
+        Returns:
+            Dataset dictionary in the 2026_internships.json format
+        """
+        previous = self.load_previous()
+        results = self.fetch_all(previous, progress)
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        first_seen = {}
+        for internship in previous.get('closed_internships', []) + previous.get('internships', []):
+            first_seen.setdefault((internship.get('source', SpeedyapplySource.name), row_key(internship)),
+                                  internship.get('date_fetched'))
+
+        internships = []
+        closed_internships = []
+        claimed = {}
+        reports = {}
+        duplicates = 0
+        for source in self.sources:
+            records, report = results[source.name]
+            slice_ = self.previous_for(source, previous)
+            if records is None:
+                # Keep serving what this source last returned
+                records = slice_['internships']
+                report['stale'] = bool(records)
+                closed_internships.extend(slice_['closed_internships'])
+            else:
+                closed_internships.extend(source.metadata.get('closed_internships', []))
+
+            seen = set()
+            served = 0
+            for internship in records:
+                key = row_key(internship)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                owner = claimed.setdefault(merge_key(internship), source.name)
+                if owner != source.name:
+                    duplicates += 1
+                    continue
+
+                internship['date_fetched'] = first_seen.get((source.name, key)) or internship['date_fetched'] or now
+                internships.append(internship)
+                served += 1
+            report['served'] = served
+            reports[source.name] = report
+
+        # Sources left out of this run keep their listings as they were
+        running = {source.name for source in self.sources}
+        for internship in previous.get('internships', []):
+            owner = internship.get('source', SpeedyapplySource.name)
+            if owner not in running and claimed.setdefault(merge_key(internship), owner) == owner:
+                internships.append(internship)
+        closed_internships.extend(
+            i for i in previous.get('closed_internships', [])
+            if i.get('source', SpeedyapplySource.name) not in running
+        )
+
+        speedyapply = next((s for s in self.sources if s.name == SpeedyapplySource.name), None)
+        speedyapply_meta = speedyapply.metadata if speedyapply else {}
+        previous_meta = previous.get('metadata', {})
+
+        categories = {}
+        for internship in internships:
+            category = internship.get('category', '')
+            categories[category] = categories.get(category, 0) + 1
+
+        return {
+            'metadata': {
+                'total_count': len(internships),
+                'date_fetched': now,
+                'readme_sha256': speedyapply_meta.get('readme_sha256', previous_meta.get('readme_sha256')),
+                'closed_count': len(closed_internships),
+                'refresh': speedyapply_meta.get('refresh', {}),
+                'source': 'Multi-source ingestion',
+                'repository_url': speedyapply_meta.get('repository_url', previous_meta.get('repository_url', '')),
+                'categories': categories,
+                'sources': reports,
+                'duplicates_dropped': duplicates
+            },
+            'internships': internships,
+            'closed_internships': closed_internships
+        }
+
+    def save(self, data):
+        """Write the dataset atomically, so readers never see a partial file"""
+        tmp_path = f"{self.output_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.output_file)
+        print(f"[+] {data['metadata']['total_count']} internships saved to {self.output_file}")
+
+
+def main():
+    names = [source.name for source in DEFAULT_SOURCES]
+    parser = argparse.ArgumentParser(description='Refresh the internships dataset from every source')
+    parser.add_argument('--source', action='append', choices=names, default=[],
+                        help='Only run this source (repeatable); others keep their previous listings')
+    parser.add_argument('--timeout', type=float, default=None, help='Override every source timeout (seconds)')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='Dataset to merge into')
+    args = parser.parse_args()
+
+    selected = set(args.source or names)
+    sources = [source(args.timeout) for source in DEFAULT_SOURCES if source.name in selected]
+    pipeline = IngestionPipeline(sources, args.output)
+    data = pipeline.run()
+    pipeline.save(data)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Cached resolver from institution names to assist.org institution IDs
+The catalog is downloaded once, kept as a name -> id map covering every alias,
+persisted to a local cache file and refreshed in the background once stale;
+failed downloads are retried with exponential backoff
+"""
+
+import json
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+from .http_client import client as http_client
+
+# Point every assist.org client at another host (e.g. the assist_stub server)
+ASSIST_BASE_URL = os.getenv('ASSIST_BASE_URL', 'https://www.assist.org').rstrip('/')
+INSTITUTIONS_URL = f'{ASSIST_BASE_URL}/api/institutions'
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+CACHE_FILE = os.path.join(CACHE_DIR, 'institutions.json')
+if urlparse(ASSIST_BASE_URL).netloc != 'www.assist.org':
+    # Keep a stand-in server's catalog apart from the real one
+    CACHE_FILE = os.path.join(CACHE_DIR, f"institutions-{urlparse(ASSIST_BASE_URL).netloc.replace(':', '_')}.json")
+CACHE_TTL = 24 * 60 * 60
+# First retry after a failed download; doubles per consecutive failure, up to the TTL
+RETRY_AFTER = 60
+
+
+def build_name_map(institutions):
+    """Map every lowercased alias in each institution's 'names' to its ID"""
+    name_map = {}
+    for inst in institutions:
+        inst_id = inst.get('id')
+        for name_obj in inst.get('names', []):
+            name = name_obj.get('name', '').lower()
+            # First match wins, same as the original linear scan
+            if name and name not in name_map:
+                name_map[name] = inst_id
+    return name_map
+
+
+class InstitutionResolver:
+    """
+    Resolve institution names to assist.org IDs without a request-path download
+
+    Args:
+        url: Institutions catalog endpoint
+        cache_file: JSON file the name map is persisted to
+        ttl: Seconds before the map is refreshed in the background
+        retry_after: Seconds before the first retry of a failed download
+    """
+
+    def __init__(self, url=INSTITUTIONS_URL, cache_file=CACHE_FILE, ttl=CACHE_TTL, retry_after=RETRY_AFTER):
+        self.url = url
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.name_map = None
+        self.fetched_at = 0.0
+        # No download is attempted before this time (time.time())
+        self.next_attempt = 0.0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def fetch_catalog(self):
+        return http_client.get_json(self.url, timeout=10)
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            self.name_map = cached['names']
+            self.fetched_at = cached['fetched_at']
+            self.next_attempt = self.fetched_at + self.ttl
+            return True
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def _save_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': self.fetched_at, 'names': self.name_map}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"[!] Could not write institution cache {self.cache_file}: {e}")
+
+    def refresh(self):
+        """
+        Download the catalog and swap in a new name map; returns True on success
+        On failure the next attempt is pushed back, doubling with each failure in a row
+        """
+        try:
+            name_map = build_name_map(self.fetch_catalog())
+        except Exception as e:
+            self.failures += 1
+            backoff = min(self.retry_after * 2 ** (self.failures - 1), self.ttl)
+            self.next_attempt = time.time() + backoff
+            print(f"[!] Could not refresh institution catalog: {e} (retrying in {backoff}s)")
+            return False
+
+        self.name_map = name_map
+        self.fetched_at = time.time()
+        self.next_attempt = self.fetched_at + self.ttl
+        self.failures = 0
+        self._save_cache()
+        return True
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name='institution-refresh', daemon=True).start()
+
+    def _ensure_loaded(self):
+        if self.name_map is not None:
+            return
+        with self._lock:
+            if self.name_map is None and not self._load_cache() and time.time() >= self.next_attempt:
+                # Nothing cached yet: the first lookup of each retry window waits for the download
+                self.refresh()
+
+    def resolve(self, name):
+        """
+        Get the assist.org ID for an institution name
+
+        Args:
+            name: Institution name (any alias, case-insensitive)
+
+        Returns:
+            Institution ID or None
+        """
+        self._ensure_loaded()
+        if self.name_map is None:
+            return None
+
+        if time.time() >= self.next_attempt:
+            self._refresh_in_background()
+
+        return self.name_map.get(name.strip().lower())
+
+
+resolver = InstitutionResolver()
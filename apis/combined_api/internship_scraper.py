@@ -1,9 +1,10 @@
-import requests
 from bs4 import BeautifulSoup
 import json
 from datetime import datetime
 import time
 
+from .http_client import client as http_client
+
 # STEM majors to focus on
 STEM_MAJORS = [
     "Computer Science",
@@ -34,6 +35,9 @@ class InternshipScraper:
         """
         Scrapes the popular GitHub repository that maintains a list of tech internships
         https://github.com/pittcsc/Summer2025-Internships
+
+        Returns:
+            False if the README could not be fetched or parsed, True otherwise
         """
         print("[*] Scraping GitHub internship repository...")
 
@@ -41,7 +45,7 @@ class InternshipScraper:
         url = "https://api.github.com/repos/SimplifyJobs/Summer2025-Internships/readme"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = http_client.get(url, headers=self.headers)
             if response.status_code == 200:
                 # Parse the README content
                 import base64
@@ -101,9 +105,14 @@ class InternshipScraper:
                                 self.internships.append(internship)
 
                 print(f"[+] Found {len([i for i in self.internships if i['source'] == 'GitHub Repo'])} internships from GitHub")
+                return True
+
+            print(f"[!] Error scraping GitHub: HTTP {response.status_code}")
+            return False
 
         except Exception as e:
             print(f"[!] Error scraping GitHub: {e}")
+            return False
 
     def scrape_simplify_jobs(self):
         """
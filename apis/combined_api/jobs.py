@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Background job runner for long-running API work such as dataset refreshes
+Jobs run on a small thread pool off the request path; a job of a kind that is
+already queued or running is reused instead of started twice, and each job
+records its progress and per-step timings for /api/jobs/<id>
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+MAX_WORKERS = 2
+MAX_FINISHED_JOBS = 100
+
+
+class Job:
+    """State of one background job"""
+
+    def __init__(self, kind):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = 'queued'
+        self.message = 'Waiting for a worker'
+        self.steps = []
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.done = threading.Event()
+
+    @property
+    def active(self):
+        return self.status in ('queued', 'running')
+
+    def update(self, message):
+        """Set the human-readable progress message"""
+        self.message = message
+
+    @contextmanager
+    def step(self, name):
+        """Time one stage of the job; the stage name doubles as the progress message"""
+        entry = {'step': name, 'seconds': None, 'ok': True}
+        self.steps.append(entry)
+        self.message = name
+        start = time.perf_counter()
+        try:
+            yield entry
+        except Exception:
+            entry['ok'] = False
+            raise
+        finally:
+            entry['seconds'] = round(time.perf_counter() - start, 3)
+
+    def to_dict(self):
+        def timestamp(value):
+            return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(value)) if value else None
+
+        end = self.finished_at or time.time()
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'message': self.message,
+            'steps': list(self.steps),
+            'result': self.result,
+            'error': self.error,
+            'created_at': timestamp(self.created_at),
+            'started_at': timestamp(self.started_at),
+            'finished_at': timestamp(self.finished_at),
+            'queued_seconds': round((self.started_at or end) - self.created_at, 3),
+            'run_seconds': round(end - self.started_at, 3) if self.started_at else None
+        }
+
+
+class JobRunner:
+    """
+    Runs job functions on a thread pool, one active job per kind
+
+    Args:
+        max_workers: Jobs allowed to run at the same time
+        max_finished: Finished jobs kept for status lookups
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS, max_finished=MAX_FINISHED_JOBS):
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = OrderedDict()
+        self._active = {}
+        self._lock = threading.Lock()
+
+    def _run(self, job, fn):
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            job.result = fn(job)
+            job.status = 'succeeded'
+            job.message = 'Done'
+        except Exception as e:
+            job.status = 'failed'
+            job.error = str(e)
+            job.message = 'Failed'
+            print(f"[!] Job {job.kind} {job.id} failed: {e}")
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if self._active.get(job.kind) is job:
+                    del self._active[job.kind]
+            job.done.set()
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def submit(self, kind, fn):
+        """
+        Start fn(job) in the background unless a job of the same kind is active
+
+        Returns:
+            (job, created) where created is False if an active job was reused
+        """
+        with self._lock:
+            job = self._active.get(kind)
+            if job is not None:
+                return job, False
+
+            job = Job(kind)
+            self._jobs[job.id] = job
+            self._active[kind] = job
+            self._prune()
+
+        self._executor.submit(self._run, job, fn)
+        return job, True
+
+    def get(self, job_id):
+        """Job by ID, or None if unknown or already pruned"""
+        return self._jobs.get(job_id)
+
+
+runner = JobRunner()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Prebuilt query engine for internship filters
+Exact-match fields use posting lists, substring fields use an n-gram index over
+their distinct values, and filters are combined by set intersection
+"""
+
+NGRAM_SIZE = 3
+
+
+class SubstringIndex:
+    """Case-insensitive substring lookup over one field of a record list"""
+
+    def __init__(self, values, n=NGRAM_SIZE):
+        self.n = n
+        self.rows_by_value = {}
+        self.grams = {}
+
+        for row_id, value in enumerate(values):
+            self.rows_by_value.setdefault((value or '').lower(), []).append(row_id)
+
+        for value in self.rows_by_value:
+            for i in range(len(value) - n + 1):
+                self.grams.setdefault(value[i:i + n], set()).add(value)
+
+    def _candidate_values(self, query):
+        if len(query) < self.n:
+            return self.rows_by_value.keys()
+
+        postings = []
+        for i in range(len(query) - self.n + 1):
+            values = self.grams.get(query[i:i + self.n])
+            if not values:
+                return ()
+            postings.append(values)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for values in postings[1:]:
+            candidates &= values
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query):
+        """Return the set of row ids whose value contains query (already lowercased)"""
+        rows = set()
+        for value in self._candidate_values(query):
+            # n-grams only narrow the candidates; confirm the actual substring
+            if query in value:
+                rows.update(self.rows_by_value[value])
+        return rows
+
+
+class InternshipQueryEngine:
+    """
+    Filter index over the internship records of one dataset snapshot
+
+    Args:
+        internships: List of internship dictionaries, in serving order
+    """
+
+    def __init__(self, internships):
+        self.internships = internships
+        self.by_category = {}
+        for row_id, internship in enumerate(internships):
+            key = internship.get('category', '').lower()
+            self.by_category.setdefault(key, set()).add(row_id)
+
+        self.company = SubstringIndex([i.get('company', '') for i in internships])
+        self.location = SubstringIndex([i.get('location', '') for i in internships])
+
+    def query(self, category='', company='', location=''):
+        """
+        Return the internships matching every non-empty filter
+
+        Args:
+            category: Exact category match (case-insensitive)
+            company: Substring of the company name (lowercase)
+            location: Substring of the location (lowercase)
+
+        Returns:
+            List of matching internships in their original order
+        """
+        if not (category or company or location):
+            return self.internships
+
+        postings = []
+        if category:
+            postings.append(self.by_category.get(category.lower(), set()))
+        if company:
+            postings.append(self.company.search(company))
+        if location:
+            postings.append(self.location.search(location))
+
+        postings.sort(key=len)
+        rows = set(postings[0])
+        for posting in postings[1:]:
+            rows &= posting
+
+        return [self.internships[row_id] for row_id in sorted(rows)]
+
+
+def build_internship_query_engine(data):
+    """DatasetStore builder for the internships dataset"""
+    return InternshipQueryEngine(data.get('internships', []))
@@ -1,10 +1,19 @@
-import requests
 from bs4 import BeautifulSoup
 import json
-from playwright.sync_api import sync_playwright
-import time
 
-def scrape_assist_org_with_javascript(url="https://www.assist.org"):
+from .institutions import ASSIST_BASE_URL, resolver as institution_resolver
+from .agreements import agreements_cache
+from .http_client import RequestException, client as http_client
+from .browser_pool import get_pool
+from .waits import (
+    timer_for,
+    wait_for_count_stable,
+    wait_for_options,
+    wait_for_options_closed,
+    wait_for_selector,
+)
+
+def scrape_assist_org_with_javascript(url=ASSIST_BASE_URL):
     """
     Scrape assist.org using Playwright to handle JavaScript rendering
     
@@ -15,28 +24,24 @@ def scrape_assist_org_with_javascript(url="https://www.assist.org"):
         Dictionary containing scraped data
     """
     
+    def render(page):
+        page.goto(url, wait_until='networkidle')
+        return page.content()
+    
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle')
-            time.sleep(2)
-            
-            html = page.content()
-            browser.close()
-        
+        html = get_pool().run(render)
         return scrape_from_html(html)
     
     except Exception as e:
         return {'error': f'Failed to scrape {url}: {str(e)}'}
 
-def scrape_assist_org_with_selenium(url="https://www.assist.org"):
+def scrape_assist_org_with_selenium(url=ASSIST_BASE_URL):
     """
     Alias for scrape_assist_org_with_javascript
     """
     return scrape_assist_org_with_javascript(url)
 
-def get_institutions_list(url="https://www.assist.org"):
+def get_institutions_list(url=ASSIST_BASE_URL):
     """
     Get the list of academic institutions from assist.org dropdowns
     
@@ -47,45 +52,44 @@ def get_institutions_list(url="https://www.assist.org"):
         Dictionary containing institution lists for different categories
     """
     
+    def collect(page):
+        page.goto(url, wait_until='networkidle')
+        
+        institutions = {
+            'from_institution': [],
+            'transfer_institution': []
+        }
+        
+        try:
+            wait_for_selector(page, '#None-governing-institution-select', 'from dropdown visible')
+            page.click('#None-governing-institution-select')
+            wait_for_options(page, 'from options loaded')
+            options = page.query_selector_all('ul[role="listbox"] li, .ng-option, [role="option"]')
+            for option in options:
+                text = option.inner_text().strip()
+                if text and len(text) > 0 and not text.startswith('link') and not 'Don\'t see' in text:
+                    institutions['from_institution'].append(text)
+        except Exception as e:
+            pass
+        
+        try:
+            page.keyboard.press('Escape')
+            page.reload(wait_until='networkidle')
+            wait_for_selector(page, '#institution', 'transfer dropdown visible')
+            page.click('#institution')
+            wait_for_options(page, 'transfer options loaded')
+            options = page.query_selector_all('ul[role="listbox"] li, .ng-option, [role="option"]')
+            for option in options:
+                text = option.inner_text().strip()
+                if text and len(text) > 0 and not text.startswith('link') and not 'Don\'t see' in text:
+                    institutions['transfer_institution'].append(text)
+        except Exception as e:
+            pass
+        
+        return institutions
+    
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle')
-            time.sleep(2)
-            
-            institutions = {
-                'from_institution': [],
-                'transfer_institution': []
-            }
-            
-            try:
-                page.click('#None-governing-institution-select')
-                time.sleep(1.5)
-                options = page.query_selector_all('ul[role="listbox"] li, .ng-option, [role="option"]')
-                for option in options:
-                    text = option.inner_text().strip()
-                    if text and len(text) > 0 and not text.startswith('link') and not 'Don\'t see' in text:
-                        institutions['from_institution'].append(text)
-            except Exception as e:
-                pass
-            
-            try:
-                page.keyboard.press('Escape')
-                time.sleep(1)
-                page.reload(wait_until='networkidle')
-                time.sleep(2)
-                page.click('#institution')
-                time.sleep(2)
-                options = page.query_selector_all('ul[role="listbox"] li, .ng-option, [role="option"]')
-                for option in options:
-                    text = option.inner_text().strip()
-                    if text and len(text) > 0 and not text.startswith('link') and not 'Don\'t see' in text:
-                        institutions['transfer_institution'].append(text)
-            except Exception as e:
-                pass
-            
-            browser.close()
+        institutions = get_pool().run(collect)
         
         institutions['from_institution'] = list(dict.fromkeys(institutions['from_institution']))
         institutions['transfer_institution'] = list(dict.fromkeys(institutions['transfer_institution']))
@@ -95,7 +99,7 @@ def get_institutions_list(url="https://www.assist.org"):
     except Exception as e:
         return {'error': f'Failed to get institutions: {str(e)}'}
 
-def scrape_assist_org(url="https://www.assist.org"):
+def scrape_assist_org(url=ASSIST_BASE_URL):
     """
     Simple webscraper for assist.org (static content)
     
@@ -111,7 +115,7 @@ def scrape_assist_org(url="https://www.assist.org"):
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, headers=headers, timeout=10)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -159,7 +163,7 @@ def scrape_assist_org(url="https://www.assist.org"):
         
         return data
     
-    except requests.exceptions.RequestException as e:
+    except RequestException as e:
         return {'error': f'Failed to fetch {url}: {str(e)}'}
 
 def scrape_from_html(html_content):
@@ -218,7 +222,7 @@ def scrape_from_html(html_content):
 
 def get_institution_id(name):
     """
-    Get institution ID from assist.org API
+    Get institution ID from the cached assist.org institution catalog
     
     Args:
         name: Institution name
@@ -227,21 +231,78 @@ def get_institution_id(name):
         Institution ID or None
     """
     try:
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get('https://www.assist.org/api/institutions', headers=headers, timeout=10)
-        response.raise_for_status()
-        institutions = response.json()
-        
-        for inst in institutions:
-            inst_names = inst.get('names', [])
-            for name_obj in inst_names:
-                if name_obj.get('name', '').lower() == name.lower():
-                    return inst.get('id')
-        
-        return None
+        return institution_resolver.resolve(name)
     except Exception as e:
         return None
 
+def new_articulation_result(from_school, to_school, from_id, to_id):
+    """
+    Start an articulation result for a resolved school pair
+    
+    Returns:
+        Result dictionary, with 'error' set if either ID is missing
+    """
+    result = {
+        'from_school': from_school,
+        'to_school': to_school,
+        'from_id': from_id,
+        'to_id': to_id,
+        'agreements': [],
+        'error': None
+    }
+    
+    if not from_id or not to_id:
+        result['error'] = f'Could not find institution IDs. From: {from_id}, To: {to_id}'
+    
+    return result
+
+def add_agreements(result, cached, debug=False):
+    """
+    Fill result['agreements'] from the receiving institution's cached agreements
+    
+    Args:
+        result: Dictionary from new_articulation_result
+        cached: AgreementsEntry for result['to_id']
+        debug: If True, include additional debugging info
+    """
+    from_id = result['from_id']
+    to_id = result['to_id']
+    
+    if debug:
+        result['all_agreements_count'] = cached.total
+        result['agreements_cache_age'] = round(cached.age, 1)
+    
+    seen_institution_ids = set()
+    for agreement in cached.by_sender.get(from_id, []):
+        inst_id = agreement.get('institutionParentId')
+        if inst_id not in seen_institution_ids:
+            seen_institution_ids.add(inst_id)
+            result['agreements'].append({
+                'institution_name': agreement.get('institutionName'),
+                'institution_code': agreement.get('code'),
+                'is_community_college': agreement.get('isCommunityCollege'),
+                'sending_year_ids': agreement.get('sendingYearIds'),
+                'receiving_year_ids': agreement.get('receivingYearIds'),
+                'from_id': from_id,
+                'to_id': to_id
+            })
+
+def add_agreement_courses(result):
+    """
+    Fetch the course list of the first agreement into result['courses']
+    """
+    if result['agreements'] and result['agreements'][0].get('id'):
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        agreement_id = result['agreements'][0]['id']
+        courses_url = f'{ASSIST_BASE_URL}/api/agreements/{agreement_id}/courses'
+        try:
+            courses_response = http_client.get(courses_url, headers=headers, timeout=10)
+            courses_response.raise_for_status()
+            courses = courses_response.json()
+            result['courses'] = courses
+        except Exception as e:
+            result['courses_error'] = str(e)
+
 def scrape_transfer_articulation(from_school, to_school, debug=False):
     """
     Get transfer articulation data from assist.org API
@@ -256,58 +317,15 @@ def scrape_transfer_articulation(from_school, to_school, debug=False):
     """
     
     try:
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        
         from_id = get_institution_id(from_school)
         to_id = get_institution_id(to_school)
         
-        result = {
-            'from_school': from_school,
-            'to_school': to_school,
-            'from_id': from_id,
-            'to_id': to_id,
-            'agreements': [],
-            'error': None
-        }
-        
-        if not from_id or not to_id:
-            result['error'] = f'Could not find institution IDs. From: {from_id}, To: {to_id}'
+        result = new_articulation_result(from_school, to_school, from_id, to_id)
+        if result['error']:
             return result
         
-        agreements_url = f'https://www.assist.org/api/institutions/{to_id}/agreements'
-        response = requests.get(agreements_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        agreements = response.json()
-        
-        if debug:
-            result['all_agreements_count'] = len(agreements)
-        
-        seen_institution_ids = set()
-        for agreement in agreements:
-            if agreement.get('institutionParentId') == from_id:
-                inst_id = agreement.get('institutionParentId')
-                if inst_id not in seen_institution_ids:
-                    seen_institution_ids.add(inst_id)
-                    result['agreements'].append({
-                        'institution_name': agreement.get('institutionName'),
-                        'institution_code': agreement.get('code'),
-                        'is_community_college': agreement.get('isCommunityCollege'),
-                        'sending_year_ids': agreement.get('sendingYearIds'),
-                        'receiving_year_ids': agreement.get('receivingYearIds'),
-                        'from_id': from_id,
-                        'to_id': to_id
-                    })
-        
-        if result['agreements'] and result['agreements'][0].get('id'):
-            agreement_id = result['agreements'][0]['id']
-            courses_url = f'https://www.assist.org/api/agreements/{agreement_id}/courses'
-            try:
-                courses_response = requests.get(courses_url, headers=headers, timeout=10)
-                courses_response.raise_for_status()
-                courses = courses_response.json()
-                result['courses'] = courses
-            except Exception as e:
-                result['courses_error'] = str(e)
+        add_agreements(result, agreements_cache.get(to_id), debug=debug)
+        add_agreement_courses(result)
         
         return result
     
@@ -329,154 +347,141 @@ def scrape_course_articulation(from_school, to_school, year_name="2025-2026", de
         Dictionary containing course articulation data
     """
     
-    def attempt_scrape():
+    def scrape_page(page):
+        page.goto(ASSIST_BASE_URL, wait_until='domcontentloaded')
+        
+        result = {
+            'from_school': from_school,
+            'to_school': to_school,
+            'year': year_name,
+            'courses': [],
+            'error': None,
+            'debug_info': {}
+        }
+        
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.set_default_timeout(15000)
-                page.goto("https://www.assist.org", wait_until='domcontentloaded')
-                time.sleep(2)
-                
-                result = {
-                    'from_school': from_school,
-                    'to_school': to_school,
-                    'year': year_name,
-                    'courses': [],
-                    'error': None,
-                    'debug_info': {}
-                }
+            wait_for_selector(page, 'ng-select', 'institution selects rendered')
+            ng_selects = page.query_selector_all('ng-select')
+            
+            if debug:
+                result['debug_info']['ng_selects_found'] = len(ng_selects)
+            
+            if len(ng_selects) >= 2:
+                to_selector = ng_selects[1]
+                from_selector = ng_selects[0]
                 
                 try:
-                    page.wait_for_selector('ng-select', timeout=15000)
-                    ng_selects = page.query_selector_all('ng-select')
-                    
-                    if debug:
-                        result['debug_info']['ng_selects_found'] = len(ng_selects)
+                    to_input = to_selector.query_selector('input[type="search"]')
+                    if not to_input:
+                        to_input = to_selector.query_selector('input')
                     
-                    if len(ng_selects) >= 2:
-                        to_selector = ng_selects[1]
-                        from_selector = ng_selects[0]
-                        
-                        try:
-                            to_input = to_selector.query_selector('input[type="search"]')
-                            if not to_input:
-                                to_input = to_selector.query_selector('input')
-                            
-                            if to_input:
-                                to_input.click(timeout=5000)
-                                time.sleep(0.5)
-                                to_input.fill("")
-                                to_input.fill(to_school)
-                                time.sleep(1)
-                                
-                                page.wait_for_selector('[role="option"]', timeout=8000)
-                                options = page.query_selector_all('[role="option"]')
-                                if options:
-                                    options[0].click(timeout=5000)
-                                    time.sleep(1.5)
-                        except Exception as e:
-                            if debug:
-                                result['debug_info']['to_school_error'] = str(e)
+                    if to_input:
+                        to_input.click(timeout=5000)
+                        to_input.fill("")
+                        to_input.fill(to_school)
                         
-                        try:
-                            from_input = from_selector.query_selector('input[type="search"]')
-                            if not from_input:
-                                from_input = from_selector.query_selector('input')
-                            
-                            if from_input:
-                                from_input.click(timeout=5000)
-                                time.sleep(0.5)
-                                from_input.fill("")
-                                from_input.fill(from_school)
-                                time.sleep(1)
-                                
-                                page.wait_for_selector('[role="option"]', timeout=8000)
-                                options = page.query_selector_all('[role="option"]')
-                                if options:
-                                    options[0].click(timeout=5000)
-                                    time.sleep(1.5)
-                        except Exception as e:
-                            if debug:
-                                result['debug_info']['from_school_error'] = str(e)
-                        
-                        try:
-                            page.wait_for_selector('table tbody tr, .course-table tr, [class*="course"] tr', timeout=12000)
-                            time.sleep(1)
-                        except:
-                            if debug:
-                                result['debug_info']['no_table_found'] = True
-                    
-                    html = page.content()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    course_rows = soup.find_all('tr')
-                    
-                    for row in course_rows:
-                        cells = row.find_all(['td', 'th'])
-                        if len(cells) >= 2:
-                            from_course = cells[0].get_text(strip=True)
-                            to_course = cells[1].get_text(strip=True)
-                            
-                            if (from_course and to_course and 
-                                len(from_course) > 1 and len(to_course) > 1 and
-                                from_course.lower() not in ['course', 'courses', 'from course', 'prerequisite'] and
-                                to_course.lower() not in ['course', 'courses', 'to course', 'transfer to']):
-                                
-                                units = None
-                                if len(cells) > 2:
-                                    units_text = cells[2].get_text(strip=True)
-                                    try:
-                                        units = float(units_text)
-                                    except:
-                                        units = units_text if units_text else None
-                                
-                                result['courses'].append({
-                                    'from_course': from_course,
-                                    'to_course': to_course,
-                                    'units': units
-                                })
-                    
+                        wait_for_options(page, 'to school options loaded')
+                        options = page.query_selector_all('[role="option"]')
+                        if options:
+                            options[0].click(timeout=5000)
+                            wait_for_options_closed(page, 'to school selected')
+                except Exception as e:
                     if debug:
-                        result['debug_info']['courses_found'] = len(result['courses'])
+                        result['debug_info']['to_school_error'] = str(e)
                 
+                try:
+                    from_input = from_selector.query_selector('input[type="search"]')
+                    if not from_input:
+                        from_input = from_selector.query_selector('input')
+                    
+                    if from_input:
+                        from_input.click(timeout=5000)
+                        from_input.fill("")
+                        from_input.fill(from_school)
+                        
+                        wait_for_options(page, 'from school options loaded')
+                        options = page.query_selector_all('[role="option"]')
+                        if options:
+                            options[0].click(timeout=5000)
+                            wait_for_options_closed(page, 'from school selected')
                 except Exception as e:
-                    result['error'] = f'Failed during scraping: {str(e)}'
                     if debug:
-                        result['debug_info']['scrape_error'] = str(e)
-                
-                browser.close()
+                        result['debug_info']['from_school_error'] = str(e)
                 
-                return result
+                try:
+                    course_rows_selector = 'table tbody tr, .course-table tr, [class*="course"] tr'
+                    wait_for_selector(page, course_rows_selector, 'course table rendered', timeout=12000)
+                    wait_for_count_stable(page, course_rows_selector, 'course table settled')
+                except:
+                    if debug:
+                        result['debug_info']['no_table_found'] = True
+            
+            html = page.content()
+            soup = BeautifulSoup(html, 'html.parser')
+            
+            course_rows = soup.find_all('tr')
+            
+            for row in course_rows:
+                cells = row.find_all(['td', 'th'])
+                if len(cells) >= 2:
+                    from_course = cells[0].get_text(strip=True)
+                    to_course = cells[1].get_text(strip=True)
+                    
+                    if (from_course and to_course and 
+                        len(from_course) > 1 and len(to_course) > 1 and
+                        from_course.lower() not in ['course', 'courses', 'from course', 'prerequisite'] and
+                        to_course.lower() not in ['course', 'courses', 'to course', 'transfer to']):
+                        
+                        units = None
+                        if len(cells) > 2:
+                            units_text = cells[2].get_text(strip=True)
+                            try:
+                                units = float(units_text)
+                            except:
+                                units = units_text if units_text else None
+                        
+                        result['courses'].append({
+                            'from_course': from_course,
+                            'to_course': to_course,
+                            'units': units
+                        })
+            
+            if debug:
+                result['debug_info']['courses_found'] = len(result['courses'])
+                result['debug_info']['wait_timings'] = timer_for(page).report()
         
         except Exception as e:
-            return {
-                'from_school': from_school,
-                'to_school': to_school,
-                'year': year_name,
-                'error': f'Failed to scrape course articulation: {str(e)}',
-                'courses': []
-            }
-    
-    for attempt in range(max_retries + 1):
-        result = attempt_scrape()
-        if not result.get('error') or attempt == max_retries:
-            if debug and attempt > 0:
-                result['debug_info']['retry_attempt'] = attempt
-            return result
-        time.sleep(2 ** attempt)
+            result['error'] = f'Failed during scraping: {str(e)}'
+            if debug:
+                result['debug_info']['scrape_error'] = str(e)
+                result['debug_info']['wait_timings'] = timer_for(page).report()
+        
+        return result
+    
+    try:
+        result, attempt = get_pool().run_with_retries(scrape_page, max_retries, lambda r: r.get('error'))
+    except Exception as e:
+        return {
+            'from_school': from_school,
+            'to_school': to_school,
+            'year': year_name,
+            'error': f'Failed to scrape course articulation: {str(e)}',
+            'courses': []
+        }
     
+    if debug and attempt > 0:
+        result['debug_info']['retry_attempt'] = attempt
     return result
 
-def get_degree_information(from_school, to_school, year_name="2025-2026", debug=False):
+def summarize_degree_information(from_school, to_school, agreement_result, year_name="2025-2026"):
     """
-    Get degree transfer information with REST API agreement data
+    Build the degree information response from an articulation result
     
     Args:
         from_school: Name of the school student is transferring from
         to_school: Name of the school student is transferring to
+        agreement_result: Dictionary from scrape_transfer_articulation
         year_name: Academic year (e.g., "2025-2026")
-        debug: If True, include additional debugging info
     
     Returns:
         Dictionary containing degree transfer information with assist.org link
@@ -491,8 +496,6 @@ def get_degree_information(from_school, to_school, year_name="2025-2026", debug=
         'error': None
     }
     
-    agreement_result = scrape_transfer_articulation(from_school, to_school, debug=debug)
-    
     if agreement_result.get('error'):
         result['error'] = agreement_result['error']
         return result
@@ -514,6 +517,23 @@ def get_degree_information(from_school, to_school, year_name="2025-2026", debug=
     
     return result
 
+def get_degree_information(from_school, to_school, year_name="2025-2026", debug=False):
+    """
+    Get degree transfer information with REST API agreement data
+    
+    Args:
+        from_school: Name of the school student is transferring from
+        to_school: Name of the school student is transferring to
+        year_name: Academic year (e.g., "2025-2026")
+        debug: If True, include additional debugging info
+    
+    Returns:
+        Dictionary containing degree transfer information with assist.org link
+    """
+    
+    agreement_result = scrape_transfer_articulation(from_school, to_school, debug=debug)
+    return summarize_degree_information(from_school, to_school, agreement_result, year_name)
+
 if __name__ == "__main__":
     result = scrape_transfer_articulation("Berkeley City College", "University of California, Berkeley")
     print(json.dumps(result, indent=2))
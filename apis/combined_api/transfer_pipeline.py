@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Asyncio pipeline for transfer checks
+Both institutions are resolved concurrently, then the agreements and courses
+fetches run with bounded concurrency on a shared background event loop
+"""
+
+import asyncio
+import threading
+from concurrent.futures import wait
+
+from .agreements import agreements_cache
+from .scraper import (
+    add_agreement_courses,
+    add_agreements,
+    get_institution_id,
+    new_articulation_result,
+    summarize_degree_information,
+)
+
+MAX_CONCURRENCY = 8
+CHECK_TIMEOUT = 30
+BATCH_TIMEOUT = 60
+
+
+class TransferPipeline:
+    """
+    Runs transfer-check coroutines on a dedicated event loop thread
+
+    Args:
+        max_concurrency: Blocking upstream calls allowed in flight at once
+    """
+
+    def __init__(self, max_concurrency=MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                threading.Thread(target=self._loop.run_forever, name='transfer-pipeline', daemon=True).start()
+        return self._loop
+
+    async def call(self, fn, *args, **kwargs):
+        """Run a blocking upstream call in a worker thread, bounded by the semaphore"""
+        async with self._semaphore:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def resolve(self, from_school, to_school):
+        """Resolve both institution IDs concurrently"""
+        return await asyncio.gather(
+            self.call(get_institution_id, from_school),
+            self.call(get_institution_id, to_school)
+        )
+
+    async def resolve_all(self, names):
+        """Resolve each distinct institution name once; returns a name -> ID dict"""
+        names = list(dict.fromkeys(names))
+        ids = await asyncio.gather(*(self.call(get_institution_id, name) for name in names))
+        return dict(zip(names, ids))
+
+    async def articulation(self, from_school, to_school, debug=False, ids=None):
+        """
+        Async counterpart of scrape_transfer_articulation
+
+        Args:
+            from_school: Name of the school student is transferring from
+            to_school: Name of the school student is transferring to
+            debug: If True, include additional debugging info
+            ids: Optional (from_id, to_id) pair that was already resolved
+
+        Returns:
+            Dictionary containing transfer articulation data
+        """
+        try:
+            from_id, to_id = ids if ids else await self.resolve(from_school, to_school)
+
+            result = new_articulation_result(from_school, to_school, from_id, to_id)
+            if result['error']:
+                return result
+
+            cached = await self.call(agreements_cache.get, to_id)
+            add_agreements(result, cached, debug=debug)
+            await self.call(add_agreement_courses, result)
+
+            return result
+
+        except Exception as e:
+            return {'error': f'Failed to scrape articulation data: {str(e)}'}
+
+    async def degree_information(self, from_school, to_school, year_name="2025-2026", debug=False, ids=None):
+        """Async counterpart of get_degree_information"""
+        agreement_result = await self.articulation(from_school, to_school, debug=debug, ids=ids)
+        return summarize_degree_information(from_school, to_school, agreement_result, year_name)
+
+    def submit(self, coro):
+        """Schedule a coroutine on the pipeline loop and return a concurrent.futures.Future"""
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    async def batch_check(self, resolved, from_school, to_school, year_name="2025-2026", debug=False):
+        """One pair of a batch, using the batch's shared institution lookup"""
+        try:
+            # Shielded: cancelling one timed-out pair must not cancel the lookup for the rest
+            ids = await asyncio.shield(asyncio.wrap_future(resolved))
+            pair_ids = (ids[from_school], ids[to_school])
+        except Exception:
+            pair_ids = None  # articulation resolves the pair itself and reports the error
+        return await self.degree_information(from_school, to_school, year_name, debug, ids=pair_ids)
+
+    def submit_batch(self, pairs, year_name="2025-2026", debug=False):
+        """
+        Resolve every institution in pairs once and fan out one check per pair
+        Returns at once; the lookup runs on the loop ahead of the checks
+
+        Args:
+            pairs: List of (from_school, to_school) tuples
+            year_name: Academic year (e.g., "2025-2026")
+            debug: If True, include additional debugging info
+
+        Returns:
+            List of concurrent.futures.Future, one per pair, in input order
+        """
+        resolved = self.submit(self.resolve_all([name for pair in pairs for name in pair]))
+        return [
+            self.submit(self.batch_check(resolved, from_school, to_school, year_name, debug))
+            for from_school, to_school in pairs
+        ]
+
+    def run(self, coro, timeout=CHECK_TIMEOUT):
+        """Schedule a coroutine on the pipeline loop and wait for its result"""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+
+pipeline = TransferPipeline()
+
+
+def check_transfer(from_school, to_school, year_name="2025-2026", debug=False, timeout=CHECK_TIMEOUT):
+    """
+    Get degree transfer information through the async pipeline
+
+    Returns:
+        Same dictionary as get_degree_information
+    """
+    return pipeline.run(pipeline.degree_information(from_school, to_school, year_name, debug), timeout)
+
+
+def check_transfer_batch(pairs, year_name="2025-2026", debug=False, timeout=BATCH_TIMEOUT):
+    """
+    Get degree transfer information for many school pairs at once
+
+    Args:
+        pairs: List of (from_school, to_school) tuples
+        year_name: Academic year (e.g., "2025-2026")
+        debug: If True, include additional debugging info
+        timeout: Seconds to wait for the whole batch, lookups included
+
+    Returns:
+        List of get_degree_information dictionaries in input order; a check that
+        missed the deadline or raised carries the reason in its error field
+    """
+    futures = pipeline.submit_batch(pairs, year_name, debug)
+    wait(futures, timeout)
+
+    results = []
+    for (from_school, to_school), future in zip(pairs, futures):
+        if not future.done():
+            future.cancel()
+            error = f'Transfer check timed out after {timeout}s'
+        else:
+            try:
+                results.append(future.result())
+                continue
+            except Exception as e:
+                error = str(e)
+        results.append(summarize_degree_information(from_school, to_school, {'error': error}, year_name))
+    return results
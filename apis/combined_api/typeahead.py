@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Typeahead index for institution name search
+Matches are ranked prefix first, then word-start, then anywhere in the name,
+with shorter names ranked first inside each tier
+"""
+
+import bisect
+import heapq
+import re
+
+NGRAM_SIZE = 3
+TOKEN_START = re.compile(r'(?<![a-z0-9])[a-z0-9]')
+
+
+class TypeaheadIndex:
+    """
+    Prebuilt search index over a list of names
+
+    Args:
+        names: Iterable of display names; duplicates are collapsed
+    """
+
+    def __init__(self, names):
+        self.names = sorted(set(names))
+        self.lowered = [n.lower() for n in self.names]
+
+        # Sorted (key, id) pairs let a prefix lookup be two bisects
+        prefix_pairs = sorted((name, i) for i, name in enumerate(self.lowered))
+        self.prefix_keys = [k for k, _ in prefix_pairs]
+        self.prefix_ids = [i for _, i in prefix_pairs]
+
+        token_pairs = []
+        for i, name in enumerate(self.lowered):
+            for match in TOKEN_START.finditer(name):
+                if match.start() > 0:
+                    token_pairs.append((name[match.start():], i))
+        token_pairs.sort()
+        self.token_keys = [k for k, _ in token_pairs]
+        self.token_ids = [i for _, i in token_pairs]
+
+        self.grams = {}
+        for i, name in enumerate(self.lowered):
+            for j in range(len(name) - NGRAM_SIZE + 1):
+                self.grams.setdefault(name[j:j + NGRAM_SIZE], set()).add(i)
+
+    def _rank_key(self, i):
+        return (len(self.names[i]), self.lowered[i])
+
+    def _range(self, keys, ids, query):
+        lo = bisect.bisect_left(keys, query)
+        hi = bisect.bisect_left(keys, query + '￿', lo)
+        return ids[lo:hi]
+
+    def _infix_candidates(self, query):
+        if len(query) < NGRAM_SIZE:
+            return range(len(self.names))
+
+        postings = []
+        for j in range(len(query) - NGRAM_SIZE + 1):
+            ids = self.grams.get(query[j:j + NGRAM_SIZE])
+            if not ids:
+                return ()
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates &= ids
+        return candidates
+
+    def search(self, query, limit=10):
+        """
+        Return up to limit names matching query, best matches first
+
+        Args:
+            query: Search text (case-insensitive)
+            limit: Maximum number of names to return
+
+        Returns:
+            List of matching display names
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        results = []
+        seen = set()
+        tiers = (
+            lambda: self._range(self.prefix_keys, self.prefix_ids, query),
+            lambda: self._range(self.token_keys, self.token_ids, query),
+            lambda: (i for i in self._infix_candidates(query) if query in self.lowered[i]),
+        )
+
+        for tier in tiers:
+            remaining = limit - len(results)
+            if remaining <= 0:
+                break
+            ids = {i for i in tier() if i not in seen}
+            for i in heapq.nsmallest(remaining, ids, key=self._rank_key):
+                seen.add(i)
+                results.append(self.names[i])
+
+        return results
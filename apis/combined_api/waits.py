@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Condition-based waits for Playwright flows
+Each helper waits on something concrete (a selector, a populated option list,
+an enabled button, network quiet) instead of a fixed sleep, and records how long
+it actually waited on the page's WaitTimer so slow steps show up in a report
+"""
+
+import time
+import weakref
+from contextlib import contextmanager
+
+from playwright.sync_api import TimeoutError as PWTimeout
+
+OPTION_SELECTOR = '[role="option"]'
+IDLE_TIMEOUT_MS = 2000
+
+
+class WaitTimer:
+    """Per-page log of wait steps and the time spent in each"""
+
+    def __init__(self):
+        self.steps = []
+
+    @contextmanager
+    def step(self, name, condition=''):
+        start = time.perf_counter()
+        entry = {'step': name, 'condition': condition, 'seconds': 0.0, 'ok': True}
+        try:
+            yield entry
+        except Exception:
+            entry['ok'] = False
+            raise
+        finally:
+            entry['seconds'] = round(time.perf_counter() - start, 3)
+            self.steps.append(entry)
+
+    def total(self):
+        return round(sum(s['seconds'] for s in self.steps), 3)
+
+    def report(self):
+        """Steps in order, plus the total seconds spent waiting"""
+        return {'total_seconds': self.total(), 'steps': list(self.steps)}
+
+    def format_report(self):
+        lines = [f"  {'step':<32} {'waited':>8}  condition"]
+        for s in self.steps:
+            flag = '' if s['ok'] else '  (timed out)'
+            lines.append(f"  {s['step']:<32} {s['seconds']:>7.2f}s  {s['condition']}{flag}")
+        lines.append(f"  {'TOTAL':<32} {self.total():>7.2f}s")
+        return '\n'.join(lines)
+
+
+_timers = weakref.WeakKeyDictionary()
+
+
+def timer_for(page):
+    """WaitTimer attached to a page (created on first use)"""
+    timer = _timers.get(page)
+    if timer is None:
+        timer = _timers[page] = WaitTimer()
+    return timer
+
+
+def wait_for_selector(page, selector, step, state='visible', timeout=15000, required=True):
+    """Wait for a selector to reach state; returns False on timeout when not required"""
+    with timer_for(page).step(step, f'{selector} {state}') as entry:
+        try:
+            page.wait_for_selector(selector, state=state, timeout=timeout)
+            return True
+        except PWTimeout:
+            entry['ok'] = False
+            if required:
+                raise
+            return False
+
+
+def wait_for_options(page, step, selector=OPTION_SELECTOR, min_count=1, timeout=8000, required=True):
+    """Wait until a dropdown has rendered at least min_count options"""
+    with timer_for(page).step(step, f'{selector} count >= {min_count}') as entry:
+        try:
+            page.wait_for_function(
+                '([sel, n]) => document.querySelectorAll(sel).length >= n',
+                arg=[selector, min_count],
+                timeout=timeout
+            )
+            return True
+        except PWTimeout:
+            entry['ok'] = False
+            if required:
+                raise
+            return False
+
+
+def wait_for_more_options(page, step, previous, selector=OPTION_SELECTOR, timeout=1000):
+    """Wait for a virtualized option list to grow past previous; returns the new count"""
+    with timer_for(page).step(step, f'{selector} count > {previous}') as entry:
+        try:
+            page.wait_for_function(
+                '([sel, n]) => document.querySelectorAll(sel).length > n',
+                arg=[selector, previous],
+                timeout=timeout
+            )
+        except PWTimeout:
+            entry['ok'] = False
+        return page.locator(selector).count()
+
+
+def wait_for_options_closed(page, step, selector=OPTION_SELECTOR, timeout=3000):
+    """Wait for an open dropdown to close after a selection"""
+    return wait_for_selector(page, selector, step, state='detached', timeout=timeout, required=False)
+
+
+def wait_for_enabled(page, locator, step, timeout=30000):
+    """Wait until a button is visible and neither disabled nor aria-disabled"""
+    with timer_for(page).step(step, 'enabled'):
+        locator.wait_for(state='visible', timeout=timeout)
+        handle = locator.element_handle(timeout=timeout)
+        page.wait_for_function(
+            "el => !el.disabled && el.getAttribute('aria-disabled') !== 'true'",
+            arg=handle,
+            timeout=timeout
+        )
+
+
+def wait_for_count_stable(page, selector, step, quiet=500, timeout=5000):
+    """
+    Wait until the number of elements matching selector stops growing for quiet ms
+    For lists that render in batches; returns the final count
+    """
+    with timer_for(page).step(step, f'{selector} count stable {quiet}ms') as entry:
+        deadline = time.perf_counter() + timeout / 1000
+        count = page.locator(selector).count()
+        while time.perf_counter() < deadline:
+            try:
+                page.wait_for_function(
+                    '([sel, n]) => document.querySelectorAll(sel).length > n',
+                    arg=[selector, count],
+                    timeout=quiet
+                )
+            except PWTimeout:
+                return count
+            count = page.locator(selector).count()
+        entry['ok'] = False
+        return count
+
+
+def wait_for_idle(page, step, timeout=IDLE_TIMEOUT_MS):
+    """
+    Wait for network quiet after a real navigation (page.goto or a full page load)
+    After an in-page SPA click the load state is already reached, so this returns
+    at once; wait on the element the next step needs instead.
+    SPAs may keep a request open, so a timeout here is recorded but not raised
+    """
+    with timer_for(page).step(step, 'networkidle') as entry:
+        try:
+            page.wait_for_load_state('networkidle', timeout=timeout)
+            return True
+        except PWTimeout:
+            entry['ok'] = False
+            return False
+
+
+def wait_for_any(page, selectors, step, timeout=10000):
+    """Wait until any of the selectors is attached; returns False on timeout"""
+    return wait_for_selector(page, ', '.join(selectors), step, state='attached', timeout=timeout, required=False)
@@ -1,6 +1,7 @@
 import requests
 from bs4 import BeautifulSoup
 import json
+import os
 from datetime import datetime
 import time
 
@@ -521,8 +522,11 @@ class MentorshipScraper:
             }
         }
 
-        with open(filename, 'w') as f:
+        # Write to a temp file and swap it in, so readers never see a partial file
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'w') as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_filename, filename)
 
         print(f"\n[+] Mentorship data saved to {filename}")
 
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the agreements cache against the local assist.org stub
+Covers coalescing of concurrent identical fetches, stale-while-revalidate and
+TTL expiry, using the stub's injected latency to hold requests in flight
+
+Usage (from apis/):
+    python test_agreements_cache.py
+    python -m pytest test_agreements_cache.py
+"""
+
+import threading
+import time
+
+from combined_api.agreements import AgreementsCache
+from combined_api.assist_stub import AssistData, AssistStubServer
+
+LATENCY = 0.3
+TO_ID = 1
+
+
+class CountingData(AssistData):
+    """AssistData that counts the upstream API requests it answers"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = 0
+        self._count_lock = threading.Lock()
+
+    def api(self, path, query=''):
+        with self._count_lock:
+            self.requests += 1
+        return super().api(path, query)
+
+
+def start_stub():
+    data = CountingData()
+    server = AssistStubServer(('127.0.0.1', 0), data, latency=LATENCY).start()
+    return server, data
+
+
+def make_cache(server, ttl, stale_ttl):
+    return AgreementsCache(server.base_url + '/api/institutions/{to_id}/agreements', ttl, stale_ttl)
+
+
+def test_concurrent_fetches_coalesce():
+    """Identical concurrent gets make exactly one upstream request"""
+    server, data = start_stub()
+    try:
+        cache = make_cache(server, ttl=60, stale_ttl=60)
+        entries = []
+        threads = [threading.Thread(target=lambda: entries.append(cache.get(TO_ID))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert data.requests == 1
+        assert len(entries) == 8
+        assert all(entry is entries[0] for entry in entries)
+        assert entries[0].total > 0
+        print(f"✓ 8 concurrent gets -> {data.requests} upstream request")
+    finally:
+        server.stop()
+
+
+def test_stale_entry_served_while_refreshing():
+    """An expired entry inside the stale window is returned at once and refreshed in the background"""
+    server, data = start_stub()
+    try:
+        cache = make_cache(server, ttl=0.5, stale_ttl=60)
+        first = cache.get(TO_ID)
+        assert data.requests == 1
+
+        time.sleep(0.6)
+        start = time.perf_counter()
+        stale = cache.get(TO_ID)
+        elapsed = time.perf_counter() - start
+        assert stale is first
+        assert elapsed < LATENCY / 2
+
+        # The refresh is in flight; more gets keep serving the stale entry without new requests
+        assert cache.get(TO_ID) is first
+        deadline = time.time() + 5
+        while cache.get(TO_ID) is first and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert cache.get(TO_ID) is not first
+        assert data.requests == 2
+        print(f"✓ stale entry served in {elapsed * 1000:.1f}ms, refreshed in the background")
+    finally:
+        server.stop()
+
+
+def test_expired_entry_refetched():
+    """Past ttl + stale_ttl the get blocks on a fresh fetch"""
+    server, data = start_stub()
+    try:
+        cache = make_cache(server, ttl=0.1, stale_ttl=0.1)
+        first = cache.get(TO_ID)
+
+        time.sleep(0.3)
+        start = time.perf_counter()
+        second = cache.get(TO_ID)
+        elapsed = time.perf_counter() - start
+        assert second is not first
+        assert elapsed >= LATENCY * 0.9
+        assert data.requests == 2
+
+        assert cache.get(TO_ID) is second
+        assert data.requests == 2
+        print(f"✓ expired entry refetched in {elapsed * 1000:.1f}ms")
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    test_concurrent_fetches_coalesce()
+    test_stale_entry_served_while_refreshing()
+    test_expired_entry_refetched()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the README checkout in InternshipFetcher against a local bare git repo
+Covers the first sparse clone, reusing the baseline when no commits arrived,
+picking up a new commit and replacing a leftover non-git checkout directory
+
+Usage (from apis/):
+    python test_fetch_internships.py
+    python -m pytest test_fetch_internships.py
+"""
+
+import os
+import subprocess
+import tempfile
+
+from combined_api.fetch_and_clone_internships import InternshipFetcher
+
+HEADER = '| Company | Position | Location | Posting | Age |\n|---|---|---|---|---|'
+
+
+def readme(*companies):
+    rows = [f'| **{name}** | SWE Intern | Remote | <a href="https://jobs.example.com/{name}">Apply</a> | 1d |'
+            for name in companies]
+    return '\n'.join(['# Jobs', '<!-- TABLE_START -->', HEADER, *rows, '<!-- TABLE_END -->', ''])
+
+
+def git(*args, cwd=None):
+    subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, text=True)
+
+
+class Fixture:
+    """A bare repo to clone from and a work tree to push README versions with"""
+
+    def __init__(self, root):
+        self.bare = os.path.join(root, 'jobs.git')
+        self.work = os.path.join(root, 'work')
+        self.checkout = os.path.join(root, 'checkout')
+        git('init', '-q', '--bare', self.bare)
+        git('clone', '-q', self.bare, self.work)
+
+    def push(self, content):
+        with open(os.path.join(self.work, 'README.md'), 'w', encoding='utf-8') as f:
+            f.write(content)
+        git('add', 'README.md', cwd=self.work)
+        git('-c', 'user.name=test', '-c', 'user.email=test@example.com',
+            'commit', '-q', '-m', 'update', cwd=self.work)
+        git('push', '-q', 'origin', 'HEAD', cwd=self.work)
+
+    def fetcher(self):
+        return InternshipFetcher(repo_url=f'file://{self.bare}', mode='git', repo_dir=self.checkout)
+
+
+def baseline(fetcher):
+    return {
+        'metadata': {'readme_sha256': fetcher.readme_sha},
+        'internships': fetcher.internships,
+        'closed_internships': fetcher.closed_internships
+    }
+
+
+def test_clone_then_update():
+    """First run clones and parses; a run with no new commits reuses the baseline"""
+    with tempfile.TemporaryDirectory() as root:
+        fixture = Fixture(root)
+        fixture.push(readme('Acme', 'Globex'))
+
+        first = fixture.fetcher()
+        assert first.clone_or_update_repo()
+        assert first.readme_changed
+        assert first.fetch_internships(previous={})
+        assert [i['company'] for i in first.internships] == ['Acme', 'Globex']
+        assert sorted(os.listdir(fixture.checkout)) == ['.git', 'README.md']
+
+        second = fixture.fetcher()
+        assert second.clone_or_update_repo()
+        assert not second.readme_changed
+        assert second.fetch_internships(previous=baseline(first))
+        assert second.stats['unchanged'] and second.stats['parsed'] == 0
+        assert second.internships == first.internships
+
+        fixture.push(readme('Acme', 'Initech'))
+        third = fixture.fetcher()
+        assert third.clone_or_update_repo()
+        assert third.readme_changed
+        assert third.fetch_internships(previous=baseline(second))
+        assert [i['company'] for i in third.internships] == ['Acme', 'Initech']
+        assert [i['company'] for i in third.closed_internships] == ['Globex']
+        print(f"✓ clone, no-op update and new commit ({third.stats})")
+
+
+def test_leftover_directory_is_replaced():
+    """A checkout directory without .git is removed before cloning"""
+    with tempfile.TemporaryDirectory() as root:
+        fixture = Fixture(root)
+        fixture.push(readme('Acme'))
+        os.makedirs(fixture.checkout)
+        with open(os.path.join(fixture.checkout, 'stale.txt'), 'w') as f:
+            f.write('left over from an interrupted clone')
+
+        fetcher = fixture.fetcher()
+        assert fetcher.clone_or_update_repo()
+        assert not os.path.exists(os.path.join(fixture.checkout, 'stale.txt'))
+        assert fetcher.fetch_internships(previous={})
+        assert [i['company'] for i in fetcher.internships] == ['Acme']
+        print("✓ leftover non-git directory replaced by a fresh clone")
+
+
+if __name__ == '__main__':
+    test_clone_then_update()
+    test_leftover_directory_is_replaced()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for GET /api/transfer/overlap against a temporary articulation store
+Uses real UC campus names, which contain commas, and agreements stored under
+different academic years
+
+Usage (from apis/):
+    python test_transfer_overlap.py
+    python -m pytest test_transfer_overlap.py
+"""
+
+import os
+import tempfile
+
+import api
+from combined_api.articulation_store import ArticulationStore, DEFAULT_MAJOR
+
+CC = 'De Anza College'
+UCLA = 'University of California, Los Angeles'
+BERKELEY = 'University of California, Berkeley'
+DAVIS = 'University of California, Davis'
+
+
+def make_store(directory):
+    store = ArticulationStore(os.path.join(directory, 'articulations.db'))
+    store.put(CC, UCLA, DEFAULT_MAJOR, '2024-2025', [
+        {'cc_course': 'CIS22A', 'uc_course': 'COMSCI31'},
+        {'cc_course': 'MATH1A', 'uc_course': 'MATH31A'},
+    ])
+    store.put(CC, BERKELEY, DEFAULT_MAJOR, '2024-2025', [
+        {'cc_course': 'CIS22A', 'uc_course': 'COMPSCI61A'},
+        {'cc_course': '', 'uc_course': 'MATH1A', 'no_articulation': True},
+    ])
+    # Davis only has an agreement for an older year
+    store.put(CC, DAVIS, DEFAULT_MAJOR, '2023-2024', [
+        {'cc_course': 'CIS22A', 'uc_course': 'ECS32A'},
+    ])
+    return store
+
+
+def get_overlap(query):
+    with tempfile.TemporaryDirectory() as directory:
+        previous, api.ARTICULATIONS = api.ARTICULATIONS, make_store(directory)
+        try:
+            response = api.app.test_client().get('/api/transfer/overlap', query_string=query)
+        finally:
+            api.ARTICULATIONS = previous
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_repeated_campuses_keep_commas():
+    """Each to_school value is one campus, commas included"""
+    data = get_overlap([('from_school', CC), ('to_school', UCLA), ('to_school', BERKELEY)])
+
+    assert data['to_schools'] == [UCLA, BERKELEY]
+    assert data['missing_agreements'] == []
+    assert data['courses'] == [
+        {'cc_course': 'CIS22A', 'campuses': {UCLA: ['COMSCI31'], BERKELEY: ['COMPSCI61A']}}
+    ]
+    print(f"✓ overlap of {len(data['to_schools'])} campuses: {data['total_count']} course")
+
+
+def test_year_limits_stored_campuses():
+    """A campus stored only for another academic year is missing for the requested one"""
+    query = [('from_school', CC), ('to_school', UCLA), ('to_school', DAVIS)]
+
+    latest = get_overlap(query)
+    assert latest['missing_agreements'] == []
+    assert [c['cc_course'] for c in latest['courses']] == ['CIS22A']
+
+    data = get_overlap(query + [('year', '2024-2025')])
+    assert data['missing_agreements'] == [DAVIS]
+    assert data['courses'] == []
+    print(f"✓ year 2024-2025 reports {DAVIS} as missing")
+
+
+if __name__ == '__main__':
+    test_repeated_campuses_keep_commas()
+    test_year_limits_stored_campuses()
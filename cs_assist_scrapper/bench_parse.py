@@ -0,0 +1,80 @@
+# bench_parse.py
+# Benchmark agreement-page extraction on the saved debug_*.html fixtures:
+#   html  -> parse_mappings_html over one page.content() snapshot
+#   dom   -> parse_mappings_dom, the per-cell Playwright locator extractor
+# The dom run needs a local Chromium; without one only the html side is timed.
+# Usage: python bench_parse.py [--repeat 20] [--skip-dom]
+import argparse
+import glob
+import os
+import time
+
+from scraper import HTML_PARSER, parse_mappings_dom, parse_mappings_html
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def fixture_campus(path: str) -> str:
+    name = os.path.basename(path)[len("debug_"):-len(".html")]
+    return name.replace("_", " ")
+
+
+def best_of(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_dom(fixtures, repeat: int):
+    from playwright.sync_api import sync_playwright
+
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        for path, html in fixtures:
+            page.set_content(html, wait_until="domcontentloaded")
+            uc_name = fixture_campus(path)
+            results[path] = best_of(lambda: parse_mappings_dom(page, uc_name), repeat)
+        browser.close()
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark agreement HTML parsing")
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--skip-dom", action="store_true", help="Only time the local HTML parser")
+    args = ap.parse_args()
+
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(HERE, "debug_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            fixtures.append((path, f.read()))
+    if not fixtures:
+        print("No debug_*.html fixtures found")
+        return
+
+    dom = {}
+    if not args.skip_dom:
+        try:
+            dom = bench_dom(fixtures, max(1, args.repeat // 4))
+        except Exception as e:
+            print(f"[WARN] DOM benchmark skipped: {e}")
+
+    print(f"parser: {HTML_PARSER}, best of {args.repeat}")
+    for path, html in fixtures:
+        uc_name = fixture_campus(path)
+        html_secs, html_rows = best_of(lambda: parse_mappings_html(html, uc_name), args.repeat)
+        line = f"{os.path.basename(path):<52} {len(html) / 1024:>7.0f} KB  rows={len(html_rows):<3} html={html_secs * 1000:>8.1f}ms"
+        if path in dom:
+            dom_secs, dom_rows = dom[path]
+            same = "identical" if dom_rows == html_rows else "MISMATCH"
+            line += f"  dom={dom_secs * 1000:>8.1f}ms  x{dom_secs / html_secs:.1f}  {same}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# crawler.py
+# Bulk ASSIST crawler: pre-scrapes the CS agreement for every community college x UC target
+# into the articulation store, so student plans become store lookups with no browser time.
+# Progress is checkpointed per pair in a crawl_jobs table; re-running resumes where it stopped.
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import as_completed
+from typing import List, Tuple
+
+import scraper
+from scraper import (
+    MAJOR_EXACT,
+    UC_TARGETS,
+    get_all_community_colleges,
+    listed_academic_year,
+    log,
+    normalize_uc_name,
+    scrape_one_campus,
+    store_mappings,
+)
+from combined_api.articulation_store import ArticulationStore, current_academic_year
+from combined_api.browser_pool import BrowserPool
+
+CRAWL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+    cc TEXT NOT NULL COLLATE NOCASE,
+    uc TEXT NOT NULL COLLATE NOCASE,
+    major TEXT NOT NULL COLLATE NOCASE,
+    academic_year TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    rows INTEGER,
+    last_error TEXT,
+    updated_at REAL,
+    PRIMARY KEY (cc, uc, major, academic_year)
+);
+"""
+
+
+# ------------------ checkpoints ------------------ #
+
+class CrawlCheckpoint:
+    """
+    One crawl_jobs row per (cc, uc, major, year), stored next to the articulations.
+    status: pending -> running -> done | failed
+    """
+
+    def __init__(self, store: ArticulationStore, major: str, academic_year: str):
+        self.store = store
+        self.major = major
+        self.academic_year = academic_year
+        self._lock = threading.Lock()
+        conn = store.connect()
+        try:
+            conn.executescript(CRAWL_SCHEMA)
+        finally:
+            conn.close()
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            conn = self.store.connect()
+            try:
+                with conn:
+                    return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+
+    def enqueue(self, pairs: List[Tuple[str, str]]):
+        """Add new pairs and requeue any left 'running' by an interrupted crawl."""
+        with self._lock:
+            conn = self.store.connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO crawl_jobs (cc, uc, major, academic_year, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(cc, uc, self.major, self.academic_year, time.time()) for cc, uc in pairs],
+                    )
+                    conn.execute(
+                        "UPDATE crawl_jobs SET status = 'pending' "
+                        "WHERE status = 'running' AND major = ? AND academic_year = ?",
+                        (self.major, self.academic_year),
+                    )
+            finally:
+                conn.close()
+
+    def todo(self, max_attempts: int) -> List[Tuple[str, str]]:
+        rows = self._execute(
+            "SELECT cc, uc FROM crawl_jobs WHERE major = ? AND academic_year = ? "
+            "AND (status = 'pending' OR (status = 'failed' AND attempts < ?)) ORDER BY cc, uc",
+            (self.major, self.academic_year, max_attempts),
+        )
+        return [(r["cc"], r["uc"]) for r in rows]
+
+    def mark(self, cc: str, uc: str, status: str, rows: int = None, error: str = None):
+        attempt = 1 if status == "running" else 0
+        self._execute(
+            "UPDATE crawl_jobs SET status = ?, attempts = attempts + ?, rows = COALESCE(?, rows), "
+            "last_error = ?, updated_at = ? "
+            "WHERE cc = ? AND uc = ? AND major = ? AND academic_year = ?",
+            (status, attempt, rows, error, time.time(), cc, uc, self.major, self.academic_year),
+        )
+
+    def reset(self):
+        self._execute(
+            "DELETE FROM crawl_jobs WHERE major = ? AND academic_year = ?",
+            (self.major, self.academic_year),
+        )
+
+    def summary(self) -> dict:
+        rows = self._execute(
+            "SELECT status, COUNT(*) AS n FROM crawl_jobs WHERE major = ? AND academic_year = ? GROUP BY status",
+            (self.major, self.academic_year),
+        )
+        return {r["status"]: r["n"] for r in rows}
+
+
+# ------------------ rate limiting ------------------ #
+
+class RateLimiter:
+    """Spaces scrape starts at least `interval` seconds apart across all workers."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# ------------------ crawl ------------------ #
+
+def crawl_pair(page, cc_name: str, uc_name: str, store: ArticulationStore, limiter: RateLimiter) -> int:
+    limiter.wait()
+    df = scrape_one_campus(page, cc_name, uc_name)
+    if df.empty:
+        raise RuntimeError("no rows parsed")
+    store.put(cc_name, uc_name, MAJOR_EXACT, df.attrs["academic_year"], store_mappings(df))
+    return len(df)
+
+
+def crawl(
+    pool: BrowserPool,
+    store: ArticulationStore,
+    checkpoint: CrawlCheckpoint,
+    pairs: List[Tuple[str, str]],
+    limiter: RateLimiter,
+    max_attempts: int,
+):
+    checkpoint.enqueue(pairs)
+    todo = checkpoint.todo(max_attempts)
+    log(f"[INFO] {len(todo)} of {len(pairs)} pairs left to crawl.")
+
+    futures = {}
+    for cc_name, uc_name in todo:
+        # Pairs already in the store (e.g. from student runs) need no browser time
+        if store.get(cc_name, uc_name, MAJOR_EXACT, checkpoint.academic_year) is not None:
+            checkpoint.mark(cc_name, uc_name, "done")
+            continue
+        checkpoint.mark(cc_name, uc_name, "running")
+        futures[pool.submit(
+            lambda page, cc_name=cc_name, uc_name=uc_name: crawl_pair(page, cc_name, uc_name, store, limiter)
+        )] = (cc_name, uc_name)
+
+    for done, future in enumerate(as_completed(futures), 1):
+        cc_name, uc_name = futures[future]
+        try:
+            rows = future.result()
+        except Exception as e:
+            checkpoint.mark(cc_name, uc_name, "failed", error=str(e)[:500])
+            log(f"[{done}/{len(futures)}] [FAIL] {cc_name} -> {uc_name}: {e}")
+            continue
+        checkpoint.mark(cc_name, uc_name, "done", rows=rows)
+        log(f"[{done}/{len(futures)}] [OK] {cc_name} -> {uc_name}: {rows} rows")
+
+
+# ------------------ CLI entry ------------------ #
+
+def main():
+    ap = argparse.ArgumentParser(
+        description="Crawl the CS articulation matrix (all CCs x UC targets) into the articulation store."
+    )
+    ap.add_argument("--db", default=None, help="Articulation store (SQLite) to fill.")
+    ap.add_argument(
+        "--cc",
+        action="append",
+        default=[],
+        help="Only crawl this community college (repeatable). Default: every CC listed on ASSIST.",
+    )
+    ap.add_argument(
+        "--uc",
+        action="append",
+        default=[],
+        help="Only crawl this UC campus (repeatable). Default: every campus in UC_TARGETS.",
+    )
+    ap.add_argument("--workers", type=int, default=4, help="Browsers scraping in parallel.")
+    ap.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Minimum seconds between scrape starts across all workers.",
+    )
+    ap.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Give up on a pair after this many failed scrapes.",
+    )
+    ap.add_argument(
+        "--restart",
+        action="store_true",
+        help="Forget this year's checkpoints and crawl every pair again.",
+    )
+    ap.add_argument(
+        "--base-url",
+        default=None,
+        help="ASSIST site to crawl instead of https://assist.org (e.g. a local assist_stub).",
+    )
+    ap.add_argument(
+        "--visible",
+        action="store_true",
+        help="Run with visible browser windows (for debugging).",
+    )
+    args = ap.parse_args()
+
+    if args.base_url:
+        scraper.ASSIST_URL = args.base_url.rstrip("/") + "/"
+
+    store = ArticulationStore(args.db) if args.db else ArticulationStore()
+    uc_names = [normalize_uc_name(uc) for uc in args.uc] or [name for name, _ in UC_TARGETS]
+
+    with BrowserPool(
+        size=args.workers,
+        headless=(not args.visible),
+        launch_args=["--disable-blink-features=AutomationControlled"],
+        default_timeout=30000,
+    ) as pool:
+        # Checkpoints follow the year ASSIST lists, which lags the calendar after July
+        academic_year = pool.run(listed_academic_year)
+        if academic_year is None:
+            academic_year = current_academic_year()
+            log(f"[WARN] Could not read the listed academic year, assuming {academic_year}.")
+        checkpoint = CrawlCheckpoint(store, MAJOR_EXACT, academic_year)
+        if args.restart:
+            checkpoint.reset()
+            store.max_age = -1
+
+        colleges = args.cc or pool.run(get_all_community_colleges)
+        pairs = [(cc, uc) for cc in colleges for uc in uc_names]
+        log(f"[INFO] Crawling {len(colleges)} CCs x {len(uc_names)} campuses ({checkpoint.academic_year}).")
+        crawl(pool, store, checkpoint, pairs, RateLimiter(args.interval), args.max_attempts)
+
+    log(f"[INFO] Crawl status: {checkpoint.summary()}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(1)
@@ -5,18 +5,38 @@
 import json
 
 import argparse
+import os
 import re
 import sys
+import tempfile
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import pandas as pd
+from bs4 import BeautifulSoup, Comment, NavigableString
 from playwright.sync_api import (
-    sync_playwright,
     TimeoutError as PWTimeout,
     Error as PWError,
 )
 
+# Shared Playwright infrastructure lives with the API scrapers
+APIS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "apis")
+if APIS_DIR not in sys.path:
+    sys.path.insert(0, APIS_DIR)
+
+from concurrent.futures import Future
+
+from combined_api.articulation_store import ArticulationStore, current_academic_year
+from combined_api.browser_pool import BrowserPool
+from combined_api.waits import (
+    timer_for,
+    wait_for_any,
+    wait_for_enabled,
+    wait_for_more_options,
+    wait_for_options,
+    wait_for_options_closed,
+)
+
 TOP_ALT_COMMUNITY_COLLEGES = [
     "Diablo Valley College",
     "Laney College",
@@ -70,6 +90,22 @@ def is_no_articulation(cc_course: str) -> bool:
     return bool(NO_ARTICULATION_PATTERN.search(s_norm))
 
 
+def annotate_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add boolean no_articulation / university_only columns for cc_course, computed
+    once per DataFrame with vectorized regex masks (same patterns as
+    is_no_articulation / is_university_only). Already-annotated frames are returned as-is.
+    """
+    if "no_articulation" in df.columns and "university_only" in df.columns:
+        return df
+    cc = df["cc_course"] if "cc_course" in df.columns else pd.Series([], dtype=object)
+    cc = cc.astype("string")
+    return df.assign(
+        no_articulation=cc.str.contains(NO_ARTICULATION_PATTERN, na=False).astype(bool),
+        university_only=cc.str.contains(UNIVERSITY_ONLY_PATTERN, na=False).astype(bool),
+    )
+
+
 
 UC_TARGETS = [
     ("University of California, Los Angeles", "ucla.csv"),
@@ -79,6 +115,16 @@ UC_TARGETS = [
 
 MAJOR_EXACT = "Computer Science"
 
+# Set by --timings: log how long each wait step took per scrape
+SHOW_TIMINGS = False
+
+# Set by --base-url / ASSIST_BASE_URL, e.g. to run against the local assist_stub server
+ASSIST_URL = os.getenv("ASSIST_BASE_URL", "https://assist.org").rstrip("/") + "/"
+
+# Page dumps for agreements that parsed to no rows; kept out of the source tree so
+# they never overwrite the debug_*.html fixtures bench_parse.py reads
+DEBUG_DIR = os.getenv("ASSIST_DEBUG_DIR", os.path.join(tempfile.gettempdir(), "cs_assist_debug"))
+
 UC_NAME_ALIASES = {
     "uc berkeley": "University of California, Berkeley",
     "university of california, berkeley": "University of California, Berkeley",
@@ -146,14 +192,15 @@ def dataframe_from_rows(rows: List[MappingRow]) -> pd.DataFrame:
 
 def go_home(page):
     # Load homepage
-    page.goto("https://assist.org/", wait_until="load")
-    # Give SPA time to hydrate
-    page.wait_for_timeout(1500)
+    page.goto(ASSIST_URL, wait_until="load")
 
-    # ✅ Only wait for Institution + Agreements dropdowns
+    # ✅ Only wait for Institution + Agreements dropdowns (the SPA has hydrated once they render)
     # Use .first to avoid strict mode when multiple matches exist
-    page.get_by_label("Institution").first.wait_for(timeout=15000)
-    page.get_by_label("Agreements with Other Institutions").first.wait_for(timeout=15000)
+    timer = timer_for(page)
+    with timer.step("home: institution dropdown", "label 'Institution' visible"):
+        page.get_by_label("Institution").first.wait_for(timeout=15000)
+    with timer.step("home: agreements dropdown", "label 'Agreements with Other Institutions' visible"):
+        page.get_by_label("Agreements with Other Institutions").first.wait_for(timeout=15000)
 
 
 def get_all_community_colleges(page) -> List[str]:
@@ -170,12 +217,17 @@ def get_all_community_colleges(page) -> List[str]:
     ).first
 
     combo.click()
-    page.wait_for_timeout(500)
+    wait_for_options(page, "colleges: options loaded")
 
-    # Try to force-load as many options as possible (virtualized lists)
+    # Try to force-load as many options as possible (virtualized lists):
+    # keep pressing End while the rendered option count keeps growing
+    count = page.locator("[role='option']").count()
     for _ in range(30):
         page.keyboard.press("End")
-        page.wait_for_timeout(100)
+        new_count = wait_for_more_options(page, "colleges: scroll options", count)
+        if new_count <= count:
+            break
+        count = new_count
 
     # Collect visible option texts
     option_texts = page.get_by_role("option").all_text_contents()
@@ -187,11 +239,31 @@ def get_all_community_colleges(page) -> List[str]:
     return colleges
 
 
-def select_academic_year(page):
+ACADEMIC_YEAR_RE = re.compile(r"(\d{4})\s*-\s*(\d{4})")
+
+
+def academic_year_text(text: str) -> Optional[str]:
+    """'2025-2026' out of dropdown or payload text, or None."""
+    m = ACADEMIC_YEAR_RE.search(text or "")
+    return f"{m.group(1)}-{m.group(2)}" if m else None
+
+
+def pick_first_year_option(page) -> Optional[str]:
+    wait_for_options(page, "year: options loaded")
+    # Choose first option (latest year)
+    option = page.locator("[role='option']").first
+    year = academic_year_text(option.inner_text())
+    option.click(timeout=8000)
+    wait_for_options_closed(page, "year: selected")
+    return year
+
+
+def select_academic_year(page) -> Optional[str]:
     """
     Pick the latest academic year for the AGREEMENTS flow.
     We avoid strict get_by_label() and just click the first dropdown
     associated with agreements-by-year.
+    Returns the year ASSIST listed first (e.g. '2025-2026'), or None if it couldn't be read.
     """
     try:
         # Prefer the "agreements" academic year search box
@@ -203,11 +275,7 @@ def select_academic_year(page):
 
         if combo.count():
             combo.click()
-            page.wait_for_timeout(200)
-            # Choose first option (latest year)
-            page.locator("[role='option']").first.click(timeout=8000)
-            page.wait_for_timeout(200)
-            return
+            return pick_first_year_option(page)
     except Exception:
         pass
 
@@ -221,12 +289,17 @@ def select_academic_year(page):
             else:
                 el = label
             el.click()
-            page.wait_for_timeout(200)
-            page.locator("[role='option']").first.click(timeout=8000)
-            page.wait_for_timeout(200)
+            return pick_first_year_option(page)
     except Exception:
         # If everything fails, just move on; some flows already have a year selected
         pass
+    return None
+
+
+def listed_academic_year(page) -> Optional[str]:
+    """Academic year ASSIST currently lists first (what a scrape would be filed under)."""
+    go_home(page)
+    return select_academic_year(page)
 
 
 
@@ -397,6 +470,22 @@ def select_uc_institution(page, uc_name: str):
 
 
 
+# What each in-page step renders next; SPA clicks don't navigate, so wait for these
+# instead of network idle (which is already reached before the click re-renders)
+CS_TEXT = ":text-matches('Computer Science', 'i')"
+MAJOR_VIEW_SELECTORS = [
+    "[role='tab']:has-text('Major')",
+    "button:has-text('Major')",
+    "a:has-text('Major')",
+    "input[placeholder*='major' i]",
+    CS_TEXT,
+]
+MAJOR_LIST_SELECTORS = ["input[placeholder*='major' i]", CS_TEXT]
+CS_ENTRY_SELECTORS = [f"a{CS_TEXT}", f"button{CS_TEXT}", f"[role='link']{CS_TEXT}", f"[role='button']{CS_TEXT}"]
+AGREEMENT_ROW_SELECTORS = [".articRow", "[role='rowgroup'] [role='row']", "table tr"]
+MAJOR_AGREEMENT_SELECTORS = ["button:has-text('View')"] + AGREEMENT_ROW_SELECTORS
+
+
 def click_view_agreements(page):
     """
     Click 'View Agreements' button after year + institutions are selected.
@@ -406,16 +495,12 @@ def click_view_agreements(page):
         "button", name=re.compile("View Agreements", re.I)
     ).first
     # Wait up to ~30 seconds for it to become enabled
-    for _ in range(60):
-        try:
-            if btn.is_enabled():
-                btn.click()
-                page.wait_for_timeout(800)
-                return
-        except Exception:
-            pass
-        page.wait_for_timeout(500)
-    raise RuntimeError("View Agreements button never became enabled.")
+    try:
+        wait_for_enabled(page, btn, "view agreements: button enabled", timeout=30000)
+    except (PWTimeout, PWError):
+        raise RuntimeError("View Agreements button never became enabled.")
+    btn.click()
+    wait_for_any(page, MAJOR_VIEW_SELECTORS, "view agreements: results rendered")
 
 
 def go_to_major_view(page):
@@ -430,7 +515,7 @@ def go_to_major_view(page):
         if tab.count() and tab.is_visible():
             try:
                 tab.click()
-                page.wait_for_timeout(600)
+                wait_for_any(page, MAJOR_LIST_SELECTORS, "major view: tab loaded")
                 return
             except Exception:
                 pass
@@ -441,7 +526,7 @@ def go_to_major_view(page):
         if btn.count() and btn.is_visible():
             try:
                 btn.click()
-                page.wait_for_timeout(600)
+                wait_for_any(page, MAJOR_LIST_SELECTORS, "major view: button loaded")
                 return
             except Exception:
                 pass
@@ -452,7 +537,7 @@ def go_to_major_view(page):
         if link.count() and link.is_visible():
             try:
                 link.click()
-                page.wait_for_timeout(600)
+                wait_for_any(page, MAJOR_LIST_SELECTORS, "major view: link loaded")
                 return
             except Exception:
                 pass
@@ -507,7 +592,7 @@ def select_major_cs(page):
             page.keyboard.press("Control+A")
             page.keyboard.press("Backspace")
         major_search.type("Computer Science", delay=20)
-        page.wait_for_timeout(500)
+        wait_for_any(page, CS_ENTRY_SELECTORS, "major: search filtered")
 
     # Helper to choose the best "Computer Science" entry
     def click_best(loc):
@@ -552,7 +637,7 @@ def select_major_cs(page):
             return False
 
         loc.nth(target).click(timeout=8000)
-        page.wait_for_timeout(800)
+        wait_for_any(page, MAJOR_AGREEMENT_SELECTORS, "major: selected")
         return True
 
     # 2. Try as links (most common)
@@ -586,7 +671,7 @@ def open_major_agreement(page):
         if btn.count() and btn.is_visible():
             try:
                 btn.click()
-                page.wait_for_timeout(800)
+                wait_for_any(page, AGREEMENT_ROW_SELECTORS, "agreement: opened")
                 return
             except Exception:
                 pass
@@ -596,151 +681,405 @@ def open_major_agreement(page):
 
 # ------------------ parsing ------------------ #
 
-def parse_mappings(page, uc_name: str) -> List[MappingRow]:
+AGREEMENT_API_PATTERN = re.compile(r"/api/articulation/Agreements", re.I)
+
+
+def course_code(course: dict) -> str:
+    return nz(f"{course.get('prefix') or ''} {course.get('courseNumber') or ''}")
+
+
+def receiving_course(articulation: dict):
     """
-    Extract CC -> UC course mappings from the current agreement page.
+    UC side of one articulation item: (course code, title).
+    Series use their first course, matching the first .prefixCourseNumber in the DOM.
+    """
+    course = articulation.get("course")
+    if not course:
+        series = articulation.get("series") or {}
+        courses = series.get("courses") or []
+        course = courses[0] if courses else {}
+    return course_code(course), nz(course.get("courseTitle") or "")
 
-    Primary strategy for ASSIST's 'articRow' structure:
-      <div class="articRow">
-        <div class="rowReceiving">   # UC side (prefixCourseNumber, title, units)
-        <div class="rowDirection">   # arrow
-        <div class="rowSending">     # CC side (course(s) or 'No Course Articulated')
-      </div>
 
-    Fallbacks: DataGrid/table/text heuristics if no .articRow found.
+def sending_course(sending: dict) -> str:
+    """
+    CC side of one articulation item: the first course of the first group,
+    or 'No Course Articulated' when the sending side is empty.
+    """
+    for group in sending.get("items") or []:
+        for course in group.get("items") or []:
+            code = course_code(course)
+            if code:
+                return code
+    return "No Course Articulated"
+
+
+def payload_academic_year(payload: dict) -> Optional[str]:
     """
+    Academic year of an /api/articulation/Agreements response.
+    'academicYear' may be a plain string, an object or a JSON-encoded object.
+    """
+    result = payload.get("result") or payload
+    value = result.get("academicYear") or ""
+    if not isinstance(value, str):
+        value = json.dumps(value)
+    return academic_year_text(value)
+
+
+def mappings_from_payload(payload: dict, uc_name: str) -> List[MappingRow]:
+    """
+    Convert an /api/articulation/Agreements response into MappingRows.
+    'articulations' arrives as a JSON-encoded string inside 'result'.
+    """
+    result = payload.get("result") or payload
+    articulations = result.get("articulations") or []
+    if isinstance(articulations, str):
+        articulations = json.loads(articulations)
+
     rows: List[MappingRow] = []
+    seen = set()
+    for item in articulations:
+        articulation = item.get("articulation") or item
+        uc_code, uc_title = receiving_course(articulation)
+        cc_course = sending_course(articulation.get("sendingArticulation") or {})
+        if not cc_course or not uc_code:
+            continue
 
-    def extract_from_frame(frame) -> List[MappingRow]:
-        frame_rows: List[MappingRow] = []
+        key = (cc_course, uc_code)
+        if key in seen:
+            continue
+        seen.add(key)
+        rows.append(MappingRow(cc_course, uc_code, uc_title, uc_name))
+    return rows
 
-        # ---------- 1) Preferred: explicit .articRow structure ----------
-        try:
-            artic_rows = frame.locator(".articRow")
-            count = artic_rows.count()
-            if count:
-                seen = set()
-                for i in range(count):
-                    r = artic_rows.nth(i)
-
-                    # UC side (receiving)
-                    recv = r.locator(".rowReceiving")
-                    if not recv.count():
-                        continue
-
-                    uc_code_el = recv.locator(".prefixCourseNumber").first
-                    uc_code = nz(uc_code_el.inner_text()) if uc_code_el.count() else ""
-                    if not uc_code:
-                        # fallback: use entire receiving text
-                        uc_code = nz(recv.inner_text())
-
-                    uc_title_el = recv.locator(".courseTitle").first
-                    uc_title = nz(uc_title_el.inner_text()) if uc_title_el.count() else ""
-
-                    # CC side (sending)
-                    send = r.locator(".rowSending")
-                    if not send.count():
-                        continue
-
-                    # If there's a 'No Course Articulated' <p>, that defines cc_course
-                    no_art_p = send.locator("p").filter(
-                        has_text=re.compile("No Course Articulated", re.I)
-                    )
-                    if no_art_p.count():
-                        cc_course = "No Course Articulated"
+
+class AgreementCapture:
+    """
+    Records the agreement JSON the ASSIST SPA downloads, so the articulation
+    can be read from the payload instead of walking the rendered DOM.
+    Attach before navigating; responses are only decoded when rows() is called.
+    """
+
+    def __init__(self, page):
+        self.responses = []
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if AGREEMENT_API_PATTERN.search(response.url) and response.ok:
+            self.responses.append(response)
+
+    def rows(self, uc_name: str) -> List[MappingRow]:
+        # The most recent payload is the agreement currently on screen
+        for response in reversed(self.responses):
+            try:
+                rows = mappings_from_payload(response.json(), uc_name)
+            except Exception:
+                continue
+            if rows:
+                return rows
+        return []
+
+    def academic_year(self) -> Optional[str]:
+        for response in reversed(self.responses):
+            try:
+                year = payload_academic_year(response.json())
+            except Exception:
+                continue
+            if year:
+                return year
+        return None
+
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "template", "noscript", "head"}
+NO_ARTICULATION_RE = re.compile("No Course Articulated", re.I)
+LOOSE_BLOCKS_SELECTOR = "[data-testid*='Articulation'], .articulation, .MuiPaper-root, .card, .MuiTable-root"
+
+
+def inner_text(el) -> str:
+    """
+    Local stand-in for Playwright's inner_text(): block elements start new lines,
+    text runs have their whitespace collapsed, scripts/styles/comments are skipped.
+    """
+    parts: List[str] = []
+
+    def walk(node):
+        for child in node.children:
+            if isinstance(child, Comment):
+                continue
+            if isinstance(child, NavigableString):
+                parts.append(re.sub(r"\s+", " ", str(child)))
+            elif child.name in SKIP_TAGS:
+                continue
+            elif child.name == "br":
+                parts.append("\n")
+            elif child.name in BLOCK_TAGS:
+                parts.append("\n")
+                walk(child)
+                parts.append("\n")
+            else:
+                walk(child)
+
+    walk(el)
+    return "\n".join(nz(line) for line in "".join(parts).split("\n") if nz(line))
+
+
+def first_text(el, selector: str) -> str:
+    found = el.select_one(selector)
+    return nz(inner_text(found)) if found is not None else ""
+
+
+def parse_mappings_html(html: str, uc_name: str) -> List[MappingRow]:
+    """
+    Same strategies as the Playwright extractor in parse_mappings, but run over one
+    HTML snapshot (page.content() / frame.content()) with a local parser, so a
+    whole agreement costs a single round-trip to the browser.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    rows: List[MappingRow] = []
+
+    # ---------- 1) Preferred: explicit .articRow structure ----------
+    seen = set()
+    for r in soup.select(".articRow"):
+        recv = r.select_one(".rowReceiving")
+        if recv is None:
+            continue
+        uc_code = first_text(recv, ".prefixCourseNumber") or nz(inner_text(recv))
+        uc_title = first_text(recv, ".courseTitle")
+
+        send = r.select_one(".rowSending")
+        if send is None:
+            continue
+        if any(NO_ARTICULATION_RE.search(inner_text(p_el)) for p_el in send.find_all("p")):
+            cc_course = "No Course Articulated"
+        else:
+            cc_course = first_text(send, ".prefixCourseNumber") or nz(inner_text(send))
+
+        if not cc_course or not uc_code:
+            continue
+        key = (cc_course, uc_code)
+        if key in seen:
+            continue
+        seen.add(key)
+        rows.append(MappingRow(cc_course, uc_code, uc_title, uc_name))
+    if rows:
+        return rows
+
+    # ---------- 2) DataGrid-style (role=rowgroup/row/cell) fallback ----------
+    datarows = soup.select('[role="rowgroup"] [role="row"]')
+    for r in datarows[1 if len(datarows) > 1 else 0:]:
+        cells = r.select('[role="cell"]')
+        if len(cells) >= 2:
+            cc, uc = nz(inner_text(cells[0])), nz(inner_text(cells[1]))
+            note = nz(inner_text(cells[2])) if len(cells) >= 3 else ""
+            if cc and uc:
+                rows.append(MappingRow(cc, uc, note, uc_name))
+    if rows:
+        return rows
+
+    # ---------- 3) Classic <table><tr><td> fallback ----------
+    for t in soup.find_all("table"):
+        trs = t.find_all("tr")
+        for r in trs[1:]:  # skip header row
+            tds = r.find_all("td")
+            if len(tds) >= 2:
+                cc, uc = nz(inner_text(tds[0])), nz(inner_text(tds[1]))
+                note = nz(inner_text(tds[2])) if len(tds) >= 3 else ""
+                if cc and uc:
+                    rows.append(MappingRow(cc, uc, note, uc_name))
+    if rows:
+        return rows
+
+    # ---------- 4) Very loose text-based fallback ----------
+    for block in soup.select(LOOSE_BLOCKS_SELECTOR):
+        for line in inner_text(block).splitlines():
+            line = nz(line)
+            if "—" in line or " - " in line:
+                parts = re.split(r"[—-]+", line)
+                if len(parts) >= 2:
+                    cc, uc = nz(parts[0]), nz(parts[1])
+                    if len(cc) > 1 and len(uc) > 1:
+                        rows.append(MappingRow(cc, uc, "", uc_name))
+    return rows
+
+
+def parse_mappings_dom(frame, uc_name: str) -> List[MappingRow]:
+    """
+    Locator-based extractor: one Playwright round-trip per row and cell.
+    Kept as the fallback for frames whose HTML can't be snapshotted.
+    """
+    frame_rows: List[MappingRow] = []
+
+    # ---------- 1) Preferred: explicit .articRow structure ----------
+    try:
+        artic_rows = frame.locator(".articRow")
+        count = artic_rows.count()
+        if count:
+            seen = set()
+            for i in range(count):
+                r = artic_rows.nth(i)
+
+                # UC side (receiving)
+                recv = r.locator(".rowReceiving")
+                if not recv.count():
+                    continue
+
+                uc_code_el = recv.locator(".prefixCourseNumber").first
+                uc_code = nz(uc_code_el.inner_text()) if uc_code_el.count() else ""
+                if not uc_code:
+                    # fallback: use entire receiving text
+                    uc_code = nz(recv.inner_text())
+
+                uc_title_el = recv.locator(".courseTitle").first
+                uc_title = nz(uc_title_el.inner_text()) if uc_title_el.count() else ""
+
+                # CC side (sending)
+                send = r.locator(".rowSending")
+                if not send.count():
+                    continue
+
+                # If there's a 'No Course Articulated' <p>, that defines cc_course
+                no_art_p = send.locator("p").filter(
+                    has_text=re.compile("No Course Articulated", re.I)
+                )
+                if no_art_p.count():
+                    cc_course = "No Course Articulated"
+                else:
+                    # Otherwise try similar structure on CC side: prefixCourseNumber / text
+                    cc_code_el = send.locator(".prefixCourseNumber").first
+                    if cc_code_el.count():
+                        cc_course = nz(cc_code_el.inner_text())
                     else:
-                        # Otherwise try similar structure on CC side: prefixCourseNumber / text
-                        cc_code_el = send.locator(".prefixCourseNumber").first
-                        if cc_code_el.count():
-                            cc_course = nz(cc_code_el.inner_text())
-                        else:
-                            cc_course = nz(send.inner_text())
-
-                    if not cc_course or not uc_code:
-                        continue
-
-                    key = (cc_course, uc_code)
-                    if key in seen:
-                        continue
-                    seen.add(key)
-
-                    note = uc_title  # store UC title as note (optional)
-                    frame_rows.append(MappingRow(cc_course, uc_code, note, uc_name))
-
-                if frame_rows:
-                    return frame_rows
-        except Exception:
-            pass
+                        cc_course = nz(send.inner_text())
 
-        # ---------- 2) DataGrid-style (role=rowgroup/row/cell) fallback ----------
-        try:
-            rowgroup = frame.locator('[role="rowgroup"]')
-            if rowgroup.count():
-                datarows = rowgroup.locator('[role="row"]')
-                rc = datarows.count()
-                if rc:
-                    start_idx = 1 if rc > 1 else 0
-                    for i in range(start_idx, rc):
-                        r = datarows.nth(i)
-                        cells = r.locator('[role="cell"]')
-                        if cells.count() >= 2:
-                            cc = nz(cells.nth(0).inner_text())
-                            uc = nz(cells.nth(1).inner_text())
-                            note = nz(cells.nth(2).inner_text()) if cells.count() >= 3 else ""
-                            if cc and uc:
-                                frame_rows.append(MappingRow(cc, uc, note, uc_name))
-            if frame_rows:
-                return frame_rows
-        except Exception:
-            pass
+                if not cc_course or not uc_code:
+                    continue
+
+                key = (cc_course, uc_code)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                note = uc_title  # store UC title as note (optional)
+                frame_rows.append(MappingRow(cc_course, uc_code, note, uc_name))
 
-        # ---------- 3) Classic <table><tr><td> fallback ----------
-        try:
-            tables = frame.locator("table")
-            if tables.count():
-                for ti in range(tables.count()):
-                    t = tables.nth(ti)
-                    trs = t.locator("tr")
-                    if trs.count() < 2:
-                        continue
-                    for ri in range(1, trs.count()):  # skip header row
-                        r = trs.nth(ri)
-                        tds = r.locator("td")
-                        if tds.count() >= 2:
-                            cc = nz(tds.nth(0).inner_text())
-                            uc = nz(tds.nth(1).inner_text())
-                            note = nz(tds.nth(2).inner_text()) if tds.count() >= 3 else ""
-                            if cc and uc:
-                                frame_rows.append(MappingRow(cc, uc, note, uc_name))
             if frame_rows:
                 return frame_rows
-        except Exception:
-            pass
+    except Exception:
+        pass
+
+    # ---------- 2) DataGrid-style (role=rowgroup/row/cell) fallback ----------
+    try:
+        rowgroup = frame.locator('[role="rowgroup"]')
+        if rowgroup.count():
+            datarows = rowgroup.locator('[role="row"]')
+            rc = datarows.count()
+            if rc:
+                start_idx = 1 if rc > 1 else 0
+                for i in range(start_idx, rc):
+                    r = datarows.nth(i)
+                    cells = r.locator('[role="cell"]')
+                    if cells.count() >= 2:
+                        cc = nz(cells.nth(0).inner_text())
+                        uc = nz(cells.nth(1).inner_text())
+                        note = nz(cells.nth(2).inner_text()) if cells.count() >= 3 else ""
+                        if cc and uc:
+                            frame_rows.append(MappingRow(cc, uc, note, uc_name))
+        if frame_rows:
+            return frame_rows
+    except Exception:
+        pass
+
+    # ---------- 3) Classic <table><tr><td> fallback ----------
+    try:
+        tables = frame.locator("table")
+        if tables.count():
+            for ti in range(tables.count()):
+                t = tables.nth(ti)
+                trs = t.locator("tr")
+                if trs.count() < 2:
+                    continue
+                for ri in range(1, trs.count()):  # skip header row
+                    r = trs.nth(ri)
+                    tds = r.locator("td")
+                    if tds.count() >= 2:
+                        cc = nz(tds.nth(0).inner_text())
+                        uc = nz(tds.nth(1).inner_text())
+                        note = nz(tds.nth(2).inner_text()) if tds.count() >= 3 else ""
+                        if cc and uc:
+                            frame_rows.append(MappingRow(cc, uc, note, uc_name))
+        if frame_rows:
+            return frame_rows
+    except Exception:
+        pass
+
+    # ---------- 4) Very loose text-based fallback ----------
+    try:
+        blocks = frame.locator(
+            "[data-testid*='Articulation'], .articulation, .MuiPaper-root, .card, .MuiTable-root"
+        )
+        for i in range(blocks.count()):
+            text = blocks.nth(i).inner_text()
+            for line in text.splitlines():
+                line = nz(line)
+                if not line:
+                    continue
+                if "—" in line or " - " in line:
+                    parts = re.split(r"[—-]+", line)
+                    if len(parts) >= 2:
+                        cc, uc = nz(parts[0]), nz(parts[1])
+                        if len(cc) > 1 and len(uc) > 1:
+                            frame_rows.append(MappingRow(cc, uc, "", uc_name))
+    except Exception:
+        pass
+
+    return frame_rows
+
 
-        # ---------- 4) Very loose text-based fallback ----------
+def parse_mappings(page, uc_name: str, capture: AgreementCapture = None) -> List[MappingRow]:
+    """
+    Extract CC -> UC course mappings from the current agreement page.
+
+    If an AgreementCapture saw the agreement's JSON payload, rows come from it
+    directly; the DOM strategies below are only used when no payload was seen.
+
+    Primary strategy for ASSIST's 'articRow' structure:
+      <div class="articRow">
+        <div class="rowReceiving">   # UC side (prefixCourseNumber, title, units)
+        <div class="rowDirection">   # arrow
+        <div class="rowSending">     # CC side (course(s) or 'No Course Articulated')
+      </div>
+
+    Fallbacks: DataGrid/table/text heuristics if no .articRow found.
+
+    Each frame is snapshotted once and parsed locally with parse_mappings_html;
+    the locator-based extractor is only used if a frame's content can't be read.
+    """
+    if capture is not None:
+        rows = capture.rows(uc_name)
+        if rows:
+            return rows
+
+    def rows_from_frame(frame) -> List[MappingRow]:
         try:
-            blocks = frame.locator(
-                "[data-testid*='Articulation'], .articulation, .MuiPaper-root, .card, .MuiTable-root"
-            )
-            for i in range(blocks.count()):
-                text = blocks.nth(i).inner_text()
-                for line in text.splitlines():
-                    line = nz(line)
-                    if not line:
-                        continue
-                    if "—" in line or " - " in line:
-                        parts = re.split(r"[—-]+", line)
-                        if len(parts) >= 2:
-                            cc, uc = nz(parts[0]), nz(parts[1])
-                            if len(cc) > 1 and len(uc) > 1:
-                                frame_rows.append(MappingRow(cc, uc, "", uc_name))
+            html = frame.content()
         except Exception:
-            pass
-
-        return frame_rows
+            return parse_mappings_dom(frame, uc_name)
+        return parse_mappings_html(html, uc_name)
 
     # ---------- Try main page first ----------
-    rows = extract_from_frame(page)
+    rows = rows_from_frame(page)
     if rows:
         return rows
 
@@ -749,7 +1088,7 @@ def parse_mappings(page, uc_name: str) -> List[MappingRow]:
         if frame is page.main_frame:
             continue
         try:
-            frame_rows = extract_from_frame(frame)
+            frame_rows = rows_from_frame(frame)
             if frame_rows:
                 rows.extend(frame_rows)
         except Exception:
@@ -764,8 +1103,9 @@ def parse_mappings(page, uc_name: str) -> List[MappingRow]:
 # ------------------ high-level scraping ------------------ #
 
 def scrape_one_campus(page, cc_name: str, uc_name: str) -> pd.DataFrame:
+    capture = AgreementCapture(page)
     go_home(page)
-    select_academic_year(page)
+    selected_year = select_academic_year(page)
     select_cc_institution(page, cc_name)
     select_uc_institution(page, uc_name)
     click_view_agreements(page)
@@ -775,22 +1115,118 @@ def scrape_one_campus(page, cc_name: str, uc_name: str) -> pd.DataFrame:
     select_major_cs(page)
     open_major_agreement(page)
 
-    page.wait_for_timeout(1000)
-    data = parse_mappings(page, uc_name)
+    if not capture.responses:
+        wait_for_any(page, AGREEMENT_ROW_SELECTORS, "agreement: rows rendered")
+    if SHOW_TIMINGS:
+        log(f"[TIMING] {cc_name} -> {uc_name}\n{timer_for(page).format_report()}")
+    data = parse_mappings(page, uc_name, capture=capture)
     df = dataframe_from_rows(data)
 
+    # File the agreement under the year ASSIST actually served, not the calendar's guess
+    year = capture.academic_year() or selected_year
+    if year is None:
+        year = current_academic_year()
+        log(f"[WARN] {cc_name} -> {uc_name}: academic year not shown on the page, assuming {year}")
+    df.attrs["academic_year"] = year
+
     # 🔍 DEBUG: if no rows, dump the current page HTML for inspection
     if df.empty:
         html = page.content()
-        safe_campus = re.sub(r"[^A-Za-z0-9]+", "_", uc_name)
-        debug_file = f"debug_{safe_campus}.html"
+        # One file per CC/campus pair: pool workers and the crawler dump concurrently
+        safe_pair = re.sub(r"[^A-Za-z0-9]+", "_", f"{cc_name}__{uc_name}")
+        os.makedirs(DEBUG_DIR, exist_ok=True)
+        debug_file = os.path.join(DEBUG_DIR, f"debug_{safe_pair}.html")
         with open(debug_file, "w", encoding="utf-8") as f:
             f.write(html)
-        log(f"[DEBUG] {uc_name}: no rows parsed, wrote {debug_file}")
+        log(f"[DEBUG] {cc_name} -> {uc_name}: no rows parsed, wrote {debug_file}")
 
     return df
 
 
+def store_mappings(df: pd.DataFrame) -> List[dict]:
+    """Rows of a campus DataFrame in ArticulationStore form, with gap flags."""
+    columns = ["cc_course", "uc_course", "note", "no_articulation", "university_only"]
+    return annotate_flags(df)[columns].to_dict(orient="records")
+
+
+def dataframe_from_store(uc_name: str, mappings: List[dict]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "uc_campus": uc_name,
+                "cc_course": m["cc_course"],
+                "uc_course": m["uc_course"],
+                "note": m["note"],
+            }
+            for m in mappings
+        ],
+        columns=["uc_campus", "cc_course", "uc_course", "note"],
+    )
+
+
+def submit_campus(pool: BrowserPool, cc_name: str, uc_name: str, store: ArticulationStore = None) -> Future:
+    """
+    Future for one CC -> UC agreement. A fresh stored agreement resolves
+    immediately without touching the browser pool; otherwise the scrape runs
+    as a pool job and non-empty results are written back to the store.
+    """
+    if store is not None:
+        # The newest stored year stands in for the listed one until a scrape says otherwise
+        year = store.latest_year(cc_name, uc_name, MAJOR_EXACT)
+        mappings = store.get(cc_name, uc_name, MAJOR_EXACT, year) if year else None
+        if mappings is not None:
+            log(f"  [CACHE] {cc_name} -> {uc_name} ({year}): {len(mappings)} rows")
+            future = Future()
+            future.set_result(dataframe_from_store(uc_name, mappings))
+            return future
+
+    def job(page):
+        df = scrape_one_campus(page, cc_name, uc_name)
+        if store is not None and not df.empty:
+            store.put(cc_name, uc_name, MAJOR_EXACT, df.attrs["academic_year"], store_mappings(df))
+        return df
+
+    return pool.submit(job)
+
+
+def campus_csv_name(uc_name: str) -> str:
+    uc_slug = re.sub(r"[^A-Za-z0-9]+", "_", uc_name).lower()
+    return f"{uc_slug}.csv"
+
+
+def scrape_campuses(
+    pool: BrowserPool,
+    cc_name: str,
+    uc_names: List[str],
+    store: ArticulationStore = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Scrape every UC campus for one CC concurrently; each campus is its own
+    pool job (fresh browser context), so wall time is roughly that of the
+    slowest campus when the pool has a worker per campus.
+    Failed campuses are logged and left out of the result.
+    Agreements already in the store are served from it without scraping.
+    """
+    futures = {}
+    for uc_name in uc_names:
+        log(f"Scraping {uc_name} …")
+        futures[uc_name] = submit_campus(pool, cc_name, uc_name, store)
+
+    results: Dict[str, pd.DataFrame] = {}
+    for uc_name, future in futures.items():
+        try:
+            df = future.result()
+        except (PWTimeout, PWError, RuntimeError) as e:
+            log(f"[ERROR] {uc_name}: {e}")
+            continue
+        log(f"[OK] {uc_name}: {len(df)} rows")
+        campus_csv = campus_csv_name(uc_name)
+        df.to_csv(campus_csv, index=False)
+        log(f"Saved {campus_csv}")
+        results[uc_name] = df
+    return results
+
+
 
 
 def compute_overlap(dfs: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -798,99 +1234,109 @@ def compute_overlap(dfs: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     Intersection of CC courses across all campuses, ignoring 'No Course Articulated'.
     This is the core of the student's plan at their home CC.
     """
+    empty = pd.DataFrame(columns=["cc_course", "campus_count"])
     if not dfs:
-        return pd.DataFrame(columns=["cc_course", "campus_count"])
-
-    sets = []
-    for campus, df in dfs.items():
-        if df.empty or "cc_course" not in df.columns:
-            return pd.DataFrame(columns=["cc_course", "campus_count"])
-        cc_set = {
-            c
-            for c in df["cc_course"].tolist()
-            if not is_no_articulation(c)
-        }
-        sets.append(cc_set)
-
-    common = set.intersection(*sets) if sets else set()
+        return empty
+    if any(df.empty or "cc_course" not in df.columns for df in dfs.values()):
+        return empty
+
+    rows = pd.concat(
+        [annotate_flags(df[["cc_course"]]).assign(campus=campus) for campus, df in dfs.items()],
+        ignore_index=True,
+    )
+    rows = rows[~rows["no_articulation"]]
+    campuses = rows.groupby("cc_course")["campus"].nunique()
+    common = campuses[campuses == len(dfs)].index
+
     return pd.DataFrame(
-        sorted(
-            [{"cc_course": c, "campus_count": len(dfs)} for c in common],
-            key=lambda x: x["cc_course"],
-        )
+        {"cc_course": sorted(common), "campus_count": len(dfs)},
+        columns=["cc_course", "campus_count"],
     )
 
 def find_missing_and_alternatives(
-    page,
+    pool: BrowserPool,
     home_cc_name: str,
     dfs: Dict[str, pd.DataFrame],
     alt_cc_list: List[str],
+    store: ArticulationStore = None,
 ) -> pd.DataFrame:
     """
     For each UC campus, find rows where the home CC shows 'No Course Articulated'.
     For each such UC course, search alt_cc_list and return ONLY the first CC
     that provides an articulation.
 
+    The search runs in three phases: collect every gap, scrape each distinct
+    (alt_cc, uc) pair once as a parallel pool job, then resolve the gaps
+    against the finished results in alt_cc_list order.
+
     Returns a DataFrame with columns:
       uc_campus, required_uc_course, home_cc, alt_cc, alt_cc_course
     """
-    results = []
-    cache: Dict[tuple, pd.DataFrame] = {}
-
-    for uc_name, df in dfs.items():
-        if df.empty:
+    alt_ccs = [
+        alt_cc for alt_cc in alt_cc_list
+        if alt_cc.strip().lower() != home_cc_name.strip().lower()  # skip student's own CC
+    ]
+
+    columns = ["uc_campus", "required_uc_course", "home_cc", "alt_cc", "alt_cc_course"]
+
+    # ---------- 1) Collect gaps where home CC has no articulation ----------
+    home = [
+        annotate_flags(df).assign(uc_campus=uc_name)
+        for uc_name, df in dfs.items()
+        if not df.empty
+    ]
+    if not home:
+        return pd.DataFrame(columns=columns)
+    home = pd.concat(home, ignore_index=True)
+    uc_missing = (home["uc_course"].fillna("") == "") | home["uc_course"].astype("string").str.contains(
+        NO_ARTICULATION_PATTERN, na=False
+    )
+    gaps = home.loc[home["no_articulation"] & ~uc_missing, ["uc_campus", "uc_course"]]
+    gaps = gaps.assign(gap=range(len(gaps)))
+
+    # ---------- 2) Scrape each distinct (alt_cc, uc) pair in parallel ----------
+    futures = {}
+    for uc_name in gaps["uc_campus"].unique():
+        for alt_cc in alt_ccs:
+            log(f"  [SEARCH] {alt_cc} for {uc_name} …")
+            futures[(alt_cc, uc_name)] = submit_campus(pool, alt_cc, uc_name, store)
+
+    alt_frames = []
+    for (alt_cc, uc_name), future in futures.items():
+        try:
+            alt_df = future.result()
+        except Exception as e:
+            log(f"    [SKIP] {alt_cc} for {uc_name}: {e}")
             continue
+        if alt_df.empty:
+            continue
+        alt_frames.append(
+            annotate_flags(alt_df[["cc_course", "uc_course"]]).assign(
+                uc_campus=uc_name, alt_cc=alt_cc, alt_rank=alt_ccs.index(alt_cc)
+            )
+        )
+    if not alt_frames or gaps.empty:
+        return pd.DataFrame(columns=columns)
+
+    # ---------- 3) Resolve each gap to the FIRST valid alternative ----------
+    # First articulated row per (alt CC, campus, UC course), then the lowest-ranked alt CC per gap
+    alts = pd.concat(alt_frames, ignore_index=True)
+    alts = alts[~alts["no_articulation"]].drop_duplicates(["alt_cc", "uc_campus", "uc_course"])
+    matches = gaps.merge(alts, on=["uc_campus", "uc_course"], how="inner")
+    matches = matches.sort_values(["gap", "alt_rank"]).drop_duplicates("gap")
+
+    results = pd.DataFrame(
+        {
+            "uc_campus": matches["uc_campus"],
+            "required_uc_course": matches["uc_course"],
+            "home_cc": home_cc_name,
+            "alt_cc": matches["alt_cc"],
+            "alt_cc_course": matches["cc_course"],
+        },
+        columns=columns,
+    )
+    return results.reset_index(drop=True)
 
-        for _, row in df.iterrows():
-            cc_course = row["cc_course"]
-            uc_course = row["uc_course"]
-
-            # Only examine gaps where home CC has no articulation
-            if not is_no_articulation(cc_course):
-                continue
-            if not uc_course or is_no_articulation(uc_course):
-                continue
-
-            # Search alt CCs until we find the first valid alternative
-            for alt_cc in alt_cc_list:
-                if alt_cc.strip().lower() == home_cc_name.strip().lower():
-                    continue  # skip student's own CC
-
-                key = (alt_cc, uc_name)
-                if key not in cache:
-                    try:
-                        log(f"  [SEARCH] {alt_cc} for {uc_name} (to cover {uc_course}) …")
-                        alt_df = scrape_one_campus(page, alt_cc, uc_name)
-                    except Exception as e:
-                        log(f"    [SKIP] {alt_cc} for {uc_name}: {e}")
-                        alt_df = pd.DataFrame()
-                    cache[key] = alt_df
-
-                alt_df = cache[key]
-                if alt_df.empty:
-                    continue
-
-                # Find any row where this UC course is articulated
-                matches = alt_df[
-                    (alt_df["uc_course"] == uc_course)
-                    & (~alt_df["cc_course"].apply(is_no_articulation))
-                ]
-
-                if not matches.empty:
-                    m = matches.iloc[0]   # ✅ FIRST valid alternative only
-                    results.append(
-                        {
-                            "uc_campus": uc_name,
-                            "required_uc_course": uc_course,
-                            "home_cc": home_cc_name,
-                            "alt_cc": alt_cc,
-                            "alt_cc_course": m["cc_course"],
-                        }
-                    )
-                    break  # ✅ stop searching alt CCs after first valid hit
-
-    return pd.DataFrame(results)
-    
 
 
 
@@ -901,7 +1347,7 @@ def find_missing_and_alternatives(
 
 def main():
     ap = argparse.ArgumentParser(
-        description="ASSIST CS articulation scraper for a single UC campus."
+        description="ASSIST CS articulation scraper for one or more UC campuses."
     )
     ap.add_argument(
         "--cc",
@@ -910,54 +1356,87 @@ def main():
     )
     ap.add_argument(
         "--uc",
-        required=True,
-        help="Target UC campus, e.g. 'UC Berkeley' or 'University of California, Berkeley'",
+        action="append",
+        default=[],
+        help="Target UC campus, e.g. 'UC Berkeley' or 'University of California, Berkeley'. "
+             "Repeat for several campuses.",
+    )
+    ap.add_argument(
+        "--all-uc",
+        action="store_true",
+        help="Scrape every campus in UC_TARGETS.",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Browsers scraping in parallel, for campuses and the alt-CC gap search.",
+    )
+    ap.add_argument(
+        "--db",
+        default=None,
+        help="Articulation store (SQLite) to reuse scraped agreements from.",
+    )
+    ap.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore stored agreements and scrape again (results are still saved).",
+    )
+    ap.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not read or write the articulation store.",
+    )
+    ap.add_argument(
+        "--base-url",
+        default=None,
+        help="ASSIST site to scrape instead of https://assist.org (e.g. a local assist_stub).",
     )
     ap.add_argument(
         "--visible",
         action="store_true",
         help="Run with visible browser window (for debugging).",
     )
+    ap.add_argument(
+        "--timings",
+        action="store_true",
+        help="Log how long each scrape step spent waiting.",
+    )
     args = ap.parse_args()
 
-    home_cc = args.cc
-    uc_input = normalize_uc_name(args.uc)
-
-    # Use a slug for the campus CSV filename
-    uc_slug = re.sub(r"[^A-Za-z0-9]+", "_", uc_input).lower()
-    campus_csv = f"{uc_slug}.csv"
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=(not args.visible),
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        context = browser.new_context()
-        page = context.new_page()
-
-        results: Dict[str, pd.DataFrame] = {}
+    global SHOW_TIMINGS, ASSIST_URL
+    SHOW_TIMINGS = args.timings
+    if args.base_url:
+        ASSIST_URL = args.base_url.rstrip("/") + "/"
 
-        # ------------------ 1) SCRAPE MAIN CAMPUS ------------------ #
-        try:
-            log(f"Scraping {uc_input} …")
-            df = scrape_one_campus(page, home_cc, uc_input)
-            log(f"[OK] {uc_input}: {len(df)} rows")
-            df.to_csv(campus_csv, index=False)
-            log(f"Saved {campus_csv}")
-            results[uc_input] = df
-        except (PWTimeout, PWError, RuntimeError) as e:
-            log(f"[ERROR] {uc_input}: {e}")
-            df = pd.DataFrame()
+    home_cc = args.cc
+    uc_targets = [normalize_uc_name(uc) for uc in args.uc]
+    if args.all_uc:
+        uc_targets += [name for name, _ in UC_TARGETS]
+    uc_targets = list(dict.fromkeys(uc_targets))
+    if not uc_targets:
+        ap.error("pass --uc at least once, or --all-uc")
+
+    store = None
+    if not args.no_store:
+        store = ArticulationStore(args.db) if args.db else ArticulationStore()
+        if args.refresh:
+            # Treat every stored agreement as stale; fresh scrapes overwrite them
+            store.max_age = -1
+
+    with BrowserPool(
+        size=args.workers,
+        headless=(not args.visible),
+        launch_args=["--disable-blink-features=AutomationControlled"],
+        default_timeout=30000,
+    ) as pool:
+        # ------------------ 1) SCRAPE CAMPUSES ------------------ #
+        results = scrape_campuses(pool, home_cc, uc_targets, store)
 
         # ------------------ 2) COMPUTE OVERLAP ------------------ #
-        if not df.empty:
-            overlap_df = df[
-                (~df["cc_course"].apply(is_no_articulation))
-                & (~df["cc_course"].apply(is_university_only))
-            ].copy()
-            overlap_courses = sorted(overlap_df["cc_course"].unique().tolist())
-        else:
-            overlap_courses = []
+        # CC courses that articulate to every scraped campus
+        overlap_df = annotate_flags(compute_overlap(results))
+        overlap_courses = overlap_df.loc[~overlap_df["university_only"], "cc_course"].tolist()
 
         # ------------------ 3) SET ALT CC LIST ------------------ #
         alt_cc_list = [
@@ -968,10 +1447,10 @@ def main():
 
         # ------------------ 4) FIND ALTERNATIVES ------------------ #
         no_course_alts = []
-        if results and uc_input in results:
+        if results:
             try:
                 missing_df = find_missing_and_alternatives(
-                    page, home_cc, results, alt_cc_list
+                    pool, home_cc, results, alt_cc_list, store
                 )
                 if not missing_df.empty:
                     missing_df.to_csv(
@@ -986,18 +1465,15 @@ def main():
             except Exception as e:
                 log(f"[ERROR] while finding alternatives: {e}")
 
-        context.close()
-        browser.close()
-
     # ------------------ 5) BUILD FINAL JSON ------------------ #
-    if not df.empty:
-        articulations_json = {uc_input: df.to_dict(orient="records")}
-    else:
-        articulations_json = {uc_input: []}
+    articulations_json = {
+        uc: results[uc].to_dict(orient="records") if uc in results else []
+        for uc in uc_targets
+    }
 
     student_plan = {
         "current_school": home_cc,
-        "to_school": uc_input,
+        "to_school": uc_targets[0] if len(uc_targets) == 1 else uc_targets,
         "articulations": articulations_json,
         "overlap_courses": overlap_courses,
         "no_course_articulated_alternatives": no_course_alts,